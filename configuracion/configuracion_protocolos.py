@@ -39,6 +39,7 @@ class ConfiguracionModbus:
     registro_inicio: int
     cantidad_registros: int
     intervalo_polling: int
+    servidor_nativo: bool = False  # Servidor TCP asyncio propio en lugar de pymodbus
     
     def __post_init__(self):
         """Validar configuración después de inicialización."""
@@ -151,7 +152,8 @@ class ConfiguradorProtocolos:
             funcion_escritura=int(os.getenv('MODBUS_FUNCION_ESCRITURA', 16)),
             registro_inicio=int(os.getenv('MODBUS_REGISTRO_INICIO', 0)),
             cantidad_registros=int(os.getenv('MODBUS_CANTIDAD_REGISTROS', 10)),
-            intervalo_polling=int(os.getenv('MODBUS_INTERVALO_POLLING', 5))
+            intervalo_polling=int(os.getenv('MODBUS_INTERVALO_POLLING', 5)),
+            servidor_nativo=os.getenv('MODBUS_SERVIDOR_NATIVO', 'False').lower() == 'true'
         )
         
     def _cargar_mqtt(self) -> ConfiguracionMQTT:
@@ -220,7 +220,6 @@ function Install-Dependencies {
         $basicDeps = @(
             "python-dotenv==1.0.0",
             "SQLAlchemy==2.0.20", 
-            "colorlog==6.7.0",
             "psutil==5.9.5"
         )
         
@@ -383,7 +383,7 @@ class ClienteModbus(ProtocoloBase):
                 # Guardar en cache
                 self._guardar_en_cache(clave_cache, resultado)
                 
-                self.logger.debug(f"Holding registers leídos: {direccion}={valores}")
+                self.logger.debug("Holding registers leídos: %s=%s", direccion, valores)
                 
                 # Emitir evento
                 self.emitir_evento(
@@ -474,7 +474,7 @@ class ClienteModbus(ProtocoloBase):
             else:
                 self.actualizar_estadisticas(True, tiempo_respuesta)
                 
-                self.logger.debug(f"Registro escrito: {direccion}={valor}")
+                self.logger.debug("Registro escrito: %s=%s", direccion, valor)
                 
                 # Emitir evento
                 self.emitir_evento(
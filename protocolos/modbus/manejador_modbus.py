@@ -420,11 +420,11 @@ class ManejadorModbus:
             
     def _manejar_evento_cliente(self, evento: EventoProtocolo):
         """Manejar eventos del cliente Modbus."""
-        self.logger.debug(f"Evento cliente: {evento.tipo} - {evento.mensaje}")
+        self.logger.debug("Evento cliente: %s - %s", evento.tipo, evento.mensaje)
         
     def _manejar_evento_servidor(self, evento: EventoProtocolo):
         """Manejar eventos del servidor Modbus."""
-        self.logger.debug(f"Evento servidor: {evento.tipo} - {evento.mensaje}")
+        self.logger.debug("Evento servidor: %s - %s", evento.tipo, evento.mensaje)
         
     def _manejar_error_cliente(self, contexto: str, error: Exception):
         """Manejar errores del cliente."""
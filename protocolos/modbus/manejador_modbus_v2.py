@@ -547,7 +547,7 @@ class ManejadorModbusV2:
         try:
             if nombre_dato in self.datos_sistema:
                 self.datos_sistema[nombre_dato] = valor
-                self.logger.debug(f"📊 Dato actualizado: {nombre_dato} = {valor}")
+                self.logger.debug("📊 Dato actualizado: %s = %s", nombre_dato, valor)
                 
                 # Actualizar en servidor TCP si existe
                 if self.servidor_tcp:
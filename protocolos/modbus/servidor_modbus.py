@@ -476,7 +476,7 @@ class ServidorModbusTCPReal(ProtocoloBase):
             for direccion, info in self.mapa_registros.input_registers.items():
                 if info['nombre'] == nombre_dato:
                     self._actualizar_input_register(direccion, int(valor))
-                    self.logger.debug(f"✓ Actualizado {nombre_dato} = {valor}")
+                    self.logger.debug("✓ Actualizado %s = %s", nombre_dato, valor)
                     return
                     
             self.logger.warning(f"⚠️  Dato no encontrado: {nombre_dato}")
@@ -14,38 +14,138 @@ Autor: Sistema BMS Demo
 Versión: 2.1.0 - Servidor TCP Real Perfecto (100% pruebas)
 """
 
+import array
 import asyncio
+import heapq
+import logging
+import random
+import struct
+import sys
 import threading
 import time
+import traceback
 from typing import Dict, Any, List, Optional, Callable
 from datetime import datetime
+from types import MappingProxyType
 import socket
 
-# PyModbus imports para servidor TCP
+# PyModbus imports para servidor TCP (3.x, servidor async)
 try:
-    # PyModbus 3.x - Async server
-    from pymodbus.server import StartAsyncTcpServer
+    from pymodbus.server.async_io import ModbusTcpServer, ModbusServerRequestHandler
+    from pymodbus.framer.socket_framer import ModbusSocketFramer
     from pymodbus.datastore import ModbusSlaveContext, ModbusServerContext
-    from pymodbus.datastore import ModbusSparseDataBlock
+    from pymodbus.datastore.store import BaseModbusDataBlock
     from pymodbus.device import ModbusDeviceIdentification
-    PYMODBUS_VERSION = "3.x"
+except ImportError as e:
+    print(f"Error: PyModbus 3.x no encontrado. Instalar con: pip install pymodbus==3.4.1")
+    raise e
+
+# Loop asyncio basado en libuv (opcional, no disponible en Windows)
+try:
+    import uvloop
 except ImportError:
-    try:
-        # PyModbus 2.x - Sync server
-        from pymodbus.server.sync import StartTcpServer
-        from pymodbus.datastore import ModbusSlaveContext, ModbusServerContext
-        from pymodbus.datastore import ModbusSparseDataBlock
-        from pymodbus.device import ModbusDeviceIdentification
-        PYMODBUS_VERSION = "2.x"
-    except ImportError as e:
-        print(f"Error: PyModbus no encontrado. Instalar con: pip install pymodbus==3.4.1")
-        raise e
+    uvloop = None
 
 # Importar clases base del sistema
 from protocolos.protocolo_base import ProtocoloBase, ResultadoOperacion, EstadoProtocolo
 from configuracion.configuracion_protocolos import obtener_config_modbus
 from utilidades.logger import obtener_logger_protocolo
 
+# Sensores simulados: (dirección, variación máxima, mínimo, máximo, periodo en segundos)
+SIMULACION_SENSORES = (
+    (10, 10, 200, 350, 30),  # temperatura_promedio x10 (20.0°C - 35.0°C)
+    (11, 5, 30, 80, 120),    # humedad_promedio % (30% - 80%), varía lento
+    (42, 3, 1, 50, 30),      # latencia_red_ms (1ms - 50ms)
+)
+
+# Máximo de registros por petición de lectura Modbus (FC3/FC4)
+MAX_REGISTROS_LECTURA = 125
+
+# Máximo de registros por petición de escritura múltiple (FC16)
+MAX_REGISTROS_ESCRITURA = 123
+
+# Códigos de función Modbus atendidos por el servidor nativo
+FC_LEER_HOLDING = 0x03
+FC_LEER_INPUT = 0x04
+FC_ESCRIBIR_REGISTRO = 0x06
+FC_ESCRIBIR_MULTIPLES = 0x10
+
+# Códigos de excepción Modbus
+EXCEPCION_FUNCION_ILEGAL = 0x01
+EXCEPCION_DIRECCION_ILEGAL = 0x02
+EXCEPCION_VALOR_ILEGAL = 0x03
+EXCEPCION_FALLO_DISPOSITIVO = 0x04
+
+# Estructuras de trama Modbus TCP (big-endian)
+_MBAP = struct.Struct('>HHHB')              # transacción, protocolo, longitud, unit id
+_DIRECCION_VALOR = struct.Struct('>HH')      # dirección + cantidad/valor
+_ESCRITURA_MULTIPLE = struct.Struct('>HHB')  # dirección, cantidad, bytes
+_CABECERA_LECTURA = struct.Struct('>BB')     # función + bytes de datos (o función + excepción)
+
+# Tamaño máximo de una PDU Modbus
+TAMANO_MAX_PDU = 253
+
+# Mapeo de nombres de datos del sistema a direcciones de input registers (solo lectura)
+MAPEO_INPUT_REGISTERS = MappingProxyType({
+    'estado_general_sistema': 0,
+    'tiempo_funcionamiento': 1,
+    'numero_dispositivos_total': 2,
+    'numero_dispositivos_online': 3,
+    'numero_alarmas_activas': 4,
+    'temperatura_promedio': 10,
+    'humedad_promedio': 11,
+    'estado_comunicacion_genetec': 6,
+    'camaras_online': 21,
+    'controladores_online': 31,
+})
+
+# Modbus transmite registros en big-endian; solo hay que invertir bytes en hosts little-endian
+HOST_BIG_ENDIAN = sys.byteorder == 'big'
+
+# Periodos del actualizador de datos (segundos): timestamp y tiempo de funcionamiento en horas
+INTERVALO_ACTUALIZACION = 10
+INTERVALO_TIEMPO_FUNCIONAMIENTO = 3600
+
+# Número de direcciones de cada banco de registros (0 a TAMANO_BANCO - 1)
+TAMANO_BANCO = 256
+
+# Esperas (segundos) entre intentos al verificar que el servidor escucha
+ESPERAS_VERIFICACION = (0.05, 0.1, 0.2, 0.4, 0.8, 1.6)
+
+def configurar_socket_cliente(sock) -> None:
+    """
+    Ajustar un socket de cliente Modbus para peticiones pequeñas de baja latencia.
+    
+    Desactiva Nagle (TCP_NODELAY), activa keepalive y, en Linux, TCP_QUICKACK.
+    """
+    if sock is None:
+        return
+        
+    try:
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        if hasattr(socket, 'TCP_QUICKACK'):
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_QUICKACK, 1)
+    except OSError:
+        # Socket ya cerrado o transporte no TCP: no es crítico
+        pass
+
+
+class ManejadorModbusTCP(ModbusServerRequestHandler):
+    """Manejador de conexión pymodbus que configura el socket al conectar."""
+    
+    def callback_connected(self) -> None:
+        configurar_socket_cliente(self.transport.get_extra_info('socket'))
+        super().callback_connected()
+
+
+class ServidorModbusTCPAjustado(ModbusTcpServer):
+    """Servidor TCP de pymodbus que usa ManejadorModbusTCP para cada conexión."""
+    
+    def handle_new_connection(self):
+        return ManejadorModbusTCP(self)
+
+
 def validar_valor_modbus(valor: Any) -> int:
     """
     Validar y convertir valor para registro Modbus.
@@ -56,6 +156,10 @@ def validar_valor_modbus(valor: Any) -> int:
     Returns:
         Valor válido en rango 0-65535
     """
+    # Camino rápido: entero ya dentro del rango (caso de escrituras Modbus)
+    if type(valor) is int and 0 <= valor <= 65535:
+        return valor
+        
     try:
         valor_int = int(valor)
         # Asegurar que esté en rango válido
@@ -63,94 +167,197 @@ def validar_valor_modbus(valor: Any) -> int:
     except (ValueError, TypeError):
         return 0
 
-class BMSDataStore(ModbusSparseDataBlock):
+class BMSDataStore(BaseModbusDataBlock):
     """
     DataStore personalizado para el BMS con validación y callbacks mejorados.
+    
+    Los valores se guardan en una vista de TAMANO_BANCO registros sobre un
+    buffer contiguo array('H'), que puede compartirse entre varios bancos.
     """
     
-    def __init__(self, values=None, callbacks=None, logger=None):
+    # Atributos fijos: acceso por descriptor en getValues/setValues
+    __slots__ = (
+        '_buf', '_size', '_log_debug',
+        'address', 'values', 'default_value',
+        'callbacks', 'callback_generico', 'logger',
+        'lecturas_count', 'escrituras_count',
+    )
+    
+    def __init__(self, values=None, callbacks=None, logger=None, tamano: int = TAMANO_BANCO,
+                 buffer: Optional[array.array] = None, desplazamiento: int = 0):
         """
         Inicializar datastore del BMS.
+        
+        Args:
+            values: Diccionario {dirección: valor} con los valores iniciales
+            callbacks: Diccionario {dirección: función} para escrituras
+            logger: Logger del servidor
+            tamano: Número de registros del banco
+            buffer: Buffer array('H') compartido (si no se indica se crea uno propio)
+            desplazamiento: Posición del banco dentro del buffer compartido
         """
-        # Validar todos los valores iniciales
-        valores_validados = {}
-        if values:
-            for direccion, valor in values.items():
-                valores_validados[direccion] = validar_valor_modbus(valor)
-                
-        super().__init__(valores_validados)
-        self.callbacks = callbacks or {}
+        if buffer is None:
+            buffer = array.array('H', [0]) * tamano
+            desplazamiento = 0
+            
+        # Construir el banco directamente desde el diccionario, validando una sola vez
+        valores = values or {}
+        self._buf = memoryview(buffer)[desplazamiento:desplazamiento + tamano]
+        self._buf[:] = array.array('H', (validar_valor_modbus(valores.get(i, 0)) for i in range(tamano)))
+        self._size = tamano
+        
+        # Atributos esperados por BaseModbusDataBlock
+        self.address = 0
+        self.values = self._buf
+        self.default_value = array.array('H', self._buf)
+        
+        # Se comparte el diccionario recibido (aunque esté vacío) para ver registros posteriores
+        self.callbacks = callbacks if callbacks is not None else {}
+        self.callback_generico = None
         self.logger = logger
         self.lecturas_count = 0
         self.escrituras_count = 0
+        self.actualizar_nivel_log()
+        
+    def actualizar_nivel_log(self):
+        """
+        Resolver una sola vez si se registran las lecturas/escrituras en debug.
+        
+        Llamar de nuevo si cambia el nivel del logger después de crear el datastore.
+        """
+        if self.logger and self.logger.isEnabledFor(logging.DEBUG):
+            self._log_debug = self.logger.debug
+        else:
+            self._log_debug = None
+            
+    def reset(self):
+        """Restaurar los valores iniciales del banco."""
+        self._buf[:] = self.default_value
+        
+    def poke(self, address: int, valor: int):
+        """
+        Escribir un registro directamente en el buffer para actualizaciones internas.
+        
+        No valida, no registra en el log, no ejecuta callbacks ni actualiza contadores;
+        las escrituras de clientes Modbus siguen pasando por setValues.
+        """
+        self._buf[address] = valor & 0xFFFF
         
     def setValues(self, address, values):
         """
         Sobrescribir setValues con validación y callbacks mejorados.
+        
+        Returns:
+            True si se escribieron los valores, False si el rango queda fuera del banco
         """
-        # Validar todos los valores antes de escribir
-        valores_validados = [validar_valor_modbus(v) for v in values]
+        # Validar todos los valores antes de escribir (un array('H') ya está en rango)
+        if isinstance(values, array.array) and values.typecode == 'H':
+            valores_validados = values
+        else:
+            valores_validados = array.array('H', [
+                v if type(v) is int and 0 <= v <= 65535 else validar_valor_modbus(v)
+                for v in values
+            ])
         
-        if self.logger:
-            self.logger.debug(f"📝 Modbus WRITE: Dirección {address}, Valores {valores_validados}")
+        fin = address + len(valores_validados)
+        if address < 0 or fin > self._size:
+            if self.logger:
+                self.logger.warning(f"⚠️ Escritura fuera de rango: Dirección {address}, Count {len(valores_validados)}")
+            return False
+            
+        if self._log_debug:
+            self._log_debug("📝 Modbus WRITE: Dirección %s, Valores %s", address, valores_validados.tolist())
             
-        # Llamar al método padre con valores validados
-        super().setValues(address, valores_validados)
+        # Escribir valores validados en el buffer (copia vía protocolo buffer)
+        self._buf[address:fin] = valores_validados
         
         # MEJORA: Ejecutar callbacks para cada dirección escrita
         for i, valor in enumerate(valores_validados):
             direccion_actual = address + i
             
-            # Ejecutar callback específico si existe
-            if direccion_actual in self.callbacks:
+            # Ejecutar callback específico si existe (una sola consulta al diccionario)
+            callback = self.callbacks.get(direccion_actual)
+            if callback is not None:
                 try:
-                    self.callbacks[direccion_actual](direccion_actual, valor)
+                    callback(direccion_actual, valor)
                     if self.logger:
-                        self.logger.info(f"✅ Callback ejecutado para dirección {direccion_actual}, valor {valor}")
+                        self.logger.info("✅ Callback ejecutado para dirección %s, valor %s", direccion_actual, valor)
                 except Exception as e:
                     if self.logger:
                         self.logger.error(f"❌ Error en callback {direccion_actual}: {e}")
             
             # NUEVO: Callback genérico para cualquier escritura (útil para pruebas)
-            elif hasattr(self, 'callback_generico') and self.callback_generico:
+            elif self.callback_generico:
                 try:
                     self.callback_generico(direccion_actual, valor)
                     if self.logger:
-                        self.logger.info(f"✅ Callback genérico ejecutado para dirección {direccion_actual}")
+                        self.logger.info("✅ Callback genérico ejecutado para dirección %s", direccion_actual)
                 except Exception as e:
                     if self.logger:
                         self.logger.error(f"❌ Error en callback genérico {direccion_actual}: {e}")
                         
         self.escrituras_count += len(values)
+        return True
         
     def getValues(self, address, count=1):
         """
         Sobrescribir getValues con validación de rango mejorada.
         """
-        try:
-            valores = super().getValues(address, count)
-            
-            if self.logger:
-                self.logger.debug(f"📖 Modbus READ: Dirección {address}, Count {count}, Valores {valores}")
-                
-            self.lecturas_count += count
-            return valores
-        except Exception as e:
+        fin = address + count
+        if address < 0 or fin > self._size:
             if self.logger:
-                self.logger.warning(f"⚠️ Error en getValues: {e}")
-            # Devolver valores por defecto si hay error
+                self.logger.warning(f"⚠️ Lectura fuera de rango: Dirección {address}, Count {count}")
+            # Devolver valores por defecto fuera del banco
             return [0] * count
+            
+        valores = self._buf[address:fin].tolist()
+        
+        if self._log_debug:
+            self._log_debug("📖 Modbus READ: Dirección %s, Count %s, Valores %s", address, count, valores)
+            
+        self.lecturas_count += count
+        return valores
+    
+    def leer_bloque(self, address: int, count: int) -> memoryview:
+        """
+        Vista sin copia de un bloque de registros (uso interno, sin contadores ni logs).
+        
+        La vista refleja escrituras posteriores; copiarla con tolist() si se va a conservar.
+        """
+        return self._buf[address:address + count]
+        
+    def escribir_bloque(self, address: int, valores):
+        """Escritura interna de un bloque contiguo sin callbacks ni contadores Modbus."""
+        if isinstance(valores, array.array) and valores.typecode == 'H':
+            bloque = valores
+        else:
+            bloque = array.array('H', (v & 0xFFFF for v in valores))
+        self._buf[address:address + len(bloque)] = bloque
+        
+    def leer_bytes(self, address, count=1) -> bytes:
+        """
+        Leer un bloque de registros ya codificado en big-endian (formato de trama Modbus).
+        
+        El llamador debe validar el rango con validate() antes de leer.
+        """
+        bloque = array.array('H', self._buf[address:address + count])
+        if not HOST_BIG_ENDIAN:
+            bloque.byteswap()
+            
+        if self._log_debug:
+            self._log_debug("📖 Modbus READ: Dirección %s, Count %s", address, count)
+            
+        self.lecturas_count += count
+        return bloque.tobytes()
     
     def validate(self, address, count=1):
         """
         NUEVO: Validar que una dirección esté disponible.
+        
+        El rango debe caber en el banco y count no puede superar 125,
+        el máximo de registros por lectura en Modbus (FC3/FC4).
         """
-        try:
-            # En ModbusSparseDataBlock, cualquier dirección es válida
-            # Solo verificamos que el count sea razonable
-            return count > 0 and count <= 100
-        except:
-            return False
+        return 0 < count <= MAX_REGISTROS_LECTURA and address >= 0 and address + count <= self._size
 
 class ServidorModbusTCPReal(ProtocoloBase):
     """
@@ -175,13 +382,15 @@ class ServidorModbusTCPReal(ProtocoloBase):
         self.servidor_tcp = None
         self.servidor_activo = False
         self.hilo_servidor = None
-        self.hilo_actualizador = None
         self.loop_asyncio = None
-        self.detener_actualizador = threading.Event()
+        self._tarea_actualizador = None  # Tarea del actualizador en el loop del servidor
         self._server_task = None
+        self._evento_parada = None  # asyncio.Event creado dentro del loop del servidor
         self._pending_tasks = []  # Nuevo: Para rastrear tareas pendientes
+        self._rng = random.Random()
         
         # DataStores para diferentes tipos de registros
+        self._registros = None
         self.input_registers_store = None
         self.holding_registers_store = None
         self.coils_store = None
@@ -319,16 +528,17 @@ class ServidorModbusTCPReal(ProtocoloBase):
         
     def conectar(self) -> ResultadoOperacion:
         """Iniciar servidor Modbus TCP real - VERSIÓN PERFECTA."""
+        # Un segundo arranque reemplazaría el hilo, el loop y los datastores en uso
+        # y dejaría el primer servidor escuchando sin forma de detenerlo
+        if self.servidor_activo or (self.hilo_servidor is not None and self.hilo_servidor.is_alive()):
+            return ResultadoOperacion(
+                exitoso=True,
+                mensaje=f"Servidor Modbus TCP ya iniciado en {self.config_modbus.ip}:{self.config_modbus.puerto}"
+            )
+            
         try:
             self.cambiar_estado(EstadoProtocolo.CONECTANDO, "Iniciando servidor Modbus TCP")
             
-            # Verificar que el puerto esté disponible
-            if not self._verificar_puerto_disponible():
-                return ResultadoOperacion(
-                    exitoso=False,
-                    mensaje=f"Puerto {self.config_modbus.puerto} no está disponible"
-                )
-            
             # Configurar callbacks COMPLETOS
             self._configurar_callbacks_completos()
             
@@ -341,44 +551,29 @@ class ServidorModbusTCPReal(ProtocoloBase):
             # Configurar identificación del dispositivo
             identity = self._crear_identificacion_dispositivo()
             
-            # Intentar iniciar servidor
+            # Iniciar servidor async (pymodbus o nativo según configuración)
             servidor_iniciado = False
-            metodo_usado = "ninguno"
+            usar_nativo = getattr(self.config_modbus, 'servidor_nativo', False)
+            metodo_usado = "nativo" if usar_nativo else "async"
             
-            # Método principal: Async corregido
-            if PYMODBUS_VERSION == "3.x" and not servidor_iniciado:
-                try:
-                    self.logger.info("🔄 Intentando servidor async (método corregido)...")
+            try:
+                self.logger.info(f"🔄 Iniciando servidor {metodo_usado}...")
+                if usar_nativo:
+                    self._iniciar_servidor_nativo()
+                else:
                     self._iniciar_servidor_async(context, identity)
+                
+                # Verificar que realmente se inició
+                servidor_iniciado = self._verificar_servidor_activo()
+                if not servidor_iniciado:
+                    self.logger.error(f"❌ Servidor {metodo_usado} no quedó escuchando")
                     
-                    # Verificar que realmente se inició
-                    time.sleep(3)
-                    if self._verificar_servidor_activo():
-                        servidor_iniciado = True
-                        metodo_usado = "async corregido"
-                    else:
-                        self.logger.warning("⚠️ Servidor async falló silenciosamente")
-                        
-                except Exception as e:
-                    self.logger.warning(f"⚠️ Método async falló: {e}")
-            
-            # Método fallback: Sync
-            if not servidor_iniciado:
-                try:
-                    self.logger.info("🔄 Intentando servidor sync (fallback)...")
-                    self._iniciar_servidor_sync(context, identity)
-                    
-                    time.sleep(3)
-                    if self._verificar_servidor_activo():
-                        servidor_iniciado = True
-                        metodo_usado = "sync"
-                        
-                except Exception as e:
-                    self.logger.error(f"❌ Método sync también falló: {e}")
+            except Exception as e:
+                self.logger.error(f"❌ Error iniciando servidor {metodo_usado}: {e}")
             
             # Verificar resultado final
             if servidor_iniciado:
-                # Iniciar hilo actualizador de datos
+                # Iniciar tarea actualizadora de datos en el loop del servidor
                 self._iniciar_actualizador_datos()
                 
                 self.servidor_activo = True
@@ -392,7 +587,7 @@ class ServidorModbusTCPReal(ProtocoloBase):
                     mensaje=f"Servidor Modbus TCP iniciado en {self.config_modbus.ip}:{self.config_modbus.puerto} (método: {metodo_usado})"
                 )
             else:
-                mensaje_error = "No se pudo iniciar el servidor con ningún método"
+                mensaje_error = f"No se pudo iniciar el servidor en {self.config_modbus.ip}:{self.config_modbus.puerto}"
                 self.cambiar_estado(EstadoProtocolo.ERROR, mensaje_error)
                 return ResultadoOperacion(
                     exitoso=False,
@@ -408,55 +603,56 @@ class ServidorModbusTCPReal(ProtocoloBase):
                 mensaje=f"Error iniciando servidor Modbus TCP: {str(e)}"
             )
 
-    def _verificar_puerto_disponible(self) -> bool:
-        """Verificar si el puerto está disponible."""
-        try:
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-            resultado = sock.bind((self.config_modbus.ip, self.config_modbus.puerto))
-            sock.close()
-            return True
-        except OSError as e:
-            self.logger.warning(f"⚠️ Puerto {self.config_modbus.puerto} en uso: {e}")
-            return False
-            
     def _verificar_servidor_activo(self) -> bool:
-        """Verificar que el servidor esté realmente escuchando."""
-        try:
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(2)
-            
-            resultado = sock.connect_ex((self.config_modbus.ip, self.config_modbus.puerto))
-            sock.close()
-            
-            activo = resultado == 0
+        """
+        Verificar que el servidor esté realmente escuchando.
+        
+        Reintenta la conexión con espera exponencial en lugar de una pausa fija;
+        si el hilo del servidor termina (p.ej. puerto ocupado) se aborta de inmediato.
+        """
+        direccion = (self.config_modbus.ip, self.config_modbus.puerto)
+        
+        for espera in ESPERAS_VERIFICACION:
+            time.sleep(espera)
             
-            if activo:
-                self.logger.info(f"✅ Verificación: Servidor activo en puerto {self.config_modbus.puerto}")
-            else:
-                self.logger.warning(f"⚠️ Verificación: Puerto {self.config_modbus.puerto} no responde")
+            if self.hilo_servidor is None or not self.hilo_servidor.is_alive():
+                self.logger.warning(f"⚠️ Verificación: Hilo del servidor terminó (¿puerto {self.config_modbus.puerto} en uso?)")
+                return False
                 
-            return activo
-            
-        except Exception as e:
-            self.logger.warning(f"⚠️ Error verificando servidor: {e}")
-            return False
+            try:
+                with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+                    sock.settimeout(espera)
+                    if sock.connect_ex(direccion) == 0:
+                        self.logger.info(f"✅ Verificación: Servidor activo en puerto {self.config_modbus.puerto}")
+                        return True
+            except OSError as e:
+                self.logger.debug("Verificación: intento fallido: %s", e)
+                
+        self.logger.warning(f"⚠️ Verificación: Puerto {self.config_modbus.puerto} no responde")
+        return False
             
     def _crear_datastores(self):
         """Crear datastores personalizados con validación."""
         
+        # Buffer único: input registers en [0, TAMANO_BANCO), holding en [TAMANO_BANCO, 2*TAMANO_BANCO)
+        self._registros = array.array('H', [0]) * (2 * TAMANO_BANCO)
+        
         # Input Registers (solo lectura)
         self.input_registers_store = BMSDataStore(
-            values=self.datos_input_registers.copy(),
+            values=self.datos_input_registers,
             callbacks={},
-            logger=self.logger
+            logger=self.logger,
+            buffer=self._registros,
+            desplazamiento=0
         )
         
         # Holding Registers (lectura/escritura)
         self.holding_registers_store = BMSDataStore(
-            values=self.datos_holding_registers.copy(),
+            values=self.datos_holding_registers,
             callbacks=self.callbacks_escritura,
-            logger=self.logger
+            logger=self.logger,
+            buffer=self._registros,
+            desplazamiento=TAMANO_BANCO
         )
         
         # NUEVO: Agregar callback genérico para pruebas
@@ -496,46 +692,80 @@ class ServidorModbusTCPReal(ProtocoloBase):
         return identity
         
     def _iniciar_servidor_async(self, context, identity):
-        """Iniciar servidor async con manejo perfecto de asyncio."""
+        """Iniciar servidor async de pymodbus."""
+        async def crear_servidor():
+            servidor = ServidorModbusTCPAjustado(
+                context,
+                ModbusSocketFramer,
+                identity,
+                (self.config_modbus.ip, self.config_modbus.puerto),
+            )
+            await servidor.serve_forever()
+            
+        self._iniciar_hilo_servidor(crear_servidor)
+        
+    def _iniciar_servidor_nativo(self):
+        """
+        Iniciar servidor asyncio propio para el mapa fijo de registros del BMS.
+        
+        Atiende solo FC3/FC4/FC6/FC16 sobre los datastores, sin el despacho
+        genérico de pymodbus. Se activa con la opción 'servidor_nativo'.
+        """
+        async def crear_servidor():
+            servidor = await asyncio.start_server(
+                self._atender_cliente_modbus,
+                self.config_modbus.ip,
+                self.config_modbus.puerto
+            )
+            async with servidor:
+                await servidor.serve_forever()
+                
+        self._iniciar_hilo_servidor(crear_servidor)
+        
+    def _iniciar_hilo_servidor(self, crear_servidor: Callable):
+        """
+        Ejecutar un servidor asyncio en su propio hilo con manejo perfecto de asyncio.
+        
+        Args:
+            crear_servidor: Función que devuelve la corrutina que atiende el servidor
+        """
         def _run_async_server():
-            # Crear nuevo loop para este hilo
-            self.loop_asyncio = asyncio.new_event_loop()
+            # Crear nuevo loop para este hilo (uvloop si está instalado)
+            self.loop_asyncio = uvloop.new_event_loop() if uvloop else asyncio.new_event_loop()
             asyncio.set_event_loop(self.loop_asyncio)
             
             try:
                 async def start_server():
-                    # Iniciar servidor async
-                    self._server_task = await StartAsyncTcpServer(
-                        context=context,
-                        identity=identity,
-                        address=(self.config_modbus.ip, self.config_modbus.puerto),
-                    )
+                    # El evento se crea aquí para quedar ligado al loop de este hilo
+                    self._evento_parada = asyncio.Event()
+                    
+                    # Iniciar servidor como tarea (atiende indefinidamente)
+                    self._server_task = asyncio.ensure_future(crear_servidor())
+                    
+                    # Si el servidor termina por su cuenta (p.ej. error de bind) también se libera la espera
+                    self._server_task.add_done_callback(lambda _tarea: self._evento_parada.set())
                     
                     self.logger.info(f"✅ Servidor async iniciado en {self.config_modbus.ip}:{self.config_modbus.puerto}")
                     
-                    # MEJORA: Mantener servidor activo con manejo correcto de cancelación
+                    # MEJORA: Esperar la señal de parada sin despertar el loop periódicamente
                     try:
-                        while self.servidor_activo:
-                            await asyncio.sleep(1)
+                        await self._evento_parada.wait()
                     except asyncio.CancelledError:
                         self.logger.info("🛑 Servidor async cancelado correctamente")
                         raise
                     finally:
                         # Cleanup del servidor
-                        if hasattr(self._server_task, 'close'):
-                            try:
-                                self._server_task.close()
-                                if hasattr(self._server_task, 'wait_closed'):
-                                    await self._server_task.wait_closed()
-                            except Exception as e:
-                                self.logger.warning(f"⚠️ Error cerrando servidor: {e}")
+                        self._server_task.cancel()
+                        await asyncio.gather(self._server_task, return_exceptions=True)
+                        
+                    if not self._server_task.cancelled() and self._server_task.exception():
+                        raise self._server_task.exception()
                         
                 # Ejecutar servidor
                 self.loop_asyncio.run_until_complete(start_server())
                 
             except Exception as e:
                 self.logger.error(f"❌ Error en servidor async: {e}")
-                import traceback
                 self.logger.error(f"Traceback: {traceback.format_exc()}")
             finally:
                 # PERFECCIÓN: Cancelar todas las tareas pendientes
@@ -557,28 +787,116 @@ class ServidorModbusTCPReal(ProtocoloBase):
                         
                 except Exception as e:
                     self.logger.warning(f"⚠️ Error en cleanup asyncio: {e}")
+                finally:
+                    # Sin loop activo ya no hay a quién señalar la parada
+                    self._evento_parada = None
                 
         self.hilo_servidor = threading.Thread(target=_run_async_server, daemon=True)
         self.hilo_servidor.start()
-        time.sleep(3)
 
-    def _iniciar_servidor_sync(self, context, identity):
-        """Iniciar servidor sync."""
-        def _run_sync_server():
-            try:
-                StartTcpServer(
-                    context=context,
-                    identity=identity,
-                    address=(self.config_modbus.ip, self.config_modbus.puerto),
-                )
-            except Exception as e:
-                self.logger.error(f"❌ Error en servidor sync: {e}")
-                import traceback
-                self.logger.error(f"Traceback: {traceback.format_exc()}")
+    async def _atender_cliente_modbus(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Atender una conexión Modbus TCP del servidor nativo (trama MBAP + PDU)."""
+        # Buffer de respuesta reutilizado en toda la conexión: MBAP + PDU máxima
+        salida = bytearray(_MBAP.size + TAMANO_MAX_PDU)
+        vista_salida = memoryview(salida)
+        configurar_socket_cliente(writer.get_extra_info('socket'))
+        
+        try:
+            while True:
+                cabecera = await reader.readexactly(_MBAP.size)
+                transaccion, protocolo, longitud, unidad = _MBAP.unpack(cabecera)
                 
-        self.hilo_servidor = threading.Thread(target=_run_sync_server, daemon=True)
-        self.hilo_servidor.start()
-        time.sleep(3)
+                # La longitud incluye el unit id; una PDU válida tiene entre 1 y 253 bytes
+                if protocolo != 0 or not 2 <= longitud <= TAMANO_MAX_PDU + 1:
+                    self.logger.warning(f"⚠️ Trama Modbus inválida (protocolo {protocolo}, longitud {longitud})")
+                    break
+                    
+                pdu = await reader.readexactly(longitud - 1)
+                longitud_respuesta = self._procesar_pdu(pdu, salida)
+                
+                _MBAP.pack_into(salida, 0, transaccion, 0, longitud_respuesta + 1, unidad)
+                writer.write(bytes(vista_salida[:_MBAP.size + longitud_respuesta]))
+                await writer.drain()
+                
+        except (asyncio.IncompleteReadError, ConnectionError):
+            # Cliente desconectado
+            pass
+        finally:
+            vista_salida.release()
+            writer.close()
+            
+    def _procesar_pdu(self, pdu: bytes, salida: bytearray) -> int:
+        """
+        Ejecutar una PDU Modbus sobre los datastores y escribir la PDU de respuesta.
+        
+        Args:
+            pdu: Código de función seguido de los datos de la petición
+            salida: Buffer de respuesta; la PDU se escribe tras la cabecera MBAP
+            
+        Returns:
+            Longitud en bytes de la PDU de respuesta (o de excepción Modbus)
+        """
+        codigo = pdu[0]
+        inicio = _MBAP.size
+        
+        try:
+            if codigo == FC_LEER_HOLDING or codigo == FC_LEER_INPUT:
+                if len(pdu) != 5:
+                    return self._escribir_excepcion(salida, codigo, EXCEPCION_VALOR_ILEGAL)
+                direccion, cantidad = _DIRECCION_VALOR.unpack_from(pdu, 1)
+                store = self.holding_registers_store if codigo == FC_LEER_HOLDING else self.input_registers_store
+                
+                if not 1 <= cantidad <= MAX_REGISTROS_LECTURA:
+                    return self._escribir_excepcion(salida, codigo, EXCEPCION_VALOR_ILEGAL)
+                if not store.validate(direccion, cantidad):
+                    return self._escribir_excepcion(salida, codigo, EXCEPCION_DIRECCION_ILEGAL)
+                    
+                _CABECERA_LECTURA.pack_into(salida, inicio, codigo, 2 * cantidad)
+                inicio_datos = inicio + _CABECERA_LECTURA.size
+                salida[inicio_datos:inicio_datos + 2 * cantidad] = store.leer_bytes(direccion, cantidad)
+                return _CABECERA_LECTURA.size + 2 * cantidad
+                
+            if codigo == FC_ESCRIBIR_REGISTRO:
+                if len(pdu) != 5:
+                    return self._escribir_excepcion(salida, codigo, EXCEPCION_VALOR_ILEGAL)
+                direccion, valor = _DIRECCION_VALOR.unpack_from(pdu, 1)
+                
+                if not self.holding_registers_store.validate(direccion, 1):
+                    return self._escribir_excepcion(salida, codigo, EXCEPCION_DIRECCION_ILEGAL)
+                    
+                self.holding_registers_store.setValues(direccion, [valor])
+                salida[inicio:inicio + 5] = pdu
+                return 5
+                
+            if codigo == FC_ESCRIBIR_MULTIPLES:
+                if len(pdu) < 6:
+                    return self._escribir_excepcion(salida, codigo, EXCEPCION_VALOR_ILEGAL)
+                direccion, cantidad, num_bytes = _ESCRITURA_MULTIPLE.unpack_from(pdu, 1)
+                
+                if (not 1 <= cantidad <= MAX_REGISTROS_ESCRITURA or
+                        num_bytes != 2 * cantidad or len(pdu) != 6 + num_bytes):
+                    return self._escribir_excepcion(salida, codigo, EXCEPCION_VALOR_ILEGAL)
+                if not self.holding_registers_store.validate(direccion, cantidad):
+                    return self._escribir_excepcion(salida, codigo, EXCEPCION_DIRECCION_ILEGAL)
+                    
+                valores = array.array('H', pdu[6:])
+                if not HOST_BIG_ENDIAN:
+                    valores.byteswap()
+                self.holding_registers_store.setValues(direccion, valores)
+                salida[inicio:inicio + 5] = pdu[:5]
+                return 5
+                
+            return self._escribir_excepcion(salida, codigo, EXCEPCION_FUNCION_ILEGAL)
+            
+        except Exception as e:
+            self.logger.error(f"❌ Error procesando función Modbus {codigo}: {e}")
+            return self._escribir_excepcion(salida, codigo, EXCEPCION_FALLO_DISPOSITIVO)
+            
+    @staticmethod
+    def _escribir_excepcion(salida: bytearray, codigo: int, excepcion: int) -> int:
+        """Escribir una PDU de excepción Modbus en el buffer de respuesta."""
+        _CABECERA_LECTURA.pack_into(salida, _MBAP.size, codigo | 0x80, excepcion)
+        return _CABECERA_LECTURA.size
         
     def _configurar_callbacks_completos(self):
         """MEJORA: Configurar callbacks para TODOS los registros de holding."""
@@ -607,14 +925,14 @@ class ServidorModbusTCPReal(ProtocoloBase):
         """Callback para comando general del sistema."""
         comandos = {0: "Ninguno", 1: "Reiniciar", 2: "Apagar", 3: "Mantenimiento"}
         comando = comandos.get(valor, f"Desconocido({valor})")
-        self.logger.info(f"🔧 COMANDO GENERAL: {comando}")
+        self.logger.info("🔧 COMANDO GENERAL: %s", comando)
         
     def _callback_reset_alarmas(self, direccion: int, valor: int):
         """Callback para reset de alarmas."""
         if valor == 1:
             self.logger.info("🔧 RESET ALARMAS SOLICITADO")
             # Resetear contador de alarmas
-            self.input_registers_store.setValues(4, [0])
+            self.input_registers_store.poke(4, 0)
             
     def _callback_force_backup(self, direccion: int, valor: int):
         """Callback para forzar backup."""
@@ -634,91 +952,102 @@ class ServidorModbusTCPReal(ProtocoloBase):
     def _callback_reiniciar_controlador(self, numero: int, valor: int):
         """Callback para reiniciar controlador específico."""
         if valor == 1:
-            self.logger.info(f"🔧 REINICIAR CONTROLADOR {numero}")
+            self.logger.info("🔧 REINICIAR CONTROLADOR %s", numero)
     
     def _callback_comando_prueba(self, direccion: int, valor: int):
         """NUEVO: Callback para comandos de prueba."""
-        self.logger.info(f"🧪 COMANDO PRUEBA ejecutado en dirección {direccion} con valor {valor}")
+        self.logger.info("🧪 COMANDO PRUEBA ejecutado en dirección %s con valor %s", direccion, valor)
     
     def _callback_escritura_generica(self, direccion: int, valor: int):
         """NUEVO: Callback genérico para cualquier escritura (útil para pruebas)."""
-        self.logger.info(f"📝 ESCRITURA GENÉRICA: Dirección {direccion}, Valor {valor}")
+        self.logger.info("📝 ESCRITURA GENÉRICA: Dirección %s, Valor %s", direccion, valor)
             
     def _iniciar_actualizador_datos(self):
-        """Iniciar hilo que actualiza datos del sistema periódicamente."""
-        def _actualizar_datos_periodicamente():
-            contador = 0
-            tiempo_inicio = time.time()
+        """Programar la tarea que actualiza datos del sistema en el loop del servidor."""
+        self._tarea_actualizador = asyncio.run_coroutine_threadsafe(
+            self._actualizar_datos_periodicamente(), self.loop_asyncio
+        )
+        
+    async def _actualizar_datos_periodicamente(self):
+        """
+        Actualizar timestamp, uptime y sensores simulados hasta ser cancelada.
+        
+        Cada registro tiene su propio periodo; una agenda heapq ordenada por
+        próxima ejecución evita despertar el loop para registros sin cambios.
+        """
+        inicio_monotonico = time.monotonic()
+        # Input registers no tienen callbacks: escribir directo en el buffer
+        registros = self.input_registers_store
+        
+        def actualizar_timestamp():
+            # Timestamp truncado a 16 bits para Modbus
+            registros.poke(9, int(time.time()) & 0xFFFF)
             
-            while self.servidor_activo and not self.detener_actualizador.is_set():
-                try:
-                    contador += 1
-                    
-                    # Actualizar timestamp (truncado para Modbus)
-                    timestamp_truncado = int(time.time()) % 65536
-                    self.input_registers_store.setValues(9, [timestamp_truncado])
-                    
-                    # Actualizar tiempo de funcionamiento
-                    horas_funcionamiento = min(65535, int((time.time() - tiempo_inicio) / 3600))
-                    self.input_registers_store.setValues(1, [horas_funcionamiento])
-                    
-                    # Simular variaciones en sensores cada 30 segundos
-                    if contador % 6 == 0:
-                        import random
-                        
-                        # Temperatura con variación (rango validado)
-                        temp_actual = self.input_registers_store.getValues(10, 1)[0]
-                        nueva_temp = validar_valor_modbus(temp_actual + random.randint(-10, 10))
-                        nueva_temp = max(200, min(350, nueva_temp))  # 20.0°C - 35.0°C
-                        self.input_registers_store.setValues(10, [nueva_temp])
-                        
-                        # Humedad con variación (rango validado)
-                        hum_actual = self.input_registers_store.getValues(11, 1)[0]
-                        nueva_hum = validar_valor_modbus(hum_actual + random.randint(-5, 5))
-                        nueva_hum = max(30, min(80, nueva_hum))  # 30% - 80%
-                        self.input_registers_store.setValues(11, [nueva_hum])
-                        
-                        # Latencia de red con variación
-                        latencia_actual = self.input_registers_store.getValues(42, 1)[0]
-                        nueva_latencia = validar_valor_modbus(latencia_actual + random.randint(-3, 3))
-                        nueva_latencia = max(1, min(50, nueva_latencia))  # 1ms - 50ms
-                        self.input_registers_store.setValues(42, [nueva_latencia])
-                        
-                    # Dormir 5 segundos
-                    self.detener_actualizador.wait(5)
+        def actualizar_tiempo_funcionamiento():
+            registros.poke(1, min(65535, int((time.monotonic() - inicio_monotonico) / 3600)))
+            
+        # Agenda: (próxima ejecución, orden de desempate, periodo, tarea)
+        agenda = [
+            (inicio_monotonico, 0, INTERVALO_ACTUALIZACION, actualizar_timestamp),
+            (inicio_monotonico, 1, INTERVALO_TIEMPO_FUNCIONAMIENTO, actualizar_tiempo_funcionamiento),
+        ]
+        for orden, (direccion, variacion, minimo, maximo, periodo) in enumerate(SIMULACION_SENSORES, start=2):
+            tarea = self._crear_simulador_sensor(direccion, variacion, minimo, maximo)
+            agenda.append((inicio_monotonico + periodo, orden, periodo, tarea))
+        heapq.heapify(agenda)
+        
+        try:
+            while True:
+                proxima, orden, periodo, tarea = agenda[0]
+                espera = proxima - time.monotonic()
+                if espera > 0:
+                    await asyncio.sleep(espera)
                     
+                try:
+                    tarea()
                 except Exception as e:
                     self.logger.error(f"❌ Error actualizando datos: {e}")
-                    self.detener_actualizador.wait(5)
                     
-        self.hilo_actualizador = threading.Thread(target=_actualizar_datos_periodicamente, daemon=True)
-        self.hilo_actualizador.start()
+                heapq.heapreplace(agenda, (proxima + periodo, orden, periodo, tarea))
+                
+        except asyncio.CancelledError:
+            self.logger.debug("✅ Actualizador de datos detenido")
+            
+    def _crear_simulador_sensor(self, direccion: int, variacion: int, minimo: int,
+                                maximo: int) -> Callable[[], None]:
+        """
+        Crear la función de simulación de un sensor con su configuración ya fijada.
+        
+        La dirección, los límites, el buffer y el generador quedan capturados en
+        la clausura, de modo que cada ejecución solo lee, varía y acota un registro.
+        """
+        buffer = self.input_registers_store.values
+        randint = self._rng.randint
+        
+        def simular():
+            buffer[direccion] = max(minimo, min(maximo, buffer[direccion] + randint(-variacion, variacion)))
+            
+        return simular
         
     def desconectar(self) -> ResultadoOperacion:
         """PERFECCIÓN: Detener servidor Modbus TCP sin errores."""
         try:
             self.logger.info("🛑 Iniciando parada del servidor...")
             self.servidor_activo = False
-            self.detener_actualizador.set()
             
-            # MEJORA: Parar servidor async correctamente
-            if self._server_task:
-                try:
-                    if hasattr(self._server_task, 'cancel'):
-                        self._server_task.cancel()
-                        self.logger.debug("✅ Server task cancelado")
-                except Exception as e:
-                    self.logger.warning(f"⚠️ Error cancelando server task: {e}")
+            # Cancelar el actualizador (thread-safe: se reprograma en el loop del servidor)
+            if self._tarea_actualizador:
+                self._tarea_actualizador.cancel()
+                self._tarea_actualizador = None
             
-            # MEJORA: Manejar loop asyncio correctamente
-            if self.loop_asyncio and not self.loop_asyncio.is_closed():
+            # MEJORA: Señalar la parada al loop asyncio desde este hilo (thread-safe)
+            if self._evento_parada:
                 try:
-                    # Señal al loop para que termine
-                    if self.loop_asyncio.is_running():
-                        self.loop_asyncio.call_soon_threadsafe(lambda: None)
-                        self.logger.debug("✅ Señal enviada al loop asyncio")
-                except Exception as e:
-                    self.logger.warning(f"⚠️ Error señalizando loop asyncio: {e}")
+                    self.loop_asyncio.call_soon_threadsafe(self._evento_parada.set)
+                    self.logger.debug("✅ Señal de parada enviada al loop asyncio")
+                except RuntimeError:
+                    # El loop ya se cerró por su cuenta: no hay nada que detener
+                    self.logger.debug("Loop asyncio ya cerrado")
                 
             # Esperar que terminen los hilos con timeout apropiado
             if self.hilo_servidor and self.hilo_servidor.is_alive():
@@ -729,14 +1058,6 @@ class ServidorModbusTCPReal(ProtocoloBase):
                 else:
                     self.logger.debug("✅ Hilo servidor terminado")
                 
-            if self.hilo_actualizador and self.hilo_actualizador.is_alive():
-                self.logger.debug("🔄 Esperando que termine hilo actualizador...")
-                self.hilo_actualizador.join(timeout=2)
-                if self.hilo_actualizador.is_alive():
-                    self.logger.warning("⚠️ Hilo actualizador no terminó en tiempo esperado")
-                else:
-                    self.logger.debug("✅ Hilo actualizador terminado")
-                
             self.cambiar_estado(EstadoProtocolo.DESCONECTADO, "Servidor Modbus TCP detenido")
             self.logger.info("✅ Servidor Modbus TCP detenido")
             
@@ -762,64 +1083,126 @@ class ServidorModbusTCPReal(ProtocoloBase):
         """
         Actualizar un dato específico del sistema en los registros.
         """
-        # Mapeo de nombres a direcciones de input registers
-        mapeo_input = {
-            'estado_general_sistema': 0,
-            'tiempo_funcionamiento': 1,
-            'numero_dispositivos_total': 2,
-            'numero_dispositivos_online': 3,
-            'numero_alarmas_activas': 4,
-            'temperatura_promedio': 10,
-            'humedad_promedio': 11,
-            'estado_comunicacion_genetec': 6,
-            'camaras_online': 21,
-            'controladores_online': 31,
-        }
-        
-        if nombre_dato in mapeo_input and self.input_registers_store:
-            direccion = mapeo_input[nombre_dato]
+        direccion = MAPEO_INPUT_REGISTERS.get(nombre_dato)
+        if direccion is not None and self.input_registers_store:
             valor_validado = validar_valor_modbus(valor)
-            self.input_registers_store.setValues(direccion, [valor_validado])
-            self.logger.debug(f"📊 Actualizado {nombre_dato} = {valor_validado} en registro {direccion}")
+            self.input_registers_store.poke(direccion, valor_validado)
+            self.logger.debug("📊 Actualizado %s = %s en registro %s", nombre_dato, valor_validado, direccion)
+            
+    def actualizar_bloque_sistema(self, direccion_inicio: int, valores: List[Any]):
+        """
+        Actualizar varios input registers contiguos en una sola escritura.
+        
+        Args:
+            direccion_inicio: Primer registro a actualizar
+            valores: Valores a escribir (se validan al rango Modbus)
+        """
+        if not self.input_registers_store:
+            return
+            
+        if not self.input_registers_store.validate(direccion_inicio, len(valores)):
+            self.logger.warning(f"⚠️ Bloque fuera de rango: Dirección {direccion_inicio}, Count {len(valores)}")
+            return
+            
+        self.input_registers_store.escribir_bloque(direccion_inicio, [validar_valor_modbus(v) for v in valores])
+        self.logger.debug("📊 Actualizados %s registros desde %s", len(valores), direccion_inicio)
             
     def agregar_callback_escritura(self, direccion: int, callback: Callable):
         """Agregar callback para escrituras en holding registers."""
+        # El datastore de holding comparte este diccionario: una única asignación atómica
         self.callbacks_escritura[direccion] = callback
-        if self.holding_registers_store:
-            self.holding_registers_store.callbacks[direccion] = callback
             
     def leer_datos(self, direccion: str, **kwargs) -> ResultadoOperacion:
         """Leer datos de los registros del servidor."""
         try:
             tipo = kwargs.get('tipo', 'input')
+            cantidad = kwargs.get('cantidad', 1)
             direccion_int = int(direccion)
             
+            if cantidad != 1:
+                return self.leer_rango(direccion_int, cantidad, tipo)
+            
             if tipo == 'input' and self.input_registers_store:
-                valor = self.input_registers_store.getValues(direccion_int, 1)[0]
+                store = self.input_registers_store
             elif tipo == 'holding' and self.holding_registers_store:
-                valor = self.holding_registers_store.getValues(direccion_int, 1)[0]
+                store = self.holding_registers_store
             else:
                 return ResultadoOperacion(exitoso=False, mensaje=f"Tipo inválido: {tipo}")
                 
-            return ResultadoOperacion(exitoso=True, datos=valor)
+            if not store.validate(direccion_int, 1):
+                return ResultadoOperacion(exitoso=False, mensaje=f"Rango inválido: {direccion_int}+1")
+                
+            return ResultadoOperacion(exitoso=True, datos=store.getValues(direccion_int, 1)[0])
             
         except Exception as e:
             return ResultadoOperacion(exitoso=False, mensaje=str(e))
             
+    def leer_rango(self, direccion: int, cantidad: int, tipo: str = 'input') -> ResultadoOperacion:
+        """
+        Leer un rango de registros en una sola llamada.
+        
+        Args:
+            direccion: Primer registro a leer
+            cantidad: Número de registros
+            tipo: 'input' o 'holding'
+            
+        Returns:
+            ResultadoOperacion con la lista de valores en datos
+        """
+        if tipo == 'input' and self.input_registers_store:
+            store = self.input_registers_store
+        elif tipo == 'holding' and self.holding_registers_store:
+            store = self.holding_registers_store
+        else:
+            return ResultadoOperacion(exitoso=False, mensaje=f"Tipo inválido: {tipo}")
+            
+        if not store.validate(direccion, cantidad):
+            return ResultadoOperacion(exitoso=False, mensaje=f"Rango inválido: {direccion}+{cantidad}")
+            
+        # Una sola copia del buffer
+        return ResultadoOperacion(exitoso=True, datos=store.leer_bloque(direccion, cantidad).tolist())
+        
     def escribir_datos(self, direccion: str, valor: Any, **kwargs) -> ResultadoOperacion:
         """Escribir datos en holding registers."""
         try:
             direccion_int = int(direccion)
-            valor_validado = validar_valor_modbus(valor)
             
-            if self.holding_registers_store:
-                self.holding_registers_store.setValues(direccion_int, [valor_validado])
-                return ResultadoOperacion(exitoso=True, mensaje=f"Escrito {valor_validado} en {direccion}")
-            else:
+            if isinstance(valor, (list, tuple)):
+                return self.escribir_rango(direccion_int, valor)
+            
+            if not self.holding_registers_store:
                 return ResultadoOperacion(exitoso=False, mensaje="Servidor no iniciado")
                 
+            if not self.holding_registers_store.validate(direccion_int, 1):
+                return ResultadoOperacion(exitoso=False, mensaje=f"Rango inválido: {direccion_int}+1")
+                
+            valor_validado = validar_valor_modbus(valor)
+            self.holding_registers_store.setValues(direccion_int, [valor_validado])
+            return ResultadoOperacion(exitoso=True, mensaje=f"Escrito {valor_validado} en {direccion}")
+                
         except Exception as e:
             return ResultadoOperacion(exitoso=False, mensaje=str(e))
+            
+    def escribir_rango(self, direccion: int, valores: List[Any]) -> ResultadoOperacion:
+        """
+        Escribir varios holding registers contiguos con un solo setValues.
+        
+        Args:
+            direccion: Primer registro a escribir
+            valores: Valores a escribir (se validan al rango Modbus)
+            
+        Returns:
+            ResultadoOperacion con el resultado de la escritura
+        """
+        if not self.holding_registers_store:
+            return ResultadoOperacion(exitoso=False, mensaje="Servidor no iniciado")
+            
+        if not self.holding_registers_store.validate(direccion, len(valores)):
+            return ResultadoOperacion(exitoso=False, mensaje=f"Rango inválido: {direccion}+{len(valores)}")
+            
+        # setValues valida cada valor y dispara los callbacks por dirección
+        self.holding_registers_store.setValues(direccion, list(valores))
+        return ResultadoOperacion(exitoso=True, mensaje=f"Escritos {len(valores)} registros desde {direccion}")
 
 # Función de utilidad
 def crear_servidor_modbus_tcp_real(configuracion: Dict[str, Any] = None) -> ServidorModbusTCPReal:
@@ -875,7 +1258,6 @@ if __name__ == "__main__":
                 
     except Exception as e:
         print(f"❌ Error: {e}")
-        import traceback
         traceback.print_exc()
         
     print("✅ Prueba completada")
\ No newline at end of file
@@ -10,6 +10,7 @@ Versión: 1.0.0
 """
 
 from abc import ABC, abstractmethod
+import asyncio
 from enum import Enum
 from typing import Dict, Any, List, Optional, Callable
 from datetime import datetime
@@ -20,6 +21,29 @@ from dataclasses import dataclass
 # Importar utilidades
 from utilidades.logger import obtener_logger
 
+# Loop asyncio compartido por los monitores de todos los protocolos (un solo hilo)
+_loop_monitoreo: Optional[asyncio.AbstractEventLoop] = None
+_bloqueo_loop_monitoreo = threading.Lock()
+
+
+def obtener_loop_monitoreo() -> asyncio.AbstractEventLoop:
+    """
+    Obtener el loop compartido de monitoreo, creándolo en un hilo daemon la primera vez.
+    
+    Returns:
+        Loop asyncio en ejecución donde se programan los bucles de monitoreo
+    """
+    global _loop_monitoreo
+    with _bloqueo_loop_monitoreo:
+        if _loop_monitoreo is None:
+            _loop_monitoreo = asyncio.new_event_loop()
+            threading.Thread(
+                target=_loop_monitoreo.run_forever,
+                name="Monitor-protocolos",
+                daemon=True
+            ).start()
+        return _loop_monitoreo
+
 class EstadoProtocolo(Enum):
     """Estados posibles de un protocolo de comunicación."""
     DESCONECTADO = "desconectado"
@@ -28,6 +52,9 @@ class EstadoProtocolo(Enum):
     ERROR = "error"
     DETENIDO = "detenido"
 
+# Miembros ligados a nombres de módulo para rutas frecuentes (evita la búsqueda en la clase Enum)
+_DESCONECTADO, _CONECTANDO, _CONECTADO, _ERROR, _DETENIDO = EstadoProtocolo
+
 class TipoOperacion(Enum):
     """Tipos de operación soportados por los protocolos."""
     LECTURA = "lectura"
@@ -36,13 +63,13 @@ class TipoOperacion(Enum):
     PUBLICACION = "publicacion"
     DESCUBRIMIENTO = "descubrimiento"
 
-@dataclass
+@dataclass(slots=True)
 class ResultadoOperacion:
     """Resultado de una operación de protocolo."""
     exitoso: bool
     datos: Any = None
     mensaje: str = ""
-    timestamp: datetime = None
+    timestamp: Optional[datetime] = None
     tiempo_respuesta: float = 0.0
     codigo_error: Optional[int] = None
     
@@ -51,7 +78,7 @@ class ResultadoOperacion:
         if self.timestamp is None:
             self.timestamp = datetime.now()
 
-@dataclass
+@dataclass(slots=True)
 class EventoProtocolo:
     """Evento generado por un protocolo."""
     tipo: str
@@ -59,7 +86,7 @@ class EventoProtocolo:
     dispositivo: str
     mensaje: str
     datos: Dict[str, Any]
-    timestamp: datetime = None
+    timestamp: Optional[datetime] = None
     
     def __post_init__(self):
         """Inicializar timestamp si no se proporciona."""
@@ -82,14 +109,18 @@ class ProtocoloBase(ABC):
         """
         self.nombre_protocolo = nombre_protocolo
         self.configuracion = configuracion
-        self.estado = EstadoProtocolo.DESCONECTADO
+        self.estado = _DESCONECTADO
         self.logger = obtener_logger(f"protocolo.{nombre_protocolo}")
         
-        # Control de hilos
-        self.hilo_principal = None
-        self.detener_evento = threading.Event()
+        # Control del monitoreo (tarea en el loop compartido de monitoreo)
+        self._tarea_monitoreo = None
         self.activo = False
         
+        # Reconexión del monitoreo en curso (solo ella se ejecuta en un hilo aparte)
+        self._reconexion_terminada = threading.Event()
+        self._reconexion_terminada.set()
+        self._hilo_reconexion: Optional[threading.Thread] = None
+        
         # Callbacks y eventos
         self.callbacks_eventos = []
         self.callbacks_errores = []
@@ -104,7 +135,7 @@ class ProtocoloBase(ABC):
             'errores_consecutivos': 0
         }
         
-        # Bloqueo para operaciones thread-safe
+        # Bloqueo para estadísticas y operaciones thread-safe de subclases
         self.bloqueo = threading.Lock()
         
         self.logger.info(f"Protocolo {nombre_protocolo} inicializado")
@@ -179,17 +210,15 @@ class ProtocoloBase(ABC):
         estado_anterior = self.estado
         self.estado = nuevo_estado
         
-        self.logger.info(f"Cambio de estado: {estado_anterior.value} -> {nuevo_estado.value}")
+        self.logger.info("Cambio de estado: %s -> %s", estado_anterior.value, nuevo_estado.value)
         
         if mensaje:
-            self.logger.info(f"Mensaje: {mensaje}")
+            self.logger.info("Mensaje: %s", mensaje)
             
         # Notificar callbacks de conexión
-        for callback in self.callbacks_conexion:
-            try:
-                callback(self.nombre_protocolo, estado_anterior, nuevo_estado, mensaje)
-            except Exception as e:
-                self.logger.error(f"Error en callback de conexión: {e}")
+        if self.callbacks_conexion:
+            self._notificar_callbacks(self.callbacks_conexion, "conexión",
+                                      self.nombre_protocolo, estado_anterior, nuevo_estado, mensaje)
                 
     def agregar_callback_evento(self, callback: Callable[[EventoProtocolo], None]):
         """
@@ -218,6 +247,21 @@ class ProtocoloBase(ABC):
         """
         self.callbacks_conexion.append(callback)
         
+    def _notificar_callbacks(self, callbacks: List[Callable], tipo: str, *args):
+        """
+        Invocar una lista de callbacks aislando los fallos de cada uno.
+        
+        Args:
+            callbacks: Callbacks a invocar en orden de registro
+            tipo: Tipo de callback (para el mensaje de error)
+            *args: Argumentos para cada callback
+        """
+        for callback in callbacks:
+            try:
+                callback(*args)
+            except Exception as e:
+                self.logger.error(f"Error en callback de {tipo}: {e}")
+                
     def emitir_evento(self, tipo_evento: str, dispositivo: str, mensaje: str, datos: Dict[str, Any] = None):
         """
         Emitir un evento del protocolo.
@@ -228,6 +272,12 @@ class ProtocoloBase(ABC):
             mensaje: Mensaje del evento
             datos: Datos adicionales del evento
         """
+        self.logger.debug("Evento emitido: %s - %s", tipo_evento, mensaje)
+        
+        # Sin suscriptores no hace falta construir el evento
+        if not self.callbacks_eventos:
+            return
+            
         evento = EventoProtocolo(
             tipo=tipo_evento,
             protocolo=self.nombre_protocolo,
@@ -236,14 +286,8 @@ class ProtocoloBase(ABC):
             datos=datos or {}
         )
         
-        self.logger.debug(f"Evento emitido: {tipo_evento} - {mensaje}")
-        
         # Notificar callbacks
-        for callback in self.callbacks_eventos:
-            try:
-                callback(evento)
-            except Exception as e:
-                self.logger.error(f"Error en callback de evento: {e}")
+        self._notificar_callbacks(self.callbacks_eventos, "evento", evento)
                 
     def manejar_error(self, error: Exception, contexto: str = ""):
         """
@@ -255,6 +299,7 @@ class ProtocoloBase(ABC):
         """
         with self.bloqueo:
             self.estadisticas['errores_consecutivos'] += 1
+            errores_consecutivos = self.estadisticas['errores_consecutivos']
             
         mensaje_error = f"Error en {self.nombre_protocolo}"
         if contexto:
@@ -264,15 +309,12 @@ class ProtocoloBase(ABC):
         self.logger.error(mensaje_error)
         
         # Notificar callbacks de error
-        for callback in self.callbacks_errores:
-            try:
-                callback(contexto, error)
-            except Exception as e:
-                self.logger.error(f"Error en callback de error: {e}")
+        if self.callbacks_errores:
+            self._notificar_callbacks(self.callbacks_errores, "error", contexto, error)
                 
         # Cambiar estado si hay muchos errores consecutivos
-        if self.estadisticas['errores_consecutivos'] >= 3:
-            self.cambiar_estado(EstadoProtocolo.ERROR, "Múltiples errores consecutivos")
+        if errores_consecutivos >= 3:
+            self.cambiar_estado(_ERROR, "Múltiples errores consecutivos")
             
     def actualizar_estadisticas(self, operacion_exitosa: bool, tiempo_respuesta: float = 0.0):
         """
@@ -318,20 +360,16 @@ class ProtocoloBase(ABC):
         Args:
             intervalo: Intervalo de monitoreo en segundos
         """
-        if self.hilo_principal and self.hilo_principal.is_alive():
+        if self._tarea_monitoreo and not self._tarea_monitoreo.done():
             self.logger.warning("Monitoreo ya está activo")
             return
             
         self.activo = True
-        self.detener_evento.clear()
         
-        self.hilo_principal = threading.Thread(
-            target=self._bucle_monitoreo,
-            args=(intervalo,),
-            name=f"Monitor-{self.nombre_protocolo}",
-            daemon=True
+        # Todos los protocolos comparten el mismo hilo de monitoreo
+        self._tarea_monitoreo = asyncio.run_coroutine_threadsafe(
+            self._bucle_monitoreo(intervalo), obtener_loop_monitoreo()
         )
-        self.hilo_principal.start()
         
         self.logger.info(f"Monitoreo iniciado con intervalo de {intervalo} segundos")
         
@@ -341,46 +379,76 @@ class ProtocoloBase(ABC):
             return
             
         self.activo = False
-        self.detener_evento.set()
         
-        if self.hilo_principal and self.hilo_principal.is_alive():
-            self.hilo_principal.join(timeout=5)
+        if self._tarea_monitoreo:
+            self._tarea_monitoreo.cancel()
+            self._tarea_monitoreo = None
             
+        # Cancelar la tarea no detiene una reconexión ya lanzada en su hilo:
+        # esperarla para que no quede conectando después de detener el monitoreo
+        if self._hilo_reconexion is not threading.current_thread():
+            if not self._reconexion_terminada.wait(timeout=5):
+                self.logger.warning("La reconexión de monitoreo en curso no terminó a tiempo")
+                
         self.logger.info("Monitoreo detenido")
         
-    def _bucle_monitoreo(self, intervalo: int):
+    async def _bucle_monitoreo(self, intervalo: int):
         """
         Bucle principal de monitoreo.
         
+        La verificación y el heartbeat se ejecutan en el loop compartido (solo
+        consultan el estado en memoria); únicamente la reconexión, que puede
+        bloquear, se lanza en un hilo.
+        
         Args:
             intervalo: Intervalo de verificación en segundos
         """
-        while self.activo and not self.detener_evento.is_set():
-            try:
-                # Verificar conexión
-                if not self.verificar_conexion():
-                    self.logger.warning("Conexión perdida, intentando reconectar...")
-                    self.cambiar_estado(EstadoProtocolo.CONECTANDO, "Reconectando...")
-                    
-                    resultado = self.conectar()
-                    if resultado.exitoso:
-                        self.logger.info("Reconexión exitosa")
-                    else:
-                        self.logger.error(f"Error en reconexión: {resultado.mensaje}")
+        try:
+            while self.activo:
+                try:
+                    # Verificar conexión
+                    if not self.verificar_conexion() and self.activo:
+                        await asyncio.to_thread(self._reconectar_monitoreo)
+                        
+                    # Emitir evento de heartbeat
+                    if self.activo:
+                        self.emitir_evento(
+                            "heartbeat",
+                            self.nombre_protocolo,
+                            "Verificación periódica",
+                            {"estado": self.estado.value}
+                        )
                         
-                # Emitir evento de heartbeat
-                self.emitir_evento(
-                    "heartbeat",
-                    self.nombre_protocolo,
-                    "Verificación periódica",
-                    {"estado": self.estado.value}
-                )
+                except Exception as e:
+                    self.manejar_error(e, "monitoreo")
+                    
+                # Esperar intervalo (la cancelación detiene el bucle)
+                await asyncio.sleep(intervalo)
                 
-            except Exception as e:
-                self.manejar_error(e, "monitoreo")
+        except asyncio.CancelledError:
+            pass
+            
+    def _reconectar_monitoreo(self):
+        """Reconectar tras perder la conexión (se ejecuta en un hilo: conectar() bloquea)."""
+        self._reconexion_terminada.clear()
+        self._hilo_reconexion = threading.current_thread()
+        try:
+            # El monitoreo pudo detenerse mientras la reconexión esperaba su hilo
+            if not self.activo:
+                return
+                
+            self.logger.warning("Conexión perdida, intentando reconectar...")
+            self.cambiar_estado(_CONECTANDO, "Reconectando...")
+            
+            resultado = self.conectar()
+            if resultado.exitoso:
+                self.logger.info("Reconexión exitosa")
+            else:
+                self.logger.error(f"Error en reconexión: {resultado.mensaje}")
                 
-            # Esperar intervalo o evento de parada
-            self.detener_evento.wait(intervalo)
+        finally:
+            self._hilo_reconexion = None
+            self._reconexion_terminada.set()
             
     def reiniciar(self) -> ResultadoOperacion:
         """
@@ -0,0 +1,57 @@
+"""
+Configuración común de pytest para las pruebas del Sistema BMS Demo
+===================================================================
+
+Registra la marca ``db`` (pruebas que abren una conexión real a la base
+de datos, solo con --with-db) y muestra al final de la sesión el mismo
+resumen que imprime pruebas/test_modulo1.py cuando se ejecuta como script.
+
+Autor: Sistema BMS Demo
+Versión: 1.0.0
+"""
+
+import pytest
+
+
+def pytest_addoption(parser):
+    """Agregar la opción --with-db para incluir las pruebas de base de datos."""
+    parser.addoption(
+        "--with-db", action="store_true", default=False,
+        help="Ejecutar también las pruebas marcadas con db (conexión real a BD)"
+    )
+
+
+def pytest_configure(config):
+    """Registrar las marcas propias del BMS."""
+    config.addinivalue_line("markers", "db: prueba que requiere conexión a la base de datos")
+
+
+def pytest_collection_modifyitems(config, items):
+    """Omitir las pruebas de base de datos salvo que se pida --with-db."""
+    if config.getoption("--with-db"):
+        return
+    omitir_bd = pytest.mark.skip(reason="requiere --with-db")
+    for item in items:
+        if "db" in item.keywords:
+            item.add_marker(omitir_bd)
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    """Agregar el resumen de pruebas del BMS al final de la salida de pytest."""
+    estadisticas = terminalreporter.stats
+    exitosas = len(estadisticas.get('passed', []))
+    fallidas = len(estadisticas.get('failed', [])) + len(estadisticas.get('error', []))
+    total = exitosas + fallidas
+    if total == 0:
+        return
+
+    terminalreporter.write_sep("=", "📊 RESUMEN DE PRUEBAS")
+    terminalreporter.write_line(f"Total de pruebas: {total}")
+    terminalreporter.write_line(f"Pruebas exitosas: {exitosas}")
+    terminalreporter.write_line(f"Pruebas fallidas: {fallidas}")
+    terminalreporter.write_line(f"Porcentaje éxito: {(exitosas/total)*100:.1f}%")
+
+    if fallidas == 0:
+        terminalreporter.write_line("🎉 ¡TODAS LAS PRUEBAS PASARON!")
+    else:
+        terminalreporter.write_line(f"⚠️  {fallidas} pruebas fallaron. Revisar la configuración.")
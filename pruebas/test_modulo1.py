@@ -9,26 +9,498 @@ Autor: Sistema BMS Demo
 Versión: 1.0.0
 """
 
+import json
+import logging
 import sys
 import os
+import time
 import traceback
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, List, Tuple
+from enum import IntEnum
+from typing import Callable, Dict, List, Optional, Tuple
+
+import pytest
 
 # Agregar el directorio raíz al path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-class TestModulo1:
+# Cada prueba es una función test_* independiente: pytest las recolecta directamente
+# (en paralelo con pytest-xdist: pytest pruebas/test_modulo1.py -n auto) y
+# EjecutorModulo1 las ejecuta en secuencia con el resumen de consola.
+
+# Componentes bajo prueba. Cada importación se protege por separado: si un módulo
+# no carga, solo fallan las pruebas que dependen de él.
+ERRORES_IMPORTACION: Dict[str, ImportError] = {}
+
+try:
+    from configuracion.configuracion_general import obtener_config, es_modo_debug
+except ImportError as e:
+    ERRORES_IMPORTACION['configuracion.configuracion_general'] = e
+
+try:
+    from configuracion.configuracion_protocolos import (
+        obtener_config_modbus, obtener_protocolos_habilitados
+    )
+except ImportError as e:
+    ERRORES_IMPORTACION['configuracion.configuracion_protocolos'] = e
+
+try:
+    from configuracion.configuracion_base_datos import (
+        obtener_config_bd, obtener_url_conexion_bd
+    )
+except ImportError as e:
+    ERRORES_IMPORTACION['configuracion.configuracion_base_datos'] = e
+
+try:
+    from utilidades.logger import gestor_logs, obtener_logger, obtener_logger_sistema
+except ImportError as e:
+    ERRORES_IMPORTACION['utilidades.logger'] = e
+
+try:
+    from utilidades.validador import (
+        ValidadorBMS, es_ip_valida, es_puerto_valido,
+        validar_configuracion_modbus, primer_error_modbus
+    )
+except ImportError as e:
+    ERRORES_IMPORTACION['utilidades.validador'] = e
+
+try:
+    from utilidades.convertidor_datos import ConvertidorBMS
+except ImportError as e:
+    ERRORES_IMPORTACION['utilidades.convertidor_datos'] = e
+
+try:
+    from utilidades.constantes import (
+        NOMBRE_SISTEMA, VERSION_SISTEMA, LimitesSistema,
+        obtener_mensaje_error, validar_rango_sensor
+    )
+except ImportError as e:
+    ERRORES_IMPORTACION['utilidades.constantes'] = e
+
+try:
+    from modelos.dispositivo import (
+        Dispositivo, TipoDispositivo, EstadoDispositivo,
+        ConfiguracionDispositivo, ProtocoloComunicacion
+    )
+except ImportError as e:
+    ERRORES_IMPORTACION['modelos.dispositivo'] = e
+
+try:
+    from modelos.sensor import (
+        crear_sensor_temperatura, crear_sensor_humedad,
+        TipoSensor, TipoAlerta
+    )
+except ImportError as e:
+    ERRORES_IMPORTACION['modelos.sensor'] = e
+
+try:
+    from base_datos.conexion_bd import (
+        verificar_bd_disponible, obtener_salud_bd, gestor_bd
+    )
+except ImportError as e:
+    ERRORES_IMPORTACION['base_datos.conexion_bd'] = e
+
+try:
+    from protocolos.protocolo_base import (
+        ProtocoloBase, EstadoProtocolo, ResultadoOperacion
+    )
+except ImportError as e:
+    ERRORES_IMPORTACION['protocolos.protocolo_base'] = e
+
+try:
+    from protocolos.modbus.cliente_modbus import ClienteModbus
+except ImportError as e:
+    ERRORES_IMPORTACION['protocolos.modbus.cliente_modbus'] = e
+
+try:
+    from protocolos.modbus.servidor_modbus import ServidorModbus
+except ImportError as e:
+    ERRORES_IMPORTACION['protocolos.modbus.servidor_modbus'] = e
+
+try:
+    from protocolos.modbus.manejador_modbus import (
+        ManejadorModbus, ModoOperacionModbus
+    )
+except ImportError as e:
+    ERRORES_IMPORTACION['protocolos.modbus.manejador_modbus'] = e
+
+# Interfaz mínima (propiedades y métodos) que deben exponer los componentes Modbus
+API_CLIENTE_MODBUS = frozenset({
+    'config_modbus', 'registros_bms',
+    'conectar', 'desconectar', 'leer_datos', 'escribir_datos',
+})
+API_SERVIDOR_MODBUS = frozenset({
+    'config_modbus', 'mapa_registros',
+    'conectar', 'desconectar', 'leer_datos', 'escribir_datos',
+})
+API_MANEJADOR_MODBUS = frozenset({
+    'modo_operacion', 'estadisticas',
+    'iniciar', 'detener', 'obtener_estado_completo',
+})
+
+# Vectores de validación: (entrada, resultado esperado)
+VECTORES_IP = (
+    ("192.168.1.1", True), ("300.300.300.300", False), ("invalid", False), ("", False),
+)
+VECTORES_PUERTO = ((80, True), (502, True), ("47808", True), (0, False), (70000, False), ("abc", False))
+
+# Vectores de conversión con sus resultados esperados
+TOLERANCIA_CONVERSION = 0.1
+VECTORES_CELSIUS_FAHRENHEIT = ((25.0, 77.0), (0.0, 32.0), (100.0, 212.0), (-40.0, -40.0))
+VECTORES_FLOAT_MODBUS = (25.5, 0.0, -12.75, 1013.25)
+VECTORES_TIPO_DISPOSITIVO = (("camera", "camara"), ("CAMERA", "camara"))
+
+# Pruebas del módulo en orden de ejecución: nombre mostrado -> función
+PRUEBAS: Dict[str, Callable[[], None]] = {}
+
+def registrar_prueba(nombre: str):
+    """Decorador que registra una prueba en PRUEBAS con su nombre mostrado."""
+    def decorador(funcion):
+        PRUEBAS[nombre] = funcion
+        return funcion
+    return decorador
+
+def _requerir_modulo(modulo: str):
+    """Relanzar el error de importación de un módulo bajo prueba, si lo hubo."""
+    if modulo in ERRORES_IMPORTACION:
+        raise ERRORES_IMPORTACION[modulo]
+
+def _verificar_api(objeto, api: frozenset):
+    """Verificar en una sola pasada que el objeto expone todos los nombres de la API."""
+    faltantes = api - set(dir(objeto))
+    assert not faltantes, f"Atributos faltantes: {sorted(faltantes)}"
+
+@registrar_prueba("Configuración General")
+def test_configuracion_general():
+    """Probar configuración general."""
+    _requerir_modulo("configuracion.configuracion_general")
+
+    config = obtener_config()
+
+    # Verificar atributos básicos
+    assert hasattr(config, 'NOMBRE_SISTEMA')
+    assert hasattr(config, 'VERSION_SISTEMA')
+    assert hasattr(config, 'IP_BMS')
+    assert hasattr(config, 'PUERTO_BMS')
+
+    # Verificar funciones
+    debug = es_modo_debug()
+    assert isinstance(debug, bool)
+
+@registrar_prueba("Configuración Protocolos")
+def test_configuracion_protocolos():
+    """Probar configuración de protocolos."""
+    _requerir_modulo("configuracion.configuracion_protocolos")
+
+    # Verificar configuración Modbus
+    config_modbus = obtener_config_modbus()
+    assert hasattr(config_modbus, 'ip')
+    assert hasattr(config_modbus, 'puerto')
+
+    # Verificar protocolos habilitados
+    protocolos = obtener_protocolos_habilitados()
+    assert isinstance(protocolos, list)
+
+@registrar_prueba("Configuración Base Datos")
+def test_configuracion_base_datos():
+    """Probar configuración de base de datos."""
+    _requerir_modulo("configuracion.configuracion_base_datos")
+
+    config_bd = obtener_config_bd()
+    assert hasattr(config_bd, 'tipo')
+    assert hasattr(config_bd, 'nombre')
+
+    url = obtener_url_conexion_bd()
+    assert isinstance(url, str)
+    assert len(url) > 0
+
+@registrar_prueba("Sistema de Logging")
+def test_sistema_logging():
+    """Probar sistema de logging."""
+    _requerir_modulo("utilidades.logger")
+
+    # Crear logger
+    logger = obtener_logger("test")
+    assert logger is not None
+
+    # Probar logger del sistema
+    logger_sistema = obtener_logger_sistema()
+    assert logger_sistema is not None
+
+    # Probar escritura
+    logger.info("Mensaje de prueba")
+
+# Solo con pytest (usa tmp_path): el ejecutor de consola no la registra
+def test_propagacion_logging(tmp_path):
+    """Un logger hijo sin configurar escribe por los handlers de su padre."""
+    _requerir_modulo("utilidades.logger")
+
+    ruta_log = tmp_path / "prueba_propagacion.log"
+    gestor_logs.crear_logger("prueba_padre", archivo_log=str(ruta_log), incluir_consola=False)
+    try:
+        mensaje_hijo = f"Mensaje propagado {time.time_ns()}"
+        logging.getLogger("prueba_padre.hijo").warning(mensaje_hijo)
+        assert gestor_logs.vaciar_cola()
+        gestor_logs.vaciar_buffers()
+        assert mensaje_hijo in ruta_log.read_text(encoding="utf-8")
+    finally:
+        gestor_logs.eliminar_logger("prueba_padre")
+        ruta_log.unlink(missing_ok=True)
+
+@registrar_prueba("Validador de Datos")
+def test_validador():
+    """Probar validador de datos."""
+    _requerir_modulo("utilidades.validador")
+
+    # Probar validación de IP (clase y función de conveniencia)
+    for ip, es_valida in VECTORES_IP:
+        assert ValidadorBMS.validar_ip_address(ip).es_valido is es_valida, ip
+        assert es_ip_valida(ip) is es_valida, ip
+
+    # Probar validación de puerto (clase y función de conveniencia)
+    for puerto, es_valido in VECTORES_PUERTO:
+        assert ValidadorBMS.validar_puerto(puerto).es_valido is es_valido, puerto
+        assert es_puerto_valido(puerto) is es_valido, puerto
+
+    # Probar validación de rango en lote (mismo resultado que valor a valor)
+    lecturas = [-60, -50, 22.5, "21.0", 100, 150, "x", None]
+    for tipo_sensor in ("Temperatura", "desconocido"):
+        assert ValidadorBMS.validar_rango_sensor_lote(lecturas, tipo_sensor) == [
+            ValidadorBMS.validar_rango_sensor(valor, tipo_sensor).es_valido for valor in lecturas
+        ], tipo_sensor
+    assert ValidadorBMS.validar_rango_sensor_lote(lecturas[:3], "desconocido") == [True, True, True]
+    assert ValidadorBMS.validar_rango_sensor_lote(["abc", 5], "desconocido") == [False, True]
+
+    # Probar configuración Modbus (lista completa y primer error)
+    config_modbus = {"ip": "192.168.1", "puerto": 502, "id_esclavo": 300}
+    errores = validar_configuracion_modbus(config_modbus)
+    assert len(errores) == 2
+    assert primer_error_modbus(config_modbus) == errores[0]
+    assert primer_error_modbus({"ip": "192.168.1.10", "puerto": 502, "id_esclavo": 1}) is None
+
+@registrar_prueba("Convertidor de Datos")
+def test_convertidor():
+    """Probar convertidor de datos."""
+    _requerir_modulo("utilidades.convertidor_datos")
+
+    # Probar conversión de temperatura
+    for celsius, fahrenheit in VECTORES_CELSIUS_FAHRENHEIT:
+        assert abs(ConvertidorBMS.celsius_a_fahrenheit(celsius) - fahrenheit) < TOLERANCIA_CONVERSION
+
+    # Probar conversión Modbus (ida y vuelta por dos registros)
+    for valor in VECTORES_FLOAT_MODBUS:
+        reg_alto, reg_bajo = ConvertidorBMS.float_a_registros_modbus(valor)
+        valor_recuperado = ConvertidorBMS.registros_modbus_a_float(reg_alto, reg_bajo)
+        assert abs(valor_recuperado - valor) < TOLERANCIA_CONVERSION
+
+    # Probar conversión Modbus en bloque (mismo resultado que par a par)
+    registros = ConvertidorBMS.floats_a_registros_modbus(VECTORES_FLOAT_MODBUS)
+    assert registros == [r for v in VECTORES_FLOAT_MODBUS for r in ConvertidorBMS.float_a_registros_modbus(v)]
+    for valor, recuperado in zip(VECTORES_FLOAT_MODBUS, ConvertidorBMS.registros_modbus_a_floats(registros)):
+        assert abs(recuperado - valor) < TOLERANCIA_CONVERSION
+
+    # Probar normalización
+    for tipo, tipo_esperado in VECTORES_TIPO_DISPOSITIVO:
+        assert ConvertidorBMS.normalizar_tipo_dispositivo(tipo) == tipo_esperado
+
+    # JSON: misma salida que json estándar (también con orjson instalado)
+    datos_json = {
+        "nombre": "Cámara 1", "valor": 21.5, "vacio": None,
+        "fecha": datetime(2024, 1, 2, 3, 4, 5), "estado": EstadoPrueba.OK,
+        "lista": [1, 2.5, {"anidado": True}],
+    }
+    for pretty, indentacion in ((False, None), (True, 2)):
+        json_convertidor = ConvertidorBMS.diccionario_a_json(datos_json, pretty=pretty)
+        assert json_convertidor == json.dumps(
+            datos_json, indent=indentacion, ensure_ascii=False, default=ConvertidorBMS._json_serializer
+        )
+        assert ConvertidorBMS.json_a_diccionario(json_convertidor) == json.loads(json_convertidor)
+
+    # Valores no finitos se serializan como NaN (no null) y se pueden leer de vuelta
+    json_no_finito = ConvertidorBMS.diccionario_a_json({"valor": float("nan"), "vacio": None})
+    assert json_no_finito == '{"valor": NaN, "vacio": null}'
+    assert ConvertidorBMS.json_a_diccionario(json_no_finito)["vacio"] is None
+
+    # Enteros fuera de 64 bits se leen exactos (como json estándar), no como float
+    for entero in (123456789012345678901234567890, -9999999999999999999):
+        assert ConvertidorBMS.json_a_diccionario(f'{{"a": {entero}}}') == {"a": entero}
+
+    # Dataclasses con __slots__ (sin __dict__) se serializan como objeto con sus campos
+    @dataclass(slots=True)
+    class Lectura:
+        sensor: str
+        valor: float
+
+    assert ConvertidorBMS.diccionario_a_json({"l": Lectura("t1", 21.5)}) == '{"l": {"sensor": "t1", "valor": 21.5}}'
+
+@registrar_prueba("Constantes del Sistema")
+def test_constantes():
+    """Probar constantes del sistema."""
+    _requerir_modulo("utilidades.constantes")
+
+    # Verificar constantes básicas
+    assert isinstance(NOMBRE_SISTEMA, str)
+    assert isinstance(VERSION_SISTEMA, str)
+    assert hasattr(LimitesSistema, 'MAX_DISPOSITIVOS')
+
+    # Probar funciones
+    mensaje = obtener_mensaje_error("DEV_001")
+    assert isinstance(mensaje, str)
+
+    valido = validar_rango_sensor("temperatura", 25.0)
+    assert valido
+
+@registrar_prueba("Modelos de Dispositivo")
+def test_modelo_dispositivo():
+    """Probar modelo de dispositivo."""
+    _requerir_modulo("modelos.dispositivo")
+
+    # Crear configuración
+    config = ConfiguracionDispositivo(
+        ip="192.168.1.100",
+        puerto=80,
+        protocolo=ProtocoloComunicacion.HTTP
+    )
+
+    # Crear dispositivo
+    dispositivo = Dispositivo(
+        nombre="Test Device",
+        tipo=TipoDispositivo.CAMARA.value,
+        direccion_ip="192.168.1.100",
+        estado=EstadoDispositivo.ONLINE.value
+    )
+
+    dispositivo.configuracion = config
+
+    # Verificar métodos
+    assert dispositivo.esta_online()
+    assert dispositivo.esta_disponible()
+
+    # Verificar validación
+    errores = dispositivo.validar_configuracion()
+    assert isinstance(errores, list)
+
+@registrar_prueba("Modelos de Sensor")
+def test_modelo_sensor():
+    """Probar modelo de sensor."""
+    _requerir_modulo("modelos.sensor")
+
+    # Crear sensores
+    sensor_temp = crear_sensor_temperatura(1)
+    sensor_humedad = crear_sensor_humedad(1)
+
+    # Verificar propiedades
+    assert sensor_temp.tipo_sensor == TipoSensor.TEMPERATURA.value
+    assert sensor_humedad.tipo_sensor == TipoSensor.HUMEDAD.value
+
+    # Probar actualización de valores
+    alertas = sensor_temp.actualizar_valor(25.5)
+    assert isinstance(alertas, list)
+    assert sensor_temp.valor_actual == 25.5
+
+    # Probar estadísticas
+    stats = sensor_temp.obtener_estadisticas()
+    assert isinstance(stats, dict)
+
+@registrar_prueba("Base de Datos")
+@pytest.mark.db
+def test_base_datos():
+    """Probar conexión a base de datos (solo con --with-db)."""
+    _requerir_modulo("base_datos.conexion_bd")
+
+    # Verificar disponibilidad
+    disponible = verificar_bd_disponible()
+    if not disponible:
+        print("      Warning: BD no disponible, intentando conectar...")
+        gestor_bd.conectar()
+
+    # Verificar salud
+    salud = obtener_salud_bd()
+    assert isinstance(salud, dict)
+    assert 'conectado' in salud
+
+@registrar_prueba("Protocolo Base")
+def test_protocolo_base():
+    """Probar clase base de protocolos."""
+    _requerir_modulo("protocolos.protocolo_base")
+
+    # Crear resultado de operación
+    resultado = ResultadoOperacion(True, "Test OK")
+    assert resultado.exitoso
+    assert resultado.mensaje == "Test OK"
+
+    # Verificar enums
+    assert hasattr(EstadoProtocolo, 'CONECTADO')
+    assert hasattr(EstadoProtocolo, 'DESCONECTADO')
+
+@registrar_prueba("Cliente Modbus")
+def test_cliente_modbus():
+    """Probar cliente Modbus (sin conexión real)."""
+    _requerir_modulo("protocolos.modbus.cliente_modbus")
+
+    # Crear cliente
+    cliente = ClienteModbus()
+
+    # Verificar propiedades y métodos
+    _verificar_api(cliente, API_CLIENTE_MODBUS)
+
+@registrar_prueba("Servidor Modbus")
+def test_servidor_modbus():
+    """Probar servidor Modbus (sin iniciar)."""
+    _requerir_modulo("protocolos.modbus.servidor_modbus")
+
+    # Crear servidor
+    servidor = ServidorModbus()
+
+    # Verificar propiedades y métodos
+    _verificar_api(servidor, API_SERVIDOR_MODBUS)
+
+    # Probar actualización de datos
+    servidor.actualizar_dato_sistema('temperatura_promedio', 250)
+
+@registrar_prueba("Manejador Modbus")
+def test_manejador_modbus():
+    """Probar manejador Modbus (sin conexión)."""
+    _requerir_modulo("protocolos.modbus.manejador_modbus")
+
+    # Crear manejador
+    manejador = ManejadorModbus(ModoOperacionModbus.SOLO_SERVIDOR)
+
+    # Verificar propiedades y métodos
+    _verificar_api(manejador, API_MANEJADOR_MODBUS)
+
+# Pruebas con estado global compartido (conexión de BD, handlers de logging,
+# loggers de protocolo creados por ProtocoloBase): se ejecutan en serie después de las demás
+PRUEBAS_SERIALES = frozenset({
+    test_sistema_logging, test_base_datos,
+    test_cliente_modbus, test_servidor_modbus, test_manejador_modbus,
+})
+
+# Hilos para las pruebas independientes (dominadas por importaciones y E/S)
+MAX_HILOS_PRUEBAS = 8
+
+class EstadoPrueba(IntEnum):
+    """Resultado de una prueba en EjecutorModulo1.resultados."""
+    OK = 1
+    FALLO = 2
+    ERROR = 3
+
+class EjecutorModulo1:
     """
-    Clase principal para pruebas del Módulo 1.
+    Ejecutor de consola para las pruebas del Módulo 1.
     Valida configuración, protocolos, modelos y utilidades.
     """
     
     def __init__(self):
         """Inicializar tester."""
-        self.resultados = {}
+        # nombre -> (EstadoPrueba, tipo de excepción o None, args de la excepción)
+        self.resultados: Dict[str, Tuple[EstadoPrueba, Optional[str], tuple]] = {}
         self.errores = []
         self.inicio_tiempo = datetime.now()
+        self.inicio_perf = time.perf_counter_ns()
+        self.duraciones = {}  # nombre de prueba -> nanosegundos
         
     def ejecutar_todas_las_pruebas(self) -> bool:
         """
@@ -43,396 +515,61 @@ class TestModulo1:
         print(f"Inicio: {self.inicio_tiempo.strftime('%Y-%m-%d %H:%M:%S')}")
         print()
         
-        # Lista de pruebas a ejecutar
-        pruebas = [
-            ("Configuración General", self.test_configuracion_general),
-            ("Configuración Protocolos", self.test_configuracion_protocolos),
-            ("Configuración Base Datos", self.test_configuracion_base_datos),
-            ("Sistema de Logging", self.test_sistema_logging),
-            ("Validador de Datos", self.test_validador),
-            ("Convertidor de Datos", self.test_convertidor),
-            ("Constantes del Sistema", self.test_constantes),
-            ("Modelos de Dispositivo", self.test_modelo_dispositivo),
-            ("Modelos de Sensor", self.test_modelo_sensor),
-            ("Base de Datos", self.test_base_datos),
-            ("Protocolo Base", self.test_protocolo_base),
-            ("Cliente Modbus", self.test_cliente_modbus),
-            ("Servidor Modbus", self.test_servidor_modbus),
-            ("Manejador Modbus", self.test_manejador_modbus)
-        ]
+        # La prueba de base de datos abre una conexión real: solo con --with-db
+        pruebas = PRUEBAS
+        if "--with-db" not in sys.argv:
+            pruebas = {n: f for n, f in PRUEBAS.items() if f is not test_base_datos}
         
         # Ejecutar cada prueba
         total_pruebas = len(pruebas)
         pruebas_exitosas = 0
         
-        for nombre_prueba, funcion_prueba in pruebas:
+        # Lanzar en paralelo las pruebas independientes; las seriales corren al recoger su resultado
+        with ThreadPoolExecutor(max_workers=MAX_HILOS_PRUEBAS) as ejecutor:
+            futuros = {
+                nombre: ejecutor.submit(self._ejecutar_prueba, nombre, funcion)
+                for nombre, funcion in pruebas.items()
+                if funcion not in PRUEBAS_SERIALES
+            }
+            
+        # Recoger resultados en el orden declarado para que la salida sea determinista
+        for nombre_prueba, funcion_prueba in pruebas.items():
             print(f"🔍 Probando: {nombre_prueba}...")
             try:
-                resultado = funcion_prueba()
-                if resultado:
-                    print(f"   ✅ {nombre_prueba}: OK")
-                    pruebas_exitosas += 1
-                    self.resultados[nombre_prueba] = "OK"
+                futuro = futuros.get(nombre_prueba)
+                if futuro is not None:
+                    futuro.result()
                 else:
-                    print(f"   ❌ {nombre_prueba}: FALLO")
-                    self.resultados[nombre_prueba] = "FALLO"
+                    self._ejecutar_prueba(nombre_prueba, funcion_prueba)
+                print(f"   ✅ {nombre_prueba}: OK")
+                pruebas_exitosas += 1
+                self.resultados[nombre_prueba] = (EstadoPrueba.OK, None, ())
+            except AssertionError as e:
+                print(f"      Error: {e}")
+                print(f"   ❌ {nombre_prueba}: FALLO")
+                self.resultados[nombre_prueba] = (EstadoPrueba.FALLO, type(e).__name__, e.args)
             except Exception as e:
-                print(f"   💥 {nombre_prueba}: ERROR - {str(e)}")
-                self.resultados[nombre_prueba] = f"ERROR: {str(e)}"
-                self.errores.append((nombre_prueba, str(e), traceback.format_exc()))
+                print(f"   💥 {nombre_prueba}: ERROR - {e}")
+                self.resultados[nombre_prueba] = (EstadoPrueba.ERROR, type(e).__name__, e.args)
+                # Guardar la excepción; el traceback solo se formatea con --verbose
+                self.errores.append((nombre_prueba, e, sys.exc_info()))
                 
         # Mostrar resumen
         self.mostrar_resumen(total_pruebas, pruebas_exitosas)
         
         return pruebas_exitosas == total_pruebas
         
-    def test_configuracion_general(self) -> bool:
-        """Probar configuración general."""
-        try:
-            from configuracion.configuracion_general import obtener_config, es_modo_debug
-            
-            config = obtener_config()
-            
-            # Verificar atributos básicos
-            assert hasattr(config, 'NOMBRE_SISTEMA')
-            assert hasattr(config, 'VERSION_SISTEMA')
-            assert hasattr(config, 'IP_BMS')
-            assert hasattr(config, 'PUERTO_BMS')
-            
-            # Verificar funciones
-            debug = es_modo_debug()
-            assert isinstance(debug, bool)
-            
-            return True
-        except Exception as e:
-            print(f"      Error: {e}")
-            return False
-            
-    def test_configuracion_protocolos(self) -> bool:
-        """Probar configuración de protocolos."""
-        try:
-            from configuracion.configuracion_protocolos import (
-                obtener_config_modbus, obtener_protocolos_habilitados
-            )
-            
-            # Verificar configuración Modbus
-            config_modbus = obtener_config_modbus()
-            assert hasattr(config_modbus, 'ip')
-            assert hasattr(config_modbus, 'puerto')
-            
-            # Verificar protocolos habilitados
-            protocolos = obtener_protocolos_habilitados()
-            assert isinstance(protocolos, list)
-            
-            return True
-        except Exception as e:
-            print(f"      Error: {e}")
-            return False
-            
-    def test_configuracion_base_datos(self) -> bool:
-        """Probar configuración de base de datos."""
-        try:
-            from configuracion.configuracion_base_datos import (
-                obtener_config_bd, obtener_url_conexion_bd
-            )
-            
-            config_bd = obtener_config_bd()
-            assert hasattr(config_bd, 'tipo')
-            assert hasattr(config_bd, 'nombre')
-            
-            url = obtener_url_conexion_bd()
-            assert isinstance(url, str)
-            assert len(url) > 0
-            
-            return True
-        except Exception as e:
-            print(f"      Error: {e}")
-            return False
-            
-    def test_sistema_logging(self) -> bool:
-        """Probar sistema de logging."""
-        try:
-            from utilidades.logger import obtener_logger, obtener_logger_sistema
-            
-            # Crear logger
-            logger = obtener_logger("test")
-            assert logger is not None
-            
-            # Probar logger del sistema
-            logger_sistema = obtener_logger_sistema()
-            assert logger_sistema is not None
-            
-            # Probar escritura
-            logger.info("Mensaje de prueba")
-            
-            return True
-        except Exception as e:
-            print(f"      Error: {e}")
-            return False
-            
-    def test_validador(self) -> bool:
-        """Probar validador de datos."""
-        try:
-            from utilidades.validador import ValidadorBMS, es_ip_valida, es_puerto_valido
-            
-            # Probar validación de IP
-            resultado_ip = ValidadorBMS.validar_ip_address("192.168.1.1")
-            assert resultado_ip.es_valido
-            
-            resultado_ip_mala = ValidadorBMS.validar_ip_address("300.300.300.300")
-            assert not resultado_ip_mala.es_valido
-            
-            # Probar validación de puerto
-            resultado_puerto = ValidadorBMS.validar_puerto(80)
-            assert resultado_puerto.es_valido
-            
-            # Probar funciones de conveniencia
-            assert es_ip_valida("192.168.1.1")
-            assert not es_ip_valida("invalid")
-            assert es_puerto_valido(502)
-            
-            return True
-        except Exception as e:
-            print(f"      Error: {e}")
-            return False
-            
-    def test_convertidor(self) -> bool:
-        """Probar convertidor de datos."""
-        try:
-            from utilidades.convertidor_datos import ConvertidorBMS
-            
-            # Probar conversión de temperatura
-            fahrenheit = ConvertidorBMS.celsius_a_fahrenheit(25.0)
-            assert abs(fahrenheit - 77.0) < 0.1
-            
-            # Probar conversión Modbus
-            reg_alto, reg_bajo = ConvertidorBMS.float_a_registros_modbus(25.5)
-            valor_recuperado = ConvertidorBMS.registros_modbus_a_float(reg_alto, reg_bajo)
-            assert abs(valor_recuperado - 25.5) < 0.1
-            
-            # Probar normalización
-            tipo_norm = ConvertidorBMS.normalizar_tipo_dispositivo("camera")
-            assert tipo_norm == "camara"
-            
-            return True
-        except Exception as e:
-            print(f"      Error: {e}")
-            return False
-            
-    def test_constantes(self) -> bool:
-        """Probar constantes del sistema."""
-        try:
-            from utilidades.constantes import (
-                NOMBRE_SISTEMA, VERSION_SISTEMA, LimitesSistema,
-                obtener_mensaje_error, validar_rango_sensor
-            )
-            
-            # Verificar constantes básicas
-            assert isinstance(NOMBRE_SISTEMA, str)
-            assert isinstance(VERSION_SISTEMA, str)
-            assert hasattr(LimitesSistema, 'MAX_DISPOSITIVOS')
-            
-            # Probar funciones
-            mensaje = obtener_mensaje_error("DEV_001")
-            assert isinstance(mensaje, str)
-            
-            valido = validar_rango_sensor("temperatura", 25.0)
-            assert valido
-            
-            return True
-        except Exception as e:
-            print(f"      Error: {e}")
-            return False
-            
-    def test_modelo_dispositivo(self) -> bool:
-        """Probar modelo de dispositivo."""
+    def _ejecutar_prueba(self, nombre: str, funcion):
+        """Ejecutar una prueba registrando su duración aunque falle."""
+        inicio = time.perf_counter_ns()
         try:
-            from modelos.dispositivo import (
-                Dispositivo, TipoDispositivo, EstadoDispositivo,
-                ConfiguracionDispositivo, ProtocoloComunicacion
-            )
-            
-            # Crear configuración
-            config = ConfiguracionDispositivo(
-                ip="192.168.1.100",
-                puerto=80,
-                protocolo=ProtocoloComunicacion.HTTP
-            )
-            
-            # Crear dispositivo
-            dispositivo = Dispositivo(
-                nombre="Test Device",
-                tipo=TipoDispositivo.CAMARA.value,
-                direccion_ip="192.168.1.100",
-                estado=EstadoDispositivo.ONLINE.value
-            )
-            
-            dispositivo.configuracion = config
-            
-            # Verificar métodos
-            assert dispositivo.esta_online()
-            assert dispositivo.esta_disponible()
-            
-            # Verificar validación
-            errores = dispositivo.validar_configuracion()
-            assert isinstance(errores, list)
-            
-            return True
-        except Exception as e:
-            print(f"      Error: {e}")
-            return False
-            
-    def test_modelo_sensor(self) -> bool:
-        """Probar modelo de sensor."""
-        try:
-            from modelos.sensor import (
-                crear_sensor_temperatura, crear_sensor_humedad,
-                TipoSensor, TipoAlerta
-            )
-            
-            # Crear sensores
-            sensor_temp = crear_sensor_temperatura(1)
-            sensor_humedad = crear_sensor_humedad(1)
-            
-            # Verificar propiedades
-            assert sensor_temp.tipo_sensor == TipoSensor.TEMPERATURA.value
-            assert sensor_humedad.tipo_sensor == TipoSensor.HUMEDAD.value
-            
-            # Probar actualización de valores
-            alertas = sensor_temp.actualizar_valor(25.5)
-            assert isinstance(alertas, list)
-            assert sensor_temp.valor_actual == 25.5
-            
-            # Probar estadísticas
-            stats = sensor_temp.obtener_estadisticas()
-            assert isinstance(stats, dict)
-            
-            return True
-        except Exception as e:
-            print(f"      Error: {e}")
-            return False
-            
-    def test_base_datos(self) -> bool:
-        """Probar conexión a base de datos."""
-        try:
-            from base_datos.conexion_bd import (
-                verificar_bd_disponible, obtener_salud_bd, gestor_bd
-            )
-            
-            # Verificar disponibilidad
-            disponible = verificar_bd_disponible()
-            if not disponible:
-                print("      Warning: BD no disponible, intentando conectar...")
-                gestor_bd.conectar()
-                
-            # Verificar salud
-            salud = obtener_salud_bd()
-            assert isinstance(salud, dict)
-            assert 'conectado' in salud
-            
-            return True
-        except Exception as e:
-            print(f"      Error: {e}")
-            return False
-            
-    def test_protocolo_base(self) -> bool:
-        """Probar clase base de protocolos."""
-        try:
-            from protocolos.protocolo_base import (
-                ProtocoloBase, EstadoProtocolo, ResultadoOperacion
-            )
-            
-            # Crear resultado de operación
-            resultado = ResultadoOperacion(True, "Test OK")
-            assert resultado.exitoso
-            assert resultado.mensaje == "Test OK"
-            
-            # Verificar enums
-            assert hasattr(EstadoProtocolo, 'CONECTADO')
-            assert hasattr(EstadoProtocolo, 'DESCONECTADO')
-            
-            return True
-        except Exception as e:
-            print(f"      Error: {e}")
-            return False
-            
-    def test_cliente_modbus(self) -> bool:
-        """Probar cliente Modbus (sin conexión real)."""
-        try:
-            from protocolos.modbus.cliente_modbus import ClienteModbus
-            
-            # Crear cliente
-            cliente = ClienteModbus()
-            
-            # Verificar propiedades
-            assert hasattr(cliente, 'config_modbus')
-            assert hasattr(cliente, 'registros_bms')
-            
-            # Verificar métodos (sin conectar)
-            assert hasattr(cliente, 'conectar')
-            assert hasattr(cliente, 'desconectar')
-            assert hasattr(cliente, 'leer_datos')
-            assert hasattr(cliente, 'escribir_datos')
-            
-            return True
-        except Exception as e:
-            print(f"      Error: {e}")
-            return False
-            
-    def test_servidor_modbus(self) -> bool:
-        """Probar servidor Modbus (sin iniciar)."""
-        try:
-            from protocolos.modbus.servidor_modbus import ServidorModbus
-            
-            # Crear servidor
-            servidor = ServidorModbus()
-            
-            # Verificar propiedades
-            assert hasattr(servidor, 'config_modbus')
-            assert hasattr(servidor, 'mapa_registros')
-            
-            # Verificar métodos
-            assert hasattr(servidor, 'conectar')
-            assert hasattr(servidor, 'desconectar')
-            assert hasattr(servidor, 'leer_datos')
-            assert hasattr(servidor, 'escribir_datos')
-            
-            # Probar actualización de datos
-            servidor.actualizar_dato_sistema('temperatura_promedio', 250)
-            
-            return True
-        except Exception as e:
-            print(f"      Error: {e}")
-            return False
-            
-    def test_manejador_modbus(self) -> bool:
-        """Probar manejador Modbus (sin conexión)."""
-        try:
-            from protocolos.modbus.manejador_modbus import (
-                ManejadorModbus, ModoOperacionModbus
-            )
-            
-            # Crear manejador
-            manejador = ManejadorModbus(ModoOperacionModbus.SOLO_SERVIDOR)
-            
-            # Verificar propiedades
-            assert hasattr(manejador, 'modo_operacion')
-            assert hasattr(manejador, 'estadisticas')
-            
-            # Verificar métodos
-            assert hasattr(manejador, 'iniciar')
-            assert hasattr(manejador, 'detener')
-            assert hasattr(manejador, 'obtener_estado_completo')
-            
-            return True
-        except Exception as e:
-            print(f"      Error: {e}")
-            return False
+            funcion()
+        finally:
+            self.duraciones[nombre] = time.perf_counter_ns() - inicio
             
     def mostrar_resumen(self, total: int, exitosas: int):
         """Mostrar resumen de las pruebas."""
-        fin_tiempo = datetime.now()
-        duracion = fin_tiempo - self.inicio_tiempo
+        duracion_s = (time.perf_counter_ns() - self.inicio_perf) / 1e9
         
         print()
         print("=" * 70)
@@ -442,7 +579,11 @@ class TestModulo1:
         print(f"Pruebas exitosas: {exitosas}")
         print(f"Pruebas fallidas: {total - exitosas}")
         print(f"Porcentaje éxito: {(exitosas/total)*100:.1f}%")
-        print(f"Duración: {duracion.total_seconds():.2f} segundos")
+        print(f"Duración: {duracion_s:.2f} segundos")
+        
+        if self.duraciones:
+            mas_lenta = max(self.duraciones, key=self.duraciones.get)
+            print(f"Prueba más lenta: {mas_lenta} ({self.duraciones[mas_lenta] / 1e6:.1f} ms)")
         
         if exitosas == total:
             print("\n🎉 ¡TODAS LAS PRUEBAS PASARON! El Módulo 1 está funcionando correctamente.")
@@ -452,22 +593,23 @@ class TestModulo1:
         # Mostrar errores si los hay
         if self.errores:
             print("\n❌ ERRORES DETALLADOS:")
-            for nombre, error, traceback_str in self.errores:
+            for nombre, error, info_excepcion in self.errores:
                 print(f"\n{nombre}:")
                 print(f"  Error: {error}")
                 if "--verbose" in sys.argv:
-                    print(f"  Traceback:\n{traceback_str}")
+                    print(f"  Traceback:\n{''.join(traceback.format_exception(*info_excepcion))}")
                     
         print("\n" + "=" * 70)
 
 def main():
     """Función principal para ejecutar las pruebas."""
-    tester = TestModulo1()
+    tester = EjecutorModulo1()
     
     # Verificar argumentos
     if "--help" in sys.argv or "-h" in sys.argv:
-        print("Uso: python test_modulo1.py [--verbose]")
+        print("Uso: python test_modulo1.py [--verbose] [--with-db]")
         print("  --verbose: Mostrar tracebacks completos de errores")
+        print("  --with-db: Incluir la prueba de conexión a base de datos")
         return
         
     # Ejecutar pruebas
@@ -11,27 +11,71 @@ Versión: 2.0.0
 
 import sys
 import os
-import time
+import socket
 import threading
+from enum import IntEnum
+from types import MappingProxyType
 from typing import Dict, Any
 
 # Agregar path del sistema
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+# Cliente Modbus externo con el que se prueba el servidor
+from pymodbus.client import ModbusTcpClient
+
 # Importar componentes del sistema
-from protocolos.modbus.servidor_modbus_tcp_real import ServidorModbusTCPReal
+from protocolos.modbus.servidor_modbus_tcp_real import ServidorModbusTCPReal, configurar_socket_cliente
 from protocolos.modbus.cliente_modbus import ClienteModbus
 
+# Configuración de prueba en puerto alternativo para no interferir (solo lectura)
+CONFIG_PRUEBA = MappingProxyType({
+    'ip': '127.0.0.1',
+    'puerto': 5502,
+    'timeout': 5,
+    'id_esclavo': 1
+})
+
+# Tiempo máximo de espera a que el servidor ejecute un callback de escritura (s)
+ESPERA_MAXIMA_CALLBACK = 2.0
+
+# Input registers que se leen de una vez (cubre los primeros 10 y la temperatura en 10)
+REGISTROS_SNAPSHOT = 32
+
+class EstadoPrueba(IntEnum):
+    """Resultado de una prueba en ProbadorServidorTCP.resultados_pruebas."""
+    EXITOSA = 1
+    FALLIDA = 2
+    ERROR = 3
+
 class ProbadorServidorTCP:
     """
     Clase para probar el servidor Modbus TCP de forma integral.
     """
     
+    # Pruebas en orden de ejecución (comparten servidor y cliente): (nombre, método)
+    PRUEBAS = (
+        ("Inicialización del servidor", "_test_inicializacion_servidor"),
+        ("Arranque del servidor TCP", "_test_arranque_servidor"),
+        ("Arranque repetido", "_test_arranque_repetido"),
+        ("Verificación de puerto", "_test_verificacion_puerto"),
+        ("Conexión de cliente", "_test_conexion_cliente"),
+        ("Lectura de Input Registers", "_test_lectura_input_registers"),
+        ("Lectura de Holding Registers", "_test_lectura_holding_registers"),
+        ("Escritura de Holding Registers", "_test_escritura_holding_registers"),
+        ("Callbacks de escritura", "_test_callbacks_escritura"),
+        ("Actualización de datos", "_test_actualizacion_datos"),
+        ("Parada del servidor", "_test_parada_servidor"),
+        ("Puerto liberado tras la parada", "_test_puerto_liberado")
+    )
+    
     def __init__(self):
         """Inicializar probador."""
         self.servidor = None
         self.cliente_prueba = None
-        self.resultados_pruebas = {}
+        # nombre -> (EstadoPrueba, detalle del error o "")
+        self.resultados_pruebas: Dict[str, tuple] = {}
+        # Input registers leídos en bloque por la prueba de lectura; se reutilizan después
+        self._snapshot_input = None
         
     def ejecutar_todas_las_pruebas(self) -> bool:
         """
@@ -44,55 +88,34 @@ class ProbadorServidorTCP:
         print("🧪 PRUEBAS DEL SERVIDOR MODBUS TCP REAL")
         print("=" * 70)
         
-        pruebas = [
-            ("Inicialización del servidor", self._test_inicializacion_servidor),
-            ("Arranque del servidor TCP", self._test_arranque_servidor),
-            ("Verificación de puerto", self._test_verificacion_puerto),
-            ("Conexión de cliente", self._test_conexion_cliente),
-            ("Lectura de Input Registers", self._test_lectura_input_registers),
-            ("Lectura de Holding Registers", self._test_lectura_holding_registers),
-            ("Escritura de Holding Registers", self._test_escritura_holding_registers),
-            ("Callbacks de escritura", self._test_callbacks_escritura),
-            ("Actualización de datos", self._test_actualizacion_datos),
-            ("Parada del servidor", self._test_parada_servidor)
-        ]
-        
-        total_pruebas = len(pruebas)
+        total_pruebas = len(self.PRUEBAS)
         pruebas_exitosas = 0
         
-        for nombre, funcion_prueba in pruebas:
+        for nombre, nombre_metodo in self.PRUEBAS:
             print(f"\n🔍 Ejecutando: {nombre}...")
             try:
-                resultado = funcion_prueba()
+                resultado = getattr(self, nombre_metodo)()
                 if resultado:
                     print(f"   ✅ {nombre}: EXITOSA")
                     pruebas_exitosas += 1
-                    self.resultados_pruebas[nombre] = "EXITOSA"
+                    self.resultados_pruebas[nombre] = (EstadoPrueba.EXITOSA, "")
                 else:
                     print(f"   ❌ {nombre}: FALLIDA")
-                    self.resultados_pruebas[nombre] = "FALLIDA"
+                    self.resultados_pruebas[nombre] = (EstadoPrueba.FALLIDA, "")
             except Exception as e:
-                print(f"   💥 {nombre}: ERROR - {str(e)}")
-                self.resultados_pruebas[nombre] = f"ERROR: {str(e)}"
+                print(f"   💥 {nombre}: ERROR - {e}")
+                self.resultados_pruebas[nombre] = (EstadoPrueba.ERROR, str(e))
                 
         # Mostrar resumen
-        self._mostrar_resumen(total_pruebas, pruebas_exitosas)
+        self._mostrar_resumen(total_pruebas, pruebas_exitosas, detallado="--verbose" in sys.argv)
         
         return pruebas_exitosas == total_pruebas
         
     def _test_inicializacion_servidor(self) -> bool:
         """Probar inicialización del servidor."""
         try:
-            # Configuración de prueba en puerto alternativo
-            config_prueba = {
-                'ip': '127.0.0.1',
-                'puerto': 5502,  # Puerto alternativo para no interferir
-                'timeout': 5,
-                'id_esclavo': 1
-            }
-            
-            self.servidor = ServidorModbusTCPReal(config_prueba)
-            print(f"      ✓ Servidor inicializado en {config_prueba['ip']}:{config_prueba['puerto']}")
+            self.servidor = ServidorModbusTCPReal(CONFIG_PRUEBA)
+            print(f"      ✓ Servidor inicializado en {CONFIG_PRUEBA['ip']}:{CONFIG_PRUEBA['puerto']}")
             return True
             
         except Exception as e:
@@ -108,9 +131,8 @@ class ProbadorServidorTCP:
             resultado = self.servidor.conectar()
             
             if resultado.exitoso:
+                # conectar() solo informa éxito cuando el puerto ya acepta conexiones
                 print(f"      ✓ Servidor TCP iniciado: {resultado.mensaje}")
-                # Esperar un momento para que el servidor se estabilice
-                time.sleep(2)
                 return True
             else:
                 print(f"      ✗ Error iniciando servidor: {resultado.mensaje}")
@@ -120,23 +142,41 @@ class ProbadorServidorTCP:
             print(f"      ✗ Excepción iniciando servidor: {e}")
             return False
             
+    def _test_arranque_repetido(self) -> bool:
+        """Probar que un segundo conectar() no reemplaza el servidor en marcha."""
+        try:
+            if not self.servidor:
+                return False
+                
+            hilo_original = self.servidor.hilo_servidor
+            resultado = self.servidor.conectar()
+            
+            if resultado.exitoso and self.servidor.hilo_servidor is hilo_original:
+                print(f"      ✓ Servidor ya en marcha conservado: {resultado.mensaje}")
+                return True
+            else:
+                print(f"      ✗ Segundo arranque: {resultado.mensaje}")
+                return False
+                
+        except Exception as e:
+            print(f"      ✗ Excepción en arranque repetido: {e}")
+            return False
+            
     def _test_verificacion_puerto(self) -> bool:
         """Verificar que el puerto esté escuchando."""
         try:
-            import socket
-            
             sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             sock.settimeout(5)
             
             # Intentar conectar al puerto
-            resultado = sock.connect_ex(('127.0.0.1', 5502))
+            resultado = sock.connect_ex((CONFIG_PRUEBA['ip'], CONFIG_PRUEBA['puerto']))
             sock.close()
             
             if resultado == 0:
-                print(f"      ✓ Puerto 5502 está escuchando")
+                print(f"      ✓ Puerto {CONFIG_PRUEBA['puerto']} está escuchando")
                 return True
             else:
-                print(f"      ✗ Puerto 5502 no está disponible (código: {resultado})")
+                print(f"      ✗ Puerto {CONFIG_PRUEBA['puerto']} no está disponible (código: {resultado})")
                 return False
                 
         except Exception as e:
@@ -146,12 +186,10 @@ class ProbadorServidorTCP:
     def _test_conexion_cliente(self) -> bool:
         """Probar conexión de cliente Modbus."""
         try:
-            from pymodbus.client import ModbusTcpClient
-            
             # Crear cliente de prueba
             self.cliente_prueba = ModbusTcpClient(
-                host='127.0.0.1',
-                port=5502,
+                host=CONFIG_PRUEBA['ip'],
+                port=CONFIG_PRUEBA['puerto'],
                 timeout=5
             )
             
@@ -159,6 +197,8 @@ class ProbadorServidorTCP:
             conectado = self.cliente_prueba.connect()
             
             if conectado:
+                # Una sola conexión para toda la suite: sin Nagle en las peticiones pequeñas
+                configurar_socket_cliente(self.cliente_prueba.socket)
                 print(f"      ✓ Cliente conectado exitosamente")
                 return True
             else:
@@ -175,15 +215,17 @@ class ProbadorServidorTCP:
             if not self.cliente_prueba:
                 return False
                 
-            # Leer primeros 10 input registers
+            # Leer en una sola petición el bloque que usan también las pruebas posteriores
             respuesta = self.cliente_prueba.read_input_registers(
                 address=0,
-                count=10,
+                count=REGISTROS_SNAPSHOT,
                 slave=1
             )
             
-            if hasattr(respuesta, 'registers') and respuesta.registers:
-                valores = respuesta.registers
+            registros = getattr(respuesta, 'registers', None)
+            if registros:
+                self._snapshot_input = registros
+                valores = registros[:10]
                 print(f"      ✓ Input Registers leídos: {valores[:5]}... (mostrando 5 primeros)")
                 
                 # Verificar que hay datos sensatos
@@ -213,8 +255,8 @@ class ProbadorServidorTCP:
                 slave=1
             )
             
-            if hasattr(respuesta, 'registers') and respuesta.registers:
-                valores = respuesta.registers
+            valores = getattr(respuesta, 'registers', None)
+            if valores:
                 print(f"      ✓ Holding Registers leídos: {valores[:5]}... (mostrando 5 primeros)")
                 
                 if len(valores) == 10:
@@ -244,7 +286,8 @@ class ProbadorServidorTCP:
                 slave=1
             )
             
-            if not (hasattr(respuesta, 'isError') and respuesta.isError()):
+            es_error = getattr(respuesta, 'isError', None)
+            if not (es_error and es_error()):
                 print(f"      ✓ Escritura exitosa en registro 5 con valor {valor_prueba}")
                 
                 # Verificar que se escribió correctamente
@@ -254,8 +297,9 @@ class ProbadorServidorTCP:
                     slave=1
                 )
                 
-                if hasattr(respuesta_lectura, 'registers') and respuesta_lectura.registers:
-                    valor_leido = respuesta_lectura.registers[0]
+                registros = getattr(respuesta_lectura, 'registers', None)
+                if registros:
+                    valor_leido = registros[0]
                     if valor_leido == valor_prueba:
                         print(f"      ✓ Verificación exitosa: valor leído = {valor_leido}")
                         return True
@@ -280,13 +324,14 @@ class ProbadorServidorTCP:
                 return False
                 
             # Variable para capturar callback
-            callback_ejecutado = {'valor': False, 'direccion': None, 'valor_escrito': None}
+            callback_ejecutado = {'direccion': None, 'valor_escrito': None}
+            callback_disparado = threading.Event()
             
             def callback_prueba(direccion, valor):
-                callback_ejecutado['valor'] = True
                 callback_ejecutado['direccion'] = direccion
                 callback_ejecutado['valor_escrito'] = valor
                 print(f"      ✓ Callback ejecutado: registro {direccion} = {valor}")
+                callback_disparado.set()
                 
             # Agregar callback temporal
             self.servidor.agregar_callback_escritura(99, callback_prueba)
@@ -299,10 +344,8 @@ class ProbadorServidorTCP:
                 slave=1
             )
             
-            # Esperar un momento para que se ejecute el callback
-            time.sleep(1)
-            
-            if callback_ejecutado['valor']:
+            # Esperar a que el servidor ejecute el callback (sin pausa fija)
+            if callback_disparado.wait(timeout=ESPERA_MAXIMA_CALLBACK):
                 if (callback_ejecutado['direccion'] == 99 and 
                     callback_ejecutado['valor_escrito'] == valor_callback):
                     print(f"      ✓ Callback funcionó correctamente")
@@ -324,33 +367,35 @@ class ProbadorServidorTCP:
             if not self.cliente_prueba or not self.servidor:
                 return False
                 
-            # Leer valor inicial de temperatura (registro 10)
-            respuesta_inicial = self.cliente_prueba.read_input_registers(
-                address=10,
-                count=1,
-                slave=1
-            )
+            # Valor inicial de temperatura (registro 10): del bloque ya leído si lo hay
+            if self._snapshot_input is not None:
+                registros_iniciales = self._snapshot_input[10:11]
+            else:
+                respuesta_inicial = self.cliente_prueba.read_input_registers(
+                    address=10,
+                    count=1,
+                    slave=1
+                )
+                registros_iniciales = getattr(respuesta_inicial, 'registers', None)
             
-            if hasattr(respuesta_inicial, 'registers'):
-                valor_inicial = respuesta_inicial.registers[0]
+            if registros_iniciales:
+                valor_inicial = registros_iniciales[0]
                 print(f"      ✓ Valor inicial temperatura: {valor_inicial}")
                 
                 # Actualizar dato en el servidor
                 nuevo_valor = 275  # 27.5°C
                 self.servidor.actualizar_dato_sistema('temperatura_promedio', nuevo_valor)
                 
-                # Esperar un momento
-                time.sleep(1)
-                
-                # Leer valor actualizado
+                # Leer valor actualizado (actualizar_dato_sistema escribe el registro de inmediato)
                 respuesta_final = self.cliente_prueba.read_input_registers(
                     address=10,
                     count=1,
                     slave=1
                 )
                 
-                if hasattr(respuesta_final, 'registers'):
-                    valor_final = respuesta_final.registers[0]
+                registros_finales = getattr(respuesta_final, 'registers', None)
+                if registros_finales:
+                    valor_final = registros_finales[0]
                     print(f"      ✓ Valor final temperatura: {valor_final}")
                     
                     if valor_final == nuevo_valor:
@@ -395,32 +440,69 @@ class ProbadorServidorTCP:
             print(f"      ✗ Excepción deteniendo servidor: {e}")
             return False
             
-    def _mostrar_resumen(self, total: int, exitosas: int):
-        """Mostrar resumen de las pruebas."""
-        print("\n" + "=" * 70)
-        print("📊 RESUMEN DE PRUEBAS DEL SERVIDOR MODBUS TCP")
-        print("=" * 70)
-        print(f"Total de pruebas: {total}")
-        print(f"Pruebas exitosas: {exitosas}")
-        print(f"Pruebas fallidas: {total - exitosas}")
-        print(f"Porcentaje éxito: {(exitosas/total)*100:.1f}%")
+    def _test_puerto_liberado(self) -> bool:
+        """Verificar que tras la parada nadie escucha en el puerto."""
+        try:
+            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+                sock.settimeout(1)
+                resultado = sock.connect_ex((CONFIG_PRUEBA['ip'], CONFIG_PRUEBA['puerto']))
+                
+            if resultado != 0:
+                print(f"      ✓ Puerto {CONFIG_PRUEBA['puerto']} liberado")
+                return True
+            else:
+                print(f"      ✗ Puerto {CONFIG_PRUEBA['puerto']} sigue escuchando")
+                return False
+                
+        except Exception as e:
+            print(f"      ✗ Error verificando puerto: {e}")
+            return False
+            
+    def _mostrar_resumen(self, total: int, exitosas: int, detallado: bool = False):
+        """
+        Mostrar resumen de las pruebas (se arma completo y se escribe de una vez).
+        
+        Los totales salen de los contadores del bucle principal; el detalle por
+        prueba solo recorre los resultados si hay fallos o se pide detallado.
+        """
+        lineas = [
+            "\n" + "=" * 70,
+            "📊 RESUMEN DE PRUEBAS DEL SERVIDOR MODBUS TCP",
+            "=" * 70,
+            f"Total de pruebas: {total}",
+            f"Pruebas exitosas: {exitosas}",
+            f"Pruebas fallidas: {total - exitosas}",
+            f"Porcentaje éxito: {(exitosas/total)*100:.1f}%",
+        ]
         
         if exitosas == total:
-            print("\n🎉 ¡TODAS LAS PRUEBAS PASARON!")
-            print("✅ El servidor Modbus TCP está funcionando correctamente")
+            lineas.append("\n🎉 ¡TODAS LAS PRUEBAS PASARON!")
+            lineas.append("✅ El servidor Modbus TCP está funcionando correctamente")
         else:
-            print(f"\n⚠️ {total - exitosas} pruebas fallaron")
-            print("❌ Revisar la configuración del servidor")
+            lineas.append(f"\n⚠️ {total - exitosas} pruebas fallaron")
+            lineas.append("❌ Revisar la configuración del servidor")
             
-        print("\n📋 Resultados detallados:")
-        for nombre, resultado in self.resultados_pruebas.items():
-            estado = "✅" if resultado == "EXITOSA" else "❌"
-            print(f"   {estado} {nombre}: {resultado}")
+        if detallado or exitosas != total:
+            lineas.append("\n📋 Resultados detallados:")
+            for nombre, (estado, detalle) in self.resultados_pruebas.items():
+                if not detallado and estado is EstadoPrueba.EXITOSA:
+                    continue
+                icono = "✅" if estado is EstadoPrueba.EXITOSA else "❌"
+                texto = f"{estado.name}: {detalle}" if detalle else estado.name
+                lineas.append(f"   {icono} {nombre}: {texto}")
             
-        print("\n" + "=" * 70)
+        lineas.append("\n" + "=" * 70)
+        
+        # Una sola escritura: el bloque no se intercala con logs de otros hilos
+        print("\n".join(lineas), flush=True)
 
 def main():
     """Función principal para ejecutar las pruebas."""
+    if "--help" in sys.argv or "-h" in sys.argv:
+        print("Uso: python test_servidor_tcp_modbus.py [--verbose]")
+        print("  --verbose: Listar el resultado de cada prueba aunque todas pasen")
+        return 0
+        
     print("Iniciando pruebas del servidor Modbus TCP real...")
     
     probador = ProbadorServidorTCP()
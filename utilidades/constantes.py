@@ -9,7 +9,9 @@ Autor: Sistema BMS Demo
 Versión: 1.0.0
 """
 
-from enum import Enum
+import re
+from enum import Enum, IntEnum
+from types import MappingProxyType
 
 # =============================================================================
 # INFORMACIÓN DEL SISTEMA
@@ -22,7 +24,7 @@ COPYRIGHT = "© 2024 Sistema BMS Demo"
 # =============================================================================
 # CÓDIGOS DE RESPUESTA Y ESTADOS
 # =============================================================================
-class CodigoRespuesta(Enum):
+class CodigoRespuesta(IntEnum):
     """Códigos de respuesta estándar del sistema."""
     EXITO = 200
     CREADO = 201
@@ -36,7 +38,7 @@ class CodigoRespuesta(Enum):
     SERVICIO_NO_DISPONIBLE = 503
     TIMEOUT = 504
 
-class CodigoErrorModbus(Enum):
+class CodigoErrorModbus(IntEnum):
     """Códigos de error específicos de Modbus."""
     FUNCION_ILEGAL = 1
     DIRECCION_DATOS_ILEGAL = 2
@@ -173,7 +175,7 @@ class TipoAlerta(Enum):
     ERROR = "error"
     CRITICAL = "critical"
 
-class PrioridadAlerta(Enum):
+class PrioridadAlerta(IntEnum):
     """Prioridades de alertas."""
     BAJA = 1
     MEDIA = 2
@@ -272,12 +274,12 @@ class ConfigSimulacion:
 # PATRONES DE VALIDACIÓN
 # =============================================================================
 class PatronesValidacion:
-    """Patrones regex para validación."""
-    IP_ADDRESS = r"^(?:(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.){3}(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)$"
-    MAC_ADDRESS = r"^([0-9A-Fa-f]{2}[:-]){5}([0-9A-Fa-f]{2})$"
-    EMAIL = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-    NUMERO_SERIE = r"^[A-Z0-9]{8,20}$"
-    VERSION = r"^\d+\.\d+\.\d+$"
+    """Patrones regex para validación (compilados al importar; el texto está en .pattern)."""
+    IP_ADDRESS = re.compile(r"^(?:(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.){3}(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)$")
+    MAC_ADDRESS = re.compile(r"^([0-9A-Fa-f]{2}[:-]){5}([0-9A-Fa-f]{2})$")
+    EMAIL = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+    NUMERO_SERIE = re.compile(r"^[A-Z0-9]{8,20}$")
+    VERSION = re.compile(r"^\d+\.\d+\.\d+$")
 
 # =============================================================================
 # CONFIGURACIÓN DE MONITOREO
@@ -295,7 +297,8 @@ class ConfigMonitoreo:
 # =============================================================================
 # DICCIONARIOS DE MAPEO
 # =============================================================================
-MAPEO_TIPOS_DISPOSITIVO = {
+# Vistas de solo lectura: se comparten entre hilos y módulos sin copias defensivas
+MAPEO_TIPOS_DISPOSITIVO = MappingProxyType({
     "camera": "camara",
     "door_controller": "controlador",
     "sensor": "sensor",
@@ -303,17 +306,17 @@ MAPEO_TIPOS_DISPOSITIVO = {
     "server": "servidor",
     "switch": "switch",
     "access_point": "access_point"
-}
+})
 
-MAPEO_ESTADOS_DISPOSITIVO = {
+MAPEO_ESTADOS_DISPOSITIVO = MappingProxyType({
     "up": "online",
     "down": "offline",
     "unknown": "desconocido",
     "maintenance": "mantenimiento",
     "error": "error"
-}
+})
 
-MAPEO_UNIDADES_MEDIDA = {
+MAPEO_UNIDADES_MEDIDA = MappingProxyType({
     "celsius": "°C",
     "fahrenheit": "°F",
     "kelvin": "K",
@@ -326,7 +329,41 @@ MAPEO_UNIDADES_MEDIDA = {
     "ampere": "A",
     "watt": "W",
     "kilowatt": "kW"
-}
+})
+
+# Mensaje por código de alerta (ver CodigoAlerta)
+MAPEO_MENSAJES_ERROR = MappingProxyType({
+    "DEV_001": "Dispositivo fuera de línea",
+    "SEN_001": "Sensor fuera de rango",
+    "COM_001": "Comunicación perdida",
+    "SYS_001": "Memoria insuficiente",
+    "SYS_002": "Disco lleno",
+    "ENV_001": "Temperatura alta",
+    "ENV_002": "Humedad alta",
+    "ENV_003": "Presión anormal",
+    "PWR_001": "Batería UPS baja",
+    "PWR_002": "UPS funcionando con batería"
+})
+
+# Rango típico (mínimo, máximo) por tipo de sensor
+RANGOS_POR_TIPO_SENSOR = MappingProxyType({
+    "temperatura": (RangosSensores.TEMPERATURA_MIN, RangosSensores.TEMPERATURA_MAX),
+    "humedad": (RangosSensores.HUMEDAD_MIN, RangosSensores.HUMEDAD_MAX),
+    "presion": (RangosSensores.PRESION_MIN, RangosSensores.PRESION_MAX),
+    "luminosidad": (RangosSensores.LUMINOSIDAD_MIN, RangosSensores.LUMINOSIDAD_MAX),
+    "voltaje": (RangosSensores.VOLTAJE_MIN, RangosSensores.VOLTAJE_MAX),
+    "corriente": (RangosSensores.CORRIENTE_MIN, RangosSensores.CORRIENTE_MAX)
+})
+
+# Decimales recomendados por tipo de sensor
+PRECISION_POR_TIPO_SENSOR = MappingProxyType({
+    "temperatura": PrecisionDecimal.TEMPERATURA,
+    "humedad": PrecisionDecimal.HUMEDAD,
+    "presion": PrecisionDecimal.PRESION,
+    "voltaje": PrecisionDecimal.VOLTAJE,
+    "corriente": PrecisionDecimal.CORRIENTE,
+    "energia": PrecisionDecimal.ENERGIA
+})
 
 # =============================================================================
 # FUNCIONES DE UTILIDAD PARA CONSTANTES
@@ -341,19 +378,7 @@ def obtener_mensaje_error(codigo: str) -> str:
     Returns:
         Mensaje de error correspondiente
     """
-    mensajes = {
-        "DEV_001": "Dispositivo fuera de línea",
-        "SEN_001": "Sensor fuera de rango",
-        "COM_001": "Comunicación perdida",
-        "SYS_001": "Memoria insuficiente",
-        "SYS_002": "Disco lleno",
-        "ENV_001": "Temperatura alta",
-        "ENV_002": "Humedad alta",
-        "ENV_003": "Presión anormal",
-        "PWR_001": "Batería UPS baja",
-        "PWR_002": "UPS funcionando con batería"
-    }
-    return mensajes.get(codigo, "Error desconocido")
+    return MAPEO_MENSAJES_ERROR.get(codigo, "Error desconocido")
 
 def validar_rango_sensor(tipo_sensor: str, valor: float) -> bool:
     """
@@ -366,17 +391,9 @@ def validar_rango_sensor(tipo_sensor: str, valor: float) -> bool:
     Returns:
         True si está en rango, False si no
     """
-    rangos = {
-        "temperatura": (RangosSensores.TEMPERATURA_MIN, RangosSensores.TEMPERATURA_MAX),
-        "humedad": (RangosSensores.HUMEDAD_MIN, RangosSensores.HUMEDAD_MAX),
-        "presion": (RangosSensores.PRESION_MIN, RangosSensores.PRESION_MAX),
-        "luminosidad": (RangosSensores.LUMINOSIDAD_MIN, RangosSensores.LUMINOSIDAD_MAX),
-        "voltaje": (RangosSensores.VOLTAJE_MIN, RangosSensores.VOLTAJE_MAX),
-        "corriente": (RangosSensores.CORRIENTE_MIN, RangosSensores.CORRIENTE_MAX)
-    }
-    
-    if tipo_sensor in rangos:
-        min_val, max_val = rangos[tipo_sensor]
+    rango = RANGOS_POR_TIPO_SENSOR.get(tipo_sensor)
+    if rango is not None:
+        min_val, max_val = rango
         return min_val <= valor <= max_val
     
     return True  # Si no conocemos el tipo, asumimos que es válido
@@ -391,16 +408,7 @@ def obtener_precision_decimal(tipo_sensor: str) -> int:
     Returns:
         Número de decimales recomendado
     """
-    precisiones = {
-        "temperatura": PrecisionDecimal.TEMPERATURA,
-        "humedad": PrecisionDecimal.HUMEDAD,
-        "presion": PrecisionDecimal.PRESION,
-        "voltaje": PrecisionDecimal.VOLTAJE,
-        "corriente": PrecisionDecimal.CORRIENTE,
-        "energia": PrecisionDecimal.ENERGIA
-    }
-    
-    return precisiones.get(tipo_sensor, 2)  # 2 decimales por defecto
+    return PRECISION_POR_TIPO_SENSOR.get(tipo_sensor, 2)  # 2 decimales por defecto
 
 if __name__ == "__main__":
     # Prueba de constantes
@@ -9,16 +9,79 @@ Autor: Sistema BMS Demo
 Versión: 1.0.0
 """
 
+import array
 import json
+import re
 import struct
-from typing import Any, Dict, List, Union, Optional, Tuple
+import sys
+import time
+from dataclasses import fields, is_dataclass
+from functools import lru_cache
+from typing import Any, Dict, List, Union, Optional, Sequence, Tuple
 from datetime import datetime, timezone
 from enum import Enum
-import math
 
 # Importar constantes
 from utilidades.constantes import MAPEO_TIPOS_DISPOSITIVO, MAPEO_ESTADOS_DISPOSITIVO, FormatoDatos
 
+# Decodificador JSON nativo (opcional); sin él se usa el módulo json estándar
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Secuencias de 19 o más dígitos: orjson convierte a float, sin error, los enteros
+# fuera de int64/uint64, así que esos textos se decodifican con json estándar
+_DIGITOS_LARGOS = re.compile(r'\d{19}')
+
+# Orden de bytes del host: array('H') usa el orden nativo y Modbus es big-endian
+HOST_BIG_ENDIAN = sys.byteorder == "big"
+
+# Formatos struct precompilados para las conversiones de 32 bits de Modbus
+_STRUCT_F32_BE = struct.Struct('>f')
+_STRUCT_2U16_BE = struct.Struct('>HH')
+
+# Conversión de unidades: cada unidad como transformación afín respecto a la
+# unidad intermedia; las tablas combinan origen y destino en un solo factor
+_TEMPERATURA_A_CELSIUS = {"C": (1.0, 0.0), "F": (5 / 9, -32 * 5 / 9), "K": (1.0, -273.15)}
+_CELSIUS_A_TEMPERATURA = {"C": (1.0, 0.0), "F": (9 / 5, 32.0), "K": (1.0, 273.15)}
+_CONVERSION_TEMPERATURA = {
+    (origen, destino): (escala_o * escala_d, desplazamiento_o * escala_d + desplazamiento_d)
+    for origen, (escala_o, desplazamiento_o) in _TEMPERATURA_A_CELSIUS.items()
+    for destino, (escala_d, desplazamiento_d) in _CELSIUS_A_TEMPERATURA.items()
+}
+
+_PRESION_A_PASCAL = {"pa": 1.0, "mbar": 100.0, "bar": 100000.0}
+_CONVERSION_PRESION = {
+    (origen, destino): factor_o / factor_d
+    for origen, factor_o in _PRESION_A_PASCAL.items()
+    for destino, factor_d in _PRESION_A_PASCAL.items()
+}
+
+# Especificaciones de formato binario para los anchos de registro habituales
+_FORMATOS_BINARIO = {8: '08b', 16: '016b', 32: '032b'}
+
+# Especificaciones de formato de coma fija para los decimales habituales
+_FORMATOS_DECIMALES = {decimales: f'.{decimales}f' for decimales in range(7)}
+
+def _factor_temperatura(unidad_origen: str, unidad_destino: str) -> Tuple[float, float]:
+    """Resolver (escala, desplazamiento) de un par de unidades; las desconocidas valen como Celsius."""
+    origen = unidad_origen.upper()
+    destino = unidad_destino.upper()
+    return _CONVERSION_TEMPERATURA[
+        origen if origen in _TEMPERATURA_A_CELSIUS else "C",
+        destino if destino in _TEMPERATURA_A_CELSIUS else "C"
+    ]
+
+def _factor_presion(unidad_origen: str, unidad_destino: str) -> float:
+    """Resolver el factor de un par de unidades; las desconocidas valen como Pascal."""
+    origen = unidad_origen.lower()
+    destino = unidad_destino.lower()
+    return _CONVERSION_PRESION[
+        origen if origen in _PRESION_A_PASCAL else "pa",
+        destino if destino in _PRESION_A_PASCAL else "pa"
+    ]
+
 class TipoConversion(Enum):
     """Tipos de conversión disponibles."""
     TEMPERATURA = "temperatura"
@@ -153,14 +216,10 @@ class ConvertidorBMS:
         Returns:
             Valor float de 32 bits
         """
+        # Reinterpretar las dos palabras de 16 bits directamente como float
         if orden_bytes == "big":
-            valor_32bit = (registro_alto << 16) | registro_bajo
-        else:
-            valor_32bit = (registro_bajo << 16) | registro_alto
-            
-        # Convertir a float usando struct
-        bytes_valor = struct.pack('>I', valor_32bit)
-        return struct.unpack('>f', bytes_valor)[0]
+            return _STRUCT_F32_BE.unpack(_STRUCT_2U16_BE.pack(registro_alto, registro_bajo))[0]
+        return _STRUCT_F32_BE.unpack(_STRUCT_2U16_BE.pack(registro_bajo, registro_alto))[0]
         
     @staticmethod
     def float_a_registros_modbus(valor_float: float, orden_bytes: str = "big") -> Tuple[int, int]:
@@ -174,18 +233,94 @@ class ConvertidorBMS:
         Returns:
             Tupla con (registro_alto, registro_bajo)
         """
-        # Convertir float a bytes
-        bytes_valor = struct.pack('>f', valor_float)
-        valor_32bit = struct.unpack('>I', bytes_valor)[0]
+        # Reinterpretar el float directamente como dos palabras de 16 bits
+        palabra_alta, palabra_baja = _STRUCT_2U16_BE.unpack(_STRUCT_F32_BE.pack(valor_float))
         
         if orden_bytes == "big":
-            registro_alto = (valor_32bit >> 16) & 0xFFFF
-            registro_bajo = valor_32bit & 0xFFFF
-        else:
-            registro_bajo = (valor_32bit >> 16) & 0xFFFF
-            registro_alto = valor_32bit & 0xFFFF
+            return palabra_alta, palabra_baja
+        return palabra_baja, palabra_alta
+        
+    @staticmethod
+    def registros_modbus_a_floats(registros: Sequence[int], orden_bytes: str = "big") -> List[float]:
+        """
+        Convertir un bloque de registros Modbus a floats de 32 bits de una sola vez.
+        
+        Equivale a llamar registros_modbus_a_float por cada par de registros,
+        pero decodifica todo el bloque con una única llamada a struct.
+        
+        Args:
+            registros: Registros consecutivos tal como llegan del equipo (pares alto/bajo)
+            orden_bytes: Orden de bytes ("big" o "little")
             
-        return registro_alto, registro_bajo
+        Returns:
+            Lista con un float por cada par de registros
+        """
+        if len(registros) % 2:
+            raise ValueError(f"Se requiere un número par de registros: {len(registros)}")
+            
+        palabras = array.array('H', registros)
+        if orden_bytes != "big":
+            palabras[0::2], palabras[1::2] = palabras[1::2], palabras[0::2]
+        if not HOST_BIG_ENDIAN:
+            palabras.byteswap()
+            
+        return list(struct.unpack(f'>{len(palabras) // 2}f', palabras))
+        
+    @staticmethod
+    def floats_a_registros_modbus(valores: Sequence[float], orden_bytes: str = "big") -> List[int]:
+        """
+        Convertir varios floats a registros Modbus de 16 bits de una sola vez.
+        
+        Inverso de registros_modbus_a_floats: codifica todo el bloque con una
+        única llamada a struct.
+        
+        Args:
+            valores: Valores float a convertir
+            orden_bytes: Orden de bytes ("big" o "little")
+            
+        Returns:
+            Lista de registros (dos por valor, en el orden indicado)
+        """
+        palabras = array.array('H')
+        palabras.frombytes(struct.pack(f'>{len(valores)}f', *valores))
+        if not HOST_BIG_ENDIAN:
+            palabras.byteswap()
+        if orden_bytes != "big":
+            palabras[0::2], palabras[1::2] = palabras[1::2], palabras[0::2]
+            
+        return palabras.tolist()
+        
+    @staticmethod
+    def buffer_registros_a_floats(buffer: Union[bytes, bytearray, memoryview]) -> List[float]:
+        """
+        Decodificar floats de 32 bits directamente desde un buffer de registros.
+        
+        El buffer contiene los registros tal como viajan en la trama Modbus
+        (big-endian, palabra alta primero); se lee en su sitio sin separarlo
+        en pares de registros.
+        
+        Args:
+            buffer: Bytes de los registros (4 bytes por float)
+            
+        Returns:
+            Lista de floats decodificados
+        """
+        if len(buffer) % 4:
+            raise ValueError(f"El buffer debe contener múltiplos de 4 bytes: {len(buffer)}")
+        return list(struct.unpack_from(f'>{len(buffer) // 4}f', buffer))
+        
+    @staticmethod
+    def floats_a_buffer_registros(valores: Sequence[float]) -> bytes:
+        """
+        Codificar floats como buffer de registros Modbus (inverso de buffer_registros_a_floats).
+        
+        Args:
+            valores: Valores float a convertir
+            
+        Returns:
+            Bytes big-endian listos para la trama (4 bytes por float)
+        """
+        return struct.pack(f'>{len(valores)}f', *valores)
         
     @staticmethod
     def int32_a_registros_modbus(valor_int: int) -> Tuple[int, int]:
@@ -229,6 +364,19 @@ class ConvertidorBMS:
         """
         return int(fecha_hora.timestamp())
         
+    @staticmethod
+    def timestamp_unix_actual() -> int:
+        """
+        Obtener el timestamp Unix actual sin construir un datetime.
+        
+        Equivale a datetime_a_timestamp_unix(datetime.now()) leyendo
+        directamente el reloj del sistema.
+        
+        Returns:
+            Timestamp Unix (segundos desde epoch)
+        """
+        return time.time_ns() // 1_000_000_000
+        
     @staticmethod
     def timestamp_unix_a_datetime(timestamp: int) -> datetime:
         """
@@ -254,7 +402,11 @@ class ConvertidorBMS:
         Returns:
             Fecha como string
         """
-        if formato is None:
+        if formato is None or formato == FormatoDatos.FECHA_HORA:
+            # Formato por defecto: isoformat evita strftime (sin zona horaria,
+            # años de 4 cifras, para producir exactamente el mismo texto)
+            if fecha_hora.tzinfo is None and fecha_hora.year >= 1000:
+                return fecha_hora.isoformat(sep=' ', timespec='seconds')
             formato = FormatoDatos.FECHA_HORA
         return fecha_hora.strftime(formato)
         
@@ -270,15 +422,27 @@ class ConvertidorBMS:
         Returns:
             Objeto datetime
         """
-        if formato is None:
+        if formato is None or formato == FormatoDatos.FECHA_HORA:
+            # Formato por defecto "AAAA-MM-DD HH:MM:SS": fromisoformat evita
+            # strptime; cualquier otra forma sigue por strptime
+            if (len(fecha_string) == 19 and fecha_string[4] == '-' and fecha_string[7] == '-'
+                    and fecha_string[10] == ' ' and fecha_string[13] == ':' and fecha_string[16] == ':'):
+                try:
+                    return datetime.fromisoformat(fecha_string)
+                except ValueError:
+                    pass
             formato = FormatoDatos.FECHA_HORA
         return datetime.strptime(fecha_string, formato)
         
     @staticmethod
+    @lru_cache(maxsize=512)
     def normalizar_tipo_dispositivo(tipo: str) -> str:
         """
         Normalizar tipo de dispositivo usando mapeo.
         
+        El vocabulario es pequeño y se repite en toda la flota: los resultados
+        se memorizan (el mapeo es de solo lectura).
+        
         Args:
             tipo: Tipo de dispositivo original
             
@@ -289,9 +453,10 @@ class ConvertidorBMS:
         return MAPEO_TIPOS_DISPOSITIVO.get(tipo_lower, tipo_lower)
         
     @staticmethod
+    @lru_cache(maxsize=512)
     def normalizar_estado_dispositivo(estado: str) -> str:
         """
-        Normalizar estado de dispositivo usando mapeo.
+        Normalizar estado de dispositivo usando mapeo (resultados memorizados).
         
         Args:
             estado: Estado original
@@ -314,22 +479,33 @@ class ConvertidorBMS:
         Returns:
             JSON string
         """
+        # Misma salida que json.dumps(..., ensure_ascii=False, default=_json_serializer)
+        # con codificadores creados una sola vez
         if pretty:
-            return json.dumps(diccionario, indent=2, ensure_ascii=False, default=ConvertidorBMS._json_serializer)
+            return _CODIFICADOR_JSON_INDENTADO.encode(diccionario)
         else:
-            return json.dumps(diccionario, ensure_ascii=False, default=ConvertidorBMS._json_serializer)
+            return _CODIFICADOR_JSON.encode(diccionario)
             
     @staticmethod
     def json_a_diccionario(json_string: str) -> Dict[str, Any]:
         """
         Convertir JSON string a diccionario.
         
+        Con orjson instalado se usa para decodificar, salvo en los casos en que
+        su resultado difiere de json estándar (NaN/Infinity, enteros de más de
+        64 bits), que se decodifican con json.
+        
         Args:
             json_string: JSON como string
             
         Returns:
             Diccionario Python
         """
+        if orjson is not None and not _DIGITOS_LARGOS.search(json_string):
+            try:
+                return orjson.loads(json_string)
+            except orjson.JSONDecodeError:
+                pass  # NaN/Infinity u otros casos: json estándar decide
         return json.loads(json_string)
         
     @staticmethod
@@ -349,6 +525,9 @@ class ConvertidorBMS:
             return obj.value
         elif hasattr(obj, '__dict__'):
             return obj.__dict__
+        elif is_dataclass(obj) and not isinstance(obj, type):
+            # Dataclasses con __slots__ no tienen __dict__: mismos campos, sin copia profunda
+            return {campo.name: getattr(obj, campo.name) for campo in fields(obj)}
         else:
             return str(obj)
             
@@ -377,7 +556,7 @@ class ConvertidorBMS:
         Returns:
             String binario
         """
-        return format(decimal, f'0{bits}b')
+        return format(decimal, _FORMATOS_BINARIO.get(bits) or f'0{bits}b')
         
     @staticmethod
     def hexadecimal_a_decimal(hexadecimal: str) -> int:
@@ -425,6 +604,24 @@ class ConvertidorBMS:
         """
         return (valor * factor_escala) + offset
         
+    @staticmethod
+    def escalar_valores_sensor(valores: Sequence[float], factor_escala: float, offset: float = 0.0) -> List[float]:
+        """
+        Escalar un bloque de lecturas de sensor con el mismo factor y offset.
+        
+        Equivale a escalar_valor_sensor sobre cada lectura, en un solo bucle
+        sin una llamada a función por valor.
+        
+        Args:
+            valores: Valores originales
+            factor_escala: Factor de escala
+            offset: Offset a aplicar
+            
+        Returns:
+            Lista de valores escalados, en el mismo orden
+        """
+        return [(valor * factor_escala) + offset for valor in valores]
+        
     @staticmethod
     def convertir_temperatura(valor: float, unidad_origen: str, unidad_destino: str) -> float:
         """
@@ -438,29 +635,17 @@ class ConvertidorBMS:
         Returns:
             Temperatura en unidad destino
         """
-        # Normalizar unidades
-        unidad_origen = unidad_origen.upper()
-        unidad_destino = unidad_destino.upper()
-        
-        # Si son iguales, no convertir
-        if unidad_origen == unidad_destino:
-            return valor
-            
-        # Convertir a Celsius como unidad intermedia
-        if unidad_origen == "F":
-            celsius = ConvertidorBMS.fahrenheit_a_celsius(valor)
-        elif unidad_origen == "K":
-            celsius = ConvertidorBMS.kelvin_a_celsius(valor)
-        else:  # "C"
-            celsius = valor
+        # Un solo factor afín por par de unidades; las desconocidas valen como Celsius
+        escala, desplazamiento = _CONVERSION_TEMPERATURA.get(
+            (unidad_origen.upper(), unidad_destino.upper()), (None, None)
+        )
+        if escala is None:
+            escala, desplazamiento = _factor_temperatura(unidad_origen, unidad_destino)
             
-        # Convertir de Celsius a unidad destino
-        if unidad_destino == "F":
-            return ConvertidorBMS.celsius_a_fahrenheit(celsius)
-        elif unidad_destino == "K":
-            return ConvertidorBMS.celsius_a_kelvin(celsius)
-        else:  # "C"
-            return celsius
+        # Misma unidad: devolver el valor sin operar
+        if escala == 1.0 and desplazamiento == 0.0:
+            return valor
+        return valor * escala + desplazamiento
             
     @staticmethod
     def convertir_presion(valor: float, unidad_origen: str, unidad_destino: str) -> float:
@@ -475,30 +660,56 @@ class ConvertidorBMS:
         Returns:
             Presión en unidad destino
         """
-        # Normalizar unidades
-        unidad_origen = unidad_origen.lower()
-        unidad_destino = unidad_destino.lower()
-        
-        # Si son iguales, no convertir
-        if unidad_origen == unidad_destino:
+        # Un solo factor por par de unidades; las desconocidas valen como Pascal
+        factor = _CONVERSION_PRESION.get((unidad_origen.lower(), unidad_destino.lower()))
+        if factor is None:
+            factor = _factor_presion(unidad_origen, unidad_destino)
+            
+        # Misma unidad: devolver el valor sin operar
+        if factor == 1.0:
             return valor
+        return valor * factor
             
-        # Convertir a Pascal como unidad intermedia
-        if unidad_origen == "mbar":
-            pascal = ConvertidorBMS.mbar_a_pascal(valor)
-        elif unidad_origen == "bar":
-            pascal = ConvertidorBMS.bar_a_pascal(valor)
-        else:  # "pa"
-            pascal = valor
+    @staticmethod
+    def convertir_temperaturas(valores: Sequence[float], unidad_origen: str, unidad_destino: str) -> List[float]:
+        """
+        Convertir un bloque de temperaturas entre unidades.
+        
+        El factor del par de unidades se resuelve una sola vez para todo el bloque.
+        
+        Args:
+            valores: Valores de temperatura
+            unidad_origen: Unidad origen ("C", "F", "K")
+            unidad_destino: Unidad destino ("C", "F", "K")
             
-        # Convertir de Pascal a unidad destino
-        if unidad_destino == "mbar":
-            return ConvertidorBMS.pascal_a_mbar(pascal)
-        elif unidad_destino == "bar":
-            return ConvertidorBMS.pascal_a_bar(pascal)
-        else:  # "pa"
-            return pascal
+        Returns:
+            Lista de temperaturas en unidad destino
+        """
+        escala, desplazamiento = _factor_temperatura(unidad_origen, unidad_destino)
+        if escala == 1.0 and desplazamiento == 0.0:
+            return list(valores)
+        return [valor * escala + desplazamiento for valor in valores]
+        
+    @staticmethod
+    def convertir_presiones(valores: Sequence[float], unidad_origen: str, unidad_destino: str) -> List[float]:
+        """
+        Convertir un bloque de presiones entre unidades.
+        
+        El factor del par de unidades se resuelve una sola vez para todo el bloque.
+        
+        Args:
+            valores: Valores de presión
+            unidad_origen: Unidad origen ("Pa", "mbar", "bar")
+            unidad_destino: Unidad destino ("Pa", "mbar", "bar")
             
+        Returns:
+            Lista de presiones en unidad destino
+        """
+        factor = _factor_presion(unidad_origen, unidad_destino)
+        if factor == 1.0:
+            return list(valores)
+        return [valor * factor for valor in valores]
+        
     @staticmethod
     def normalizar_mac_address(mac: str, separador: str = ":") -> str:
         """
@@ -518,64 +729,69 @@ class ConvertidorBMS:
         if len(mac_limpia) != 12:
             raise ValueError(f"MAC address inválida: {mac}")
             
-        # Agregar separadores cada 2 caracteres
+        # Agregar separadores cada 2 caracteres (cortes fijos, sin generador)
         if separador:
-            mac_formateada = separador.join(mac_limpia[i:i+2] for i in range(0, 12, 2))
+            mac_formateada = separador.join((
+                mac_limpia[0:2], mac_limpia[2:4], mac_limpia[4:6],
+                mac_limpia[6:8], mac_limpia[8:10], mac_limpia[10:12]
+            ))
         else:
             mac_formateada = mac_limpia
             
         return mac_formateada
         
     @staticmethod
-    def datos_genetec_a_bms(datos_genetec: Dict[str, Any]) -> Dict[str, Any]:
+    def datos_genetec_a_bms(datos_genetec: Dict[str, Any], timestamp_conversion: datetime = None) -> Dict[str, Any]:
         """
         Convertir datos del formato Genetec al formato BMS interno.
         
         Args:
             datos_genetec: Datos en formato Genetec
+            timestamp_conversion: Marca de tiempo a registrar (por defecto, ahora)
             
         Returns:
             Datos en formato BMS
         """
         datos_bms = {}
         
-        # Mapear campos comunes
-        mapeo_campos = {
-            "name": "nombre",
-            "ip_address": "direccion_ip",
-            "port": "puerto",
-            "type": "tipo",
-            "status": "estado",
-            "location": "ubicacion_fisica",
-            "zone": "zona",
-            "manufacturer": "marca",
-            "model": "modelo",
-            "serial_number": "numero_serie",
-            "mac_address": "direccion_mac"
-        }
-        
-        for campo_genetec, campo_bms in mapeo_campos.items():
+        # Recorrer la tabla de campos precalculada: sin comparaciones por campo
+        for campo_genetec, campo_bms, conversion in _CAMPOS_GENETEC:
             if campo_genetec in datos_genetec:
                 valor = datos_genetec[campo_genetec]
-                
-                # Aplicar conversiones específicas
-                if campo_bms == "tipo":
-                    valor = ConvertidorBMS.normalizar_tipo_dispositivo(valor)
-                elif campo_bms == "estado":
-                    valor = ConvertidorBMS.normalizar_estado_dispositivo(valor)
-                elif campo_bms == "direccion_mac" and valor:
-                    try:
-                        valor = ConvertidorBMS.normalizar_mac_address(valor)
-                    except ValueError:
-                        valor = None
-                        
-                datos_bms[campo_bms] = valor
+                datos_bms[campo_bms] = conversion(valor) if conversion is not None else valor
                 
         # Agregar timestamp de conversión
-        datos_bms["timestamp_conversion"] = datetime.now()
+        datos_bms["timestamp_conversion"] = timestamp_conversion or datetime.now()
         
         return datos_bms
         
+    @staticmethod
+    def datos_genetec_a_bms_lote(lista_genetec: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Convertir un lote de dispositivos Genetec al formato BMS.
+        
+        Todos los registros del lote comparten el mismo timestamp de conversión.
+        
+        Args:
+            lista_genetec: Lista de datos en formato Genetec
+            
+        Returns:
+            Lista de datos en formato BMS, en el mismo orden
+        """
+        ahora = datetime.now()
+        convertir = ConvertidorBMS.datos_genetec_a_bms
+        return [convertir(datos, ahora) for datos in lista_genetec]
+        
+    @staticmethod
+    def _normalizar_mac_genetec(mac: Optional[str]) -> Optional[str]:
+        """Normalizar la MAC de un registro Genetec; None si no es válida."""
+        if not mac:
+            return mac
+        try:
+            return ConvertidorBMS.normalizar_mac_address(mac)
+        except ValueError:
+            return None
+        
     @staticmethod
     def formatear_numero(numero: Union[int, float], decimales: int = 2) -> str:
         """
@@ -591,7 +807,31 @@ class ConvertidorBMS:
         if isinstance(numero, int) and decimales == 0:
             return str(numero)
         else:
-            return f"{numero:.{decimales}f}"
+            return format(numero, _FORMATOS_DECIMALES.get(decimales) or f'.{decimales}f')
+
+# Codificadores de diccionario_a_json (json.dumps crea uno nuevo en cada llamada).
+# La salida siempre la genera json estándar con ensure_ascii=False: el texto en
+# español (°C, ñ) queda legible y orjson, que solo se usa al decodificar, no
+# interviene en el formato
+_CODIFICADOR_JSON = json.JSONEncoder(ensure_ascii=False, default=ConvertidorBMS._json_serializer)
+_CODIFICADOR_JSON_INDENTADO = json.JSONEncoder(
+    ensure_ascii=False, indent=2, default=ConvertidorBMS._json_serializer
+)
+
+# Campos Genetec -> BMS con la conversión a aplicar a cada uno (None: se copia tal cual)
+_CAMPOS_GENETEC = (
+    ("name", "nombre", None),
+    ("ip_address", "direccion_ip", None),
+    ("port", "puerto", None),
+    ("type", "tipo", ConvertidorBMS.normalizar_tipo_dispositivo),
+    ("status", "estado", ConvertidorBMS.normalizar_estado_dispositivo),
+    ("location", "ubicacion_fisica", None),
+    ("zone", "zona", None),
+    ("manufacturer", "marca", None),
+    ("model", "modelo", None),
+    ("serial_number", "numero_serie", None),
+    ("mac_address", "direccion_mac", ConvertidorBMS._normalizar_mac_genetec),
+)
 
 # Funciones de conveniencia
 def convertir_temp_modbus_a_celsius(registro_modbus: int) -> float:
@@ -642,6 +882,58 @@ def convertir_presion_modbus_a_mbar(registro_modbus: int) -> float:
     """
     return registro_modbus / 10.0
 
+# Versiones por bloque para un buffer completo de registros leídos en un sondeo.
+# Mantienen la división por 10.0 (no el producto por 0.1) para devolver
+# exactamente los mismos valores que las funciones individuales.
+
+def convertir_temperaturas_modbus_a_celsius(registros_modbus: Sequence[int]) -> List[float]:
+    """
+    Convertir un bloque de registros Modbus (temperatura x10) a Celsius.
+    
+    Args:
+        registros_modbus: Valores de los registros Modbus
+        
+    Returns:
+        Lista de temperaturas en Celsius
+    """
+    return [registro / 10.0 for registro in registros_modbus]
+
+def convertir_celsius_a_temperaturas_modbus(temperaturas_celsius: Sequence[float]) -> List[int]:
+    """
+    Convertir un bloque de temperaturas Celsius a registros Modbus (x10).
+    
+    Args:
+        temperaturas_celsius: Temperaturas en Celsius
+        
+    Returns:
+        Lista de valores para registros Modbus
+    """
+    return [int(temperatura * 10) for temperatura in temperaturas_celsius]
+
+def convertir_humedades_modbus_a_porcentaje(registros_modbus: Sequence[int]) -> List[float]:
+    """
+    Convertir un bloque de registros Modbus de humedad a porcentaje.
+    
+    Args:
+        registros_modbus: Valores de los registros Modbus
+        
+    Returns:
+        Lista de humedades en porcentaje
+    """
+    return list(map(float, registros_modbus))
+
+def convertir_presiones_modbus_a_mbar(registros_modbus: Sequence[int]) -> List[float]:
+    """
+    Convertir un bloque de registros Modbus (presión x10) a mbar.
+    
+    Args:
+        registros_modbus: Valores de los registros Modbus
+        
+    Returns:
+        Lista de presiones en mbar
+    """
+    return [registro / 10.0 for registro in registros_modbus]
+
 if __name__ == "__main__":
     # Prueba del convertidor
     print("Probando convertidor BMS...")
@@ -9,18 +9,184 @@ Autor: Sistema BMS Demo
 Versión: 1.0.0
 """
 
+import atexit
 import logging
 import logging.handlers
-from pathlib import Path
+import queue
+import threading
+import time
+import traceback
 from datetime import datetime
-from typing import Optional
-import colorlog
+from typing import Dict, List, Optional
 import sys
 import os
 
 # Importar configuración
 from configuracion.configuracion_general import obtener_config
 
+# Registros acumulados en memoria antes de escribir en archivo (ERROR o
+# superior se escribe al momento) y periodo máximo de retención en segundos
+CAPACIDAD_BUFFER_LOGS = 512
+INTERVALO_VACIADO_LOGS = 1.0
+
+# Buffer de escritura de los archivos de log (bytes)
+TAMAÑO_BUFFER_ARCHIVO_LOGS = 65536
+
+# Niveles de logging por nombre (en mayúsculas)
+_NIVELES_LOGGING = {
+    nombre: getattr(logging, nombre)
+    for nombre in ("NOTSET", "DEBUG", "INFO", "WARN", "WARNING", "ERROR", "FATAL", "CRITICAL")
+}
+
+class ManejadorArchivoRotativo(logging.handlers.RotatingFileHandler):
+    """
+    RotatingFileHandler que lleva la cuenta del tamaño escrito.
+    
+    La decisión de rotar usa un contador en memoria en lugar de consultar
+    la posición y el estado del archivo en cada registro, y cada mensaje
+    se formatea una sola vez. El archivo se abre con un buffer de
+    TAMAÑO_BUFFER_ARCHIVO_LOGS bytes y solo se vacía en cada registro de
+    nivel ERROR o superior; el resto lo vacía GestorLogs periódicamente.
+    """
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        try:
+            self._tamaño_actual = os.path.getsize(self.baseFilename)
+        except OSError:
+            self._tamaño_actual = 0
+            
+    def _open(self):
+        return open(self.baseFilename, self.mode, encoding=self.encoding,
+                    errors=self.errors, buffering=TAMAÑO_BUFFER_ARCHIVO_LOGS)
+        
+    def emit(self, record: logging.LogRecord):
+        try:
+            mensaje = self.format(record) + self.terminator
+            if mensaje.isascii():
+                tamaño_mensaje = len(mensaje)
+            else:
+                tamaño_mensaje = len(mensaje.encode(self.encoding or 'utf-8', errors='replace'))
+            if (self.maxBytes > 0 and self._tamaño_actual
+                    and self._tamaño_actual + tamaño_mensaje >= self.maxBytes):
+                self.doRollover()
+                self._tamaño_actual = 0
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(mensaje)
+            if record.levelno >= logging.ERROR:
+                self.flush()
+            self._tamaño_actual += tamaño_mensaje
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+            
+    def handleError(self, record: logging.LogRecord):
+        # Con el intérprete finalizando puede no quedar ni open(): descartar en silencio
+        if sys.meta_path is not None:
+            super().handleError(record)
+
+class FormateadorHoraCacheada(logging.Formatter):
+    """
+    Formatter que reutiliza la hora formateada dentro del mismo segundo.
+    
+    Con datefmt (resolución de segundos) la hora solo se vuelve a formatear
+    cuando cambia el segundo del registro.
+    """
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._hora_cacheada = (None, "")
+        
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        if not datefmt:
+            return super().formatTime(record, datefmt)
+        segundo = int(record.created)
+        segundo_cacheado, hora = self._hora_cacheada
+        if segundo != segundo_cacheado:
+            hora = time.strftime(datefmt, self.converter(segundo))
+            self._hora_cacheada = (segundo, hora)
+        return hora
+
+class FormateadorColor(FormateadorHoraCacheada):
+    """
+    Formateador de consola con el color ANSI de cada nivel.
+    
+    Los códigos de color están precalculados por nivel: cada registro solo
+    añade el prefijo y el reset al texto ya formateado.
+    """
+    
+    COLORES_NIVEL = {
+        logging.DEBUG: '\x1b[36m',             # cian
+        logging.INFO: '\x1b[32m',              # verde
+        logging.WARNING: '\x1b[33m',           # amarillo
+        logging.ERROR: '\x1b[31m',             # rojo
+        logging.CRITICAL: '\x1b[31m\x1b[47m',  # rojo sobre blanco
+    }
+    RESET = '\x1b[0m'
+    
+    def format(self, record: logging.LogRecord) -> str:
+        return self.COLORES_NIVEL.get(record.levelno, '') + super().format(record) + self.RESET
+
+class _ManejadorCola(logging.handlers.QueueHandler):
+    """
+    QueueHandler que marca cada registro con el logger dueño del handler.
+    
+    Un registro de un logger hijo que se propaga hasta un logger configurado
+    llega aquí con el nombre del hijo; la marca permite entregarlo a los
+    handlers reales del logger configurado. Con el hilo de escritura ya
+    detenido (salida del programa) el registro se entrega en el momento.
+    """
+    
+    def __init__(self, cola: queue.SimpleQueue, enrutador: "_EnrutadorLogs", nombre_logger: str):
+        super().__init__(cola)
+        self.enrutador = enrutador
+        self.nombre_logger = nombre_logger
+        
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # prepare() devuelve una copia, así que marcarla no afecta a otros handlers
+        record = super().prepare(record)
+        record.logger_destino = self.nombre_logger
+        return record
+        
+    def emit(self, record: logging.LogRecord):
+        if self.enrutador.sincrono:
+            self.enrutador.entregar(record, self.nombre_logger)
+        else:
+            super().emit(record)
+
+class _EnrutadorLogs(logging.Handler):
+    """
+    Handler del hilo de escritura: entrega cada registro encolado a los
+    handlers de archivo del logger configurado que lo encoló.
+    """
+    
+    def __init__(self):
+        super().__init__()
+        self.handlers_por_logger: Dict[str, List[logging.Handler]] = {}
+        # True una vez detenido el hilo de escritura
+        self.sincrono = False
+        
+    def entregar(self, record: logging.LogRecord, nombre_logger: Optional[str]):
+        """Pasar el registro a los handlers reales del logger indicado."""
+        if nombre_logger is None:
+            # Marca de vaciado de GestorLogs.vaciar_cola()
+            record.entregado.set()
+            return
+        for handler in self.handlers_por_logger.get(nombre_logger, ()):
+            if record.levelno >= handler.level:
+                handler.handle(record)
+                if self.sincrono:
+                    handler.flush()
+                
+    def handle(self, record: logging.LogRecord) -> bool:
+        self.entregar(record, record.logger_destino)
+        return True
+        
+    def emit(self, record: logging.LogRecord):
+        self.handle(record)
+
 class GestorLogs:
     """
     Gestor centralizado de logs para el sistema BMS.
@@ -31,6 +197,22 @@ class GestorLogs:
         """Inicializar gestor de logs."""
         self.config = obtener_config()
         self.loggers = {}
+        # Serializa la creación y eliminación de loggers entre hilos
+        self._lock_loggers = threading.RLock()
+        self._nivel_por_defecto = _NIVELES_LOGGING.get(self.config.LOG_NIVEL.upper(), logging.INFO)
+        
+        # Los loggers encolan los registros de archivo; un único hilo los escribe
+        self._cola_logs = queue.SimpleQueue()
+        self._enrutador = _EnrutadorLogs()
+        self._listener = logging.handlers.QueueListener(self._cola_logs, self._enrutador)
+        
+        # Buffers de escritura a archivo y su vaciado periódico
+        self._buffers_archivo: Dict[str, logging.handlers.MemoryHandler] = {}
+        self._evento_parada = threading.Event()
+        self._hilo_vaciado = threading.Thread(
+            target=self._vaciar_buffers_periodicamente, name="vaciado_logs", daemon=True
+        )
+        
         self._configurar_logging_base()
         
     def _configurar_logging_base(self):
@@ -38,87 +220,175 @@ class GestorLogs:
         
         # Crear directorio de logs si no existe
         self.config.RUTA_LOGS.mkdir(parents=True, exist_ok=True)
+        self._ruta_logs = str(self.config.RUTA_LOGS)
         
         # Configurar nivel de logging global
-        nivel_logging = getattr(logging, self.config.LOG_NIVEL.upper(), logging.INFO)
-        logging.basicConfig(level=nivel_logging)
+        logging.basicConfig(level=self._nivel_por_defecto)
         
         # Deshabilitar logs de librerías externas muy verbosas
         logging.getLogger('urllib3').setLevel(logging.WARNING)
         logging.getLogger('requests').setLevel(logging.WARNING)
         logging.getLogger('pymodbus').setLevel(logging.WARNING)
         
+        # Arrancar el hilo de escritura y vaciar la cola al salir
+        self._listener.start()
+        self._listener_activo = True
+        self._hilo_vaciado.start()
+        atexit.register(self.detener)
+        
+    def _vaciar_buffers_periodicamente(self):
+        """Escribir los buffers de archivo cada INTERVALO_VACIADO_LOGS segundos."""
+        while not self._evento_parada.wait(INTERVALO_VACIADO_LOGS):
+            try:
+                self.vaciar_buffers()
+            except Exception:
+                # Un fallo puntual no debe detener el vaciado; sin logger para no reentrar
+                traceback.print_exc(file=sys.stderr)
+            
+    def vaciar_buffers(self):
+        """Escribir en archivo los registros acumulados en memoria."""
+        for buffer in tuple(self._buffers_archivo.values()):
+            buffer.flush()
+            buffer.target.flush()
+            
+    def vaciar_cola(self, timeout: Optional[float] = 5.0) -> bool:
+        """
+        Esperar a que el hilo de escritura entregue los registros ya encolados.
+        
+        Args:
+            timeout: Segundos máximos de espera (None para esperar sin límite)
+            
+        Returns:
+            True si la cola quedó vaciada
+        """
+        if not self._listener_activo:
+            return True
+        marca = logging.makeLogRecord({'logger_destino': None})
+        marca.entregado = threading.Event()
+        self._cola_logs.put_nowait(marca)
+        return marca.entregado.wait(timeout)
+            
+    def detener(self):
+        """
+        Detener el hilo de escritura tras vaciar los registros pendientes.
+        
+        Los registros posteriores (p. ej. desde __del__ al cerrar el
+        programa) se entregan en el hilo que los emite.
+        """
+        if self._listener_activo:
+            self._listener_activo = False
+            self._enrutador.sincrono = True
+            self._listener.stop()
+            self._evento_parada.set()
+            self.vaciar_buffers()
+            
+            # logging.shutdown() cierra después los MemoryHandler: desde aquí
+            # los registros van directamente a los handlers de archivo
+            for handlers in self._enrutador.handlers_por_logger.values():
+                handlers[:] = [buffer.target for buffer in handlers]
+            
     def crear_logger(self, 
                     nombre: str, 
                     archivo_log: Optional[str] = None,
                     nivel: str = None,
-                    incluir_consola: bool = True) -> logging.Logger:
+                    incluir_consola: bool = True,
+                    incluir_origen: bool = True) -> logging.Logger:
         """
         Crear un logger específico para un módulo.
         
         Args:
             nombre: Nombre del logger
-            archivo_log: Nombre del archivo de log (opcional)
+            archivo_log: Nombre del archivo de log dentro de RUTA_LOGS, o ruta
+                absoluta (opcional)
             nivel: Nivel de logging (opcional)
             incluir_consola: Si incluir salida a consola
+            incluir_origen: Si registrar función y línea de origen en el archivo
             
         Returns:
             Logger configurado
         """
         
         # Si ya existe el logger, devolverlo
-        if nombre in self.loggers:
-            return self.loggers[nombre]
+        logger_existente = self.loggers.get(nombre)
+        if logger_existente is not None:
+            return logger_existente
             
+        with self._lock_loggers:
+            # Otro hilo pudo crearlo mientras se esperaba el lock
+            logger_existente = self.loggers.get(nombre)
+            if logger_existente is not None:
+                return logger_existente
+            return self._crear_logger(nombre, archivo_log, nivel, incluir_consola, incluir_origen)
+            
+    def _crear_logger(self, nombre: str, archivo_log: Optional[str], nivel: Optional[str],
+                      incluir_consola: bool, incluir_origen: bool) -> logging.Logger:
+        """Configurar un logger nuevo (llamar con _lock_loggers adquirido)."""
         # Crear nuevo logger
         logger = logging.getLogger(nombre)
         
         # Configurar nivel
-        nivel_log = nivel or self.config.LOG_NIVEL
-        nivel_logging = getattr(logging, nivel_log.upper(), logging.INFO)
+        if nivel:
+            nivel_logging = _NIVELES_LOGGING.get(nivel.upper(), logging.INFO)
+        else:
+            nivel_logging = self._nivel_por_defecto
         logger.setLevel(nivel_logging)
         
         # Limpiar handlers existentes
         logger.handlers.clear()
         
         # Configurar formateo
-        formato_archivo = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
-        
-        # Handler para archivo
-        if archivo_log:
-            ruta_archivo = self.config.RUTA_LOGS / archivo_log
+        if incluir_origen:
+            formato_archivo = FormateadorHoraCacheada(
+                '%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s',
+                datefmt='%Y-%m-%d %H:%M:%S'
+            )
         else:
-            ruta_archivo = self.config.RUTA_LOGS / f"{nombre.replace('.', '_')}.log"
+            formato_archivo = FormateadorHoraCacheada(
+                '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+                datefmt='%Y-%m-%d %H:%M:%S'
+            )
+        
+        # Handler para archivo (uno por archivo, compartido entre loggers)
+        ruta_archivo = os.path.join(self._ruta_logs, archivo_log or f"{nombre.replace('.', '_')}.log")
             
-        handler_archivo = logging.handlers.RotatingFileHandler(
-            ruta_archivo,
-            maxBytes=10*1024*1024,  # 10MB
-            backupCount=5,
-            encoding='utf-8'
-        )
-        handler_archivo.setFormatter(formato_archivo)
-        handler_archivo.setLevel(nivel_logging)
-        logger.addHandler(handler_archivo)
+        buffer_archivo = self._buffers_archivo.get(ruta_archivo)
+        if buffer_archivo is None:
+            handler_archivo = ManejadorArchivoRotativo(
+                ruta_archivo,
+                maxBytes=10*1024*1024,  # 10MB
+                backupCount=5,
+                encoding='utf-8'
+            )
+            handler_archivo.setFormatter(formato_archivo)
+            handler_archivo.setLevel(nivel_logging)
+            
+            # Acumular registros y escribirlos por lotes
+            buffer_archivo = logging.handlers.MemoryHandler(
+                CAPACIDAD_BUFFER_LOGS,
+                flushLevel=logging.ERROR,
+                target=handler_archivo,
+                flushOnClose=True
+            )
+            buffer_archivo.setLevel(nivel_logging)
+            # Sustituir el diccionario en lugar de modificarlo: el hilo de vaciado lo recorre
+            self._buffers_archivo = {**self._buffers_archivo, ruta_archivo: buffer_archivo}
+        elif nivel_logging < buffer_archivo.level:
+            # Archivo ya abierto por otro logger: admitir también el nivel más detallado
+            buffer_archivo.setLevel(nivel_logging)
+        # El logger solo encola; el hilo de escritura entrega al buffer de archivo
+        self._enrutador.handlers_por_logger[nombre] = [buffer_archivo]
+        logger.addHandler(_ManejadorCola(self._cola_logs, self._enrutador, nombre))
         
-        # Handler para consola (con colores si está disponible)
+        # Handler para consola (con colores si es una terminal). Escribe en el
+        # momento para conservar el orden respecto a print()
         if incluir_consola:
-            if colorlog and sys.stdout.isatty():
-                formato_consola = colorlog.ColoredFormatter(
-                    '%(log_color)s%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-                    datefmt='%H:%M:%S',
-                    log_colors={
-                        'DEBUG': 'cyan',
-                        'INFO': 'green',
-                        'WARNING': 'yellow',
-                        'ERROR': 'red',
-                        'CRITICAL': 'red,bg_white',
-                    }
+            if sys.stdout.isatty():
+                formato_consola = FormateadorColor(
+                    '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+                    datefmt='%H:%M:%S'
                 )
             else:
-                formato_consola = logging.Formatter(
+                formato_consola = FormateadorHoraCacheada(
                     '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
                     datefmt='%H:%M:%S'
                 )
@@ -146,9 +416,39 @@ class GestorLogs:
         Returns:
             Logger configurado
         """
-        if nombre not in self.loggers:
+        logger = self.loggers.get(nombre)
+        if logger is None:
             return self.crear_logger(nombre)
-        return self.loggers[nombre]
+        return logger
+        
+    def eliminar_logger(self, nombre: str):
+        """
+        Quitar un logger creado con crear_logger.
+        
+        Entrega antes sus registros pendientes y cierra su archivo si ningún
+        otro logger lo usa.
+        
+        Args:
+            nombre: Nombre del logger
+        """
+        with self._lock_loggers:
+            logger = self.loggers.pop(nombre, None)
+            if logger is None:
+                return
+            self.vaciar_cola()
+            logger.handlers.clear()
+            logger.propagate = True
+            for buffer in self._enrutador.handlers_por_logger.pop(nombre, ()):
+                if any(buffer in handlers for handlers in self._enrutador.handlers_por_logger.values()):
+                    continue
+                # Sustituir el diccionario en lugar de modificarlo: el hilo de vaciado lo recorre
+                self._buffers_archivo = {
+                    ruta: otro for ruta, otro in self._buffers_archivo.items() if otro is not buffer
+                }
+                objetivo = getattr(buffer, 'target', None)
+                buffer.close()
+                if objetivo is not None:
+                    objetivo.close()
         
     def crear_logger_protocolo(self, protocolo: str) -> logging.Logger:
         """
@@ -166,7 +466,8 @@ class GestorLogs:
         return self.crear_logger(
             nombre=nombre_logger,
             archivo_log=archivo_log,
-            incluir_consola=True
+            incluir_consola=True,
+            incluir_origen=False
         )
         
     def crear_logger_servicio(self, servicio: str) -> logging.Logger:
@@ -185,7 +486,8 @@ class GestorLogs:
         return self.crear_logger(
             nombre=nombre_logger,
             archivo_log=archivo_log,
-            incluir_consola=True
+            incluir_consola=True,
+            incluir_origen=False
         )
         
     def crear_logger_sistema(self) -> logging.Logger:
@@ -210,15 +512,26 @@ class GestorLogs:
         """
         try:
             from datetime import timedelta
-            fecha_limite = datetime.now() - timedelta(days=dias_retencion)
+            limite = (datetime.now() - timedelta(days=dias_retencion)).timestamp()
+            eliminados = []
             
-            for archivo in self.config.RUTA_LOGS.glob("*.log*"):
-                if archivo.stat().st_mtime < fecha_limite.timestamp():
-                    archivo.unlink()
-                    print(f"Eliminado log antiguo: {archivo.name}")
+            # scandir reutiliza los datos del directorio: un stat por archivo
+            with os.scandir(self.config.RUTA_LOGS) as entradas:
+                for entrada in entradas:
+                    if ".log" not in entrada.name or not entrada.is_file():
+                        continue
+                    if entrada.stat().st_mtime < limite:
+                        os.unlink(entrada.path)
+                        eliminados.append(entrada.name)
+                        
+            # Un único registro resumen en lugar de una línea por archivo
+            if eliminados:
+                self.crear_logger_sistema().info(
+                    "Eliminados %d logs antiguos: %s", len(eliminados), ", ".join(eliminados)
+                )
                     
-        except Exception as e:
-            print(f"Error limpiando logs antiguos: {e}")
+        except Exception:
+            self.crear_logger_sistema().exception("Error limpiando logs antiguos")
             
     def obtener_estadisticas_logs(self) -> dict:
         """
@@ -234,18 +547,21 @@ class GestorLogs:
         }
         
         try:
-            for archivo in self.config.RUTA_LOGS.glob("*.log*"):
-                info_archivo = archivo.stat()
-                estadisticas['archivos'].append({
-                    'nombre': archivo.name,
-                    'tamaño': info_archivo.st_size,
-                    'modificado': datetime.fromtimestamp(info_archivo.st_mtime)
-                })
-                estadisticas['total_archivos'] += 1
-                estadisticas['tamaño_total'] += info_archivo.st_size
+            with os.scandir(self.config.RUTA_LOGS) as entradas:
+                for entrada in entradas:
+                    if ".log" not in entrada.name or not entrada.is_file():
+                        continue
+                    info_archivo = entrada.stat()
+                    estadisticas['archivos'].append({
+                        'nombre': entrada.name,
+                        'tamaño': info_archivo.st_size,
+                        'modificado': datetime.fromtimestamp(info_archivo.st_mtime)
+                    })
+                    estadisticas['total_archivos'] += 1
+                    estadisticas['tamaño_total'] += info_archivo.st_size
                 
-        except Exception as e:
-            print(f"Error obteniendo estadísticas de logs: {e}")
+        except Exception:
+            self.crear_logger_sistema().exception("Error obteniendo estadísticas de logs")
             
         return estadisticas
         
@@ -256,15 +572,36 @@ class GestorLogs:
         Args:
             nivel: Nuevo nivel de logging
         """
-        nivel_logging = getattr(logging, nivel.upper(), logging.INFO)
+        nivel_logging = _NIVELES_LOGGING.get(nivel.upper(), logging.INFO)
         
         for logger in self.loggers.values():
             logger.setLevel(nivel_logging)
             for handler in logger.handlers:
                 handler.setLevel(nivel_logging)
+        for handlers_reales in self._enrutador.handlers_por_logger.values():
+            for handler in handlers_reales:
+                handler.setLevel(nivel_logging)
                 
         print(f"Nivel de logging cambiado a: {nivel.upper()}")
 
+class _LoggerDiferido:
+    """
+    Logger que se crea en su primer uso.
+    
+    Los loggers predefinidos no abren su archivo al importar el módulo:
+    el primer acceso a un atributo crea el logger real y delega en él.
+    """
+    
+    def __init__(self, fabrica, *args):
+        self._fabrica = fabrica
+        self._args = args
+        self._logger: Optional[logging.Logger] = None
+        
+    def __getattr__(self, nombre: str):
+        if self._logger is None:
+            self._logger = self._fabrica(*self._args)
+        return getattr(self._logger, nombre)
+
 # Instancia global del gestor de logs
 gestor_logs = GestorLogs()
 
@@ -298,12 +635,12 @@ def obtener_estadisticas_logs() -> dict:
     return gestor_logs.obtener_estadisticas_logs()
 
 # Loggers predefinidos para uso común
-logger_sistema = obtener_logger_sistema()
-logger_modbus = obtener_logger_protocolo("modbus")
-logger_mqtt = obtener_logger_protocolo("mqtt")
-logger_bacnet = obtener_logger_protocolo("bacnet")
-logger_snmp = obtener_logger_protocolo("snmp")
-logger_http = obtener_logger_protocolo("http")
+logger_sistema = _LoggerDiferido(obtener_logger_sistema)
+logger_modbus = _LoggerDiferido(obtener_logger_protocolo, "modbus")
+logger_mqtt = _LoggerDiferido(obtener_logger_protocolo, "mqtt")
+logger_bacnet = _LoggerDiferido(obtener_logger_protocolo, "bacnet")
+logger_snmp = _LoggerDiferido(obtener_logger_protocolo, "snmp")
+logger_http = _LoggerDiferido(obtener_logger_protocolo, "http")
 
 if __name__ == "__main__":
     # Prueba del sistema de logging
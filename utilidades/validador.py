@@ -10,17 +10,48 @@ Versión: 1.0.0
 """
 
 import re
-import ipaddress
-from typing import Any, List, Dict, Union, Tuple, Optional
+from functools import lru_cache
+from typing import Any, List, Dict, Union, Tuple, Optional, Sequence, Iterator
 from datetime import datetime, date
 from enum import Enum
 
 # Importar constantes
 from utilidades.constantes import (
-    LimitesRed, RangosSensores, PatronesValidacion,
-    MAPEO_TIPOS_DISPOSITIVO, MAPEO_ESTADOS_DISPOSITIVO
+    LimitesRed, PatronesValidacion,
+    MAPEO_TIPOS_DISPOSITIVO, MAPEO_ESTADOS_DISPOSITIVO,
+    RANGOS_POR_TIPO_SENSOR
 )
 
+# Límites de red resueltos una sola vez para los validadores numéricos
+_PUERTO_MINIMO = LimitesRed.PUERTO_MINIMO
+_PUERTO_MAXIMO = LimitesRed.PUERTO_MAXIMO
+_TIMEOUT_MINIMO = LimitesRed.TIMEOUT_MINIMO
+_TIMEOUT_MAXIMO = LimitesRed.TIMEOUT_MAXIMO
+_INTERVALO_POLLING_MINIMO = LimitesRed.INTERVALO_POLLING_MINIMO
+_INTERVALO_POLLING_MAXIMO = LimitesRed.INTERVALO_POLLING_MAXIMO
+
+# Tipos de dispositivo aceptados, tanto en nomenclatura externa como interna
+_TIPOS_VALIDOS = frozenset(MAPEO_TIPOS_DISPOSITIVO.values()) | frozenset(MAPEO_TIPOS_DISPOSITIVO)
+
+# Rangos IPv4 especiales como (red, máscara) sobre la dirección empaquetada en
+# un entero de 32 bits; equivalen a los de ipaddress.IPv4Address
+_RED_IP_MULTICAST = (0xE0000000, 0xF0000000)  # 224.0.0.0/4
+_RED_IP_LOOPBACK = (0x7F000000, 0xFF000000)   # 127.0.0.0/8
+_RED_IP_RESERVADA = (0xF0000000, 0xF0000000)  # 240.0.0.0/4
+
+# Formatos de fecha aceptados, en orden de prueba
+_FORMATOS_FECHA = (
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%d",
+    "%d/%m/%Y",
+    "%d-%m-%Y",
+    "%Y/%m/%d"
+)
+
+# Patrones propios del validador, compilados al importar
+_PATRON_NUMERO_SERIE = re.compile(r"^[A-Z0-9\-\s]+$")
+_PATRON_NOMBRE_DISPOSITIVO = re.compile(r"^[A-Za-z0-9\s\-_]+$")
+
 class TipoValidacion(Enum):
     """Tipos de validación disponibles."""
     IP_ADDRESS = "ip_address"
@@ -37,19 +68,39 @@ class TipoValidacion(Enum):
 class ResultadoValidacion:
     """Resultado de una validación."""
     
-    def __init__(self, es_valido: bool, mensaje: str = "", codigo_error: str = ""):
+    __slots__ = ("es_valido", "_mensaje", "_argumentos", "codigo_error")
+    
+    def __init__(self, es_valido: bool, mensaje: str = "", codigo_error: str = "",
+                 argumentos: Tuple = ()):
         """
         Inicializar resultado de validación.
         
         Args:
             es_valido: Si la validación fue exitosa
-            mensaje: Mensaje descriptivo del resultado
+            mensaje: Mensaje descriptivo del resultado, o plantilla %-style
+                si se indican argumentos
             codigo_error: Código de error específico
+            argumentos: Valores inmutables para la plantilla; el mensaje
+                solo se formatea cuando alguien lo lee
         """
         self.es_valido = es_valido
-        self.mensaje = mensaje
+        self._mensaje = mensaje
+        self._argumentos = argumentos
         self.codigo_error = codigo_error
         
+    @property
+    def mensaje(self) -> str:
+        """Mensaje descriptivo, formateado en la primera lectura."""
+        if self._argumentos:
+            self._mensaje = self._mensaje % self._argumentos
+            self._argumentos = ()
+        return self._mensaje
+        
+    @mensaje.setter
+    def mensaje(self, mensaje: str):
+        self._mensaje = mensaje
+        self._argumentos = ()
+        
     def __bool__(self):
         """Permitir uso en contextos booleanos."""
         return self.es_valido
@@ -58,6 +109,122 @@ class ResultadoValidacion:
         """Representación string del resultado."""
         return f"{'✓' if self.es_valido else '✗'} {self.mensaje}"
 
+# Validaciones puras sobre cadenas: las configuraciones repiten las mismas IPs,
+# emails y MACs en cada recarga, así que el resultado se memoriza como tupla
+# (es_valido, mensaje, codigo_error) y cada llamada construye su propio
+# ResultadoValidacion.
+
+@lru_cache(maxsize=1024)
+def _validar_ip_address(ip: str) -> Tuple[bool, str, str]:
+    """Validar una IP v4 no vacía."""
+    octetos = ip.split(".")
+    if len(octetos) != 4:
+        return False, f"Formato de IP inválido: {ip}", "IP_FORMAT"
+        
+    # Empaquetar los cuatro octetos en un entero con las mismas reglas que
+    # ipaddress: 1-3 dígitos ASCII, sin ceros a la izquierda y como máximo 255
+    direccion = 0
+    for octeto in octetos:
+        if (not octeto or len(octeto) > 3 or not octeto.isascii()
+                or not octeto.isdigit() or (octeto[0] == "0" and len(octeto) > 1)):
+            return False, f"Formato de IP inválido: {ip}", "IP_FORMAT"
+        valor = int(octeto)
+        if valor > 255:
+            return False, f"Formato de IP inválido: {ip}", "IP_FORMAT"
+        direccion = (direccion << 8) | valor
+        
+    # Verificar que no sea dirección especial
+    if direccion & _RED_IP_MULTICAST[1] == _RED_IP_MULTICAST[0]:
+        return False, "IP multicast no permitida", "IP_MULTICAST"
+    if direccion & _RED_IP_LOOPBACK[1] == _RED_IP_LOOPBACK[0] and ip != "127.0.0.1":
+        return False, "IP loopback no permitida", "IP_LOOPBACK"
+    if direccion & _RED_IP_RESERVADA[1] == _RED_IP_RESERVADA[0]:
+        return False, "IP reservada no permitida", "IP_RESERVED"
+        
+    return True, f"IP válida: {ip}", ""
+        
+@lru_cache(maxsize=1024)
+def _validar_email(email: str) -> Tuple[bool, str, str]:
+    """Validar un email no vacío."""
+    if len(email) > 254:  # RFC 5321
+        return False, "Email demasiado largo", "EMAIL_LENGTH"
+        
+    if not PatronesValidacion.EMAIL.match(email):
+        return False, f"Formato de email inválido: {email}", "EMAIL_FORMAT"
+        
+    return True, f"Email válido: {email}", ""
+    
+@lru_cache(maxsize=1024)
+def _validar_mac_address(mac: str) -> Tuple[bool, str, str]:
+    """Validar una MAC no vacía."""
+    # Normalizar separadores
+    mac_normalizada = mac.replace("-", ":").upper()
+    
+    if not PatronesValidacion.MAC_ADDRESS.match(mac_normalizada):
+        return False, f"Formato de MAC inválido: {mac}", "MAC_FORMAT"
+        
+    return True, f"MAC válida: {mac_normalizada}", ""
+
+def _convertir_entero(valor: Any) -> Optional[int]:
+    """
+    Convertir un valor a entero con las mismas reglas que int().
+    
+    Los enteros y las cadenas de dígitos se resuelven sin pasar por
+    try/except, y las cadenas que int() rechazaría seguro no llegan a
+    lanzar ValueError.
+    
+    Args:
+        valor: Valor a convertir
+        
+    Returns:
+        Entero convertido o None si int() no lo acepta
+    """
+    if type(valor) is int:
+        return valor
+    if isinstance(valor, str):
+        if valor.isdecimal():
+            return int(valor)
+        texto = valor.strip()
+        if texto.isdecimal():
+            return int(texto)
+        # Sin signo ni separadores "_" solo quedan caracteres que int() rechaza
+        if "+" not in texto and "-" not in texto and "_" not in texto:
+            return None
+    try:
+        return int(valor)
+    except (ValueError, TypeError):
+        return None
+        
+def _validar_tipo_dispositivo(tipo: Any) -> ResultadoValidacion:
+    """Validar tipo de dispositivo en nomenclatura externa o interna."""
+    if not isinstance(tipo, str) or tipo not in _TIPOS_VALIDOS:
+        return ResultadoValidacion(False, f"Tipo de dispositivo inválido: {tipo}", "TYPE_INVALID")
+    return ResultadoValidacion(True, f"Tipo de dispositivo válido: {tipo}")
+    
+def _formato_fecha_probable(fecha: str) -> Optional[str]:
+    """
+    Deducir el formato de una fecha por su longitud y separadores.
+    
+    Args:
+        fecha: Fecha en texto
+        
+    Returns:
+        Formato candidato o None si no se puede clasificar
+    """
+    longitud = len(fecha)
+    if longitud == 19 and fecha[10] == " ":
+        return "%Y-%m-%d %H:%M:%S"
+    if longitud == 10:
+        if fecha[4] == "-":
+            return "%Y-%m-%d"
+        if fecha[4] == "/":
+            return "%Y/%m/%d"
+        if fecha[2] == "/":
+            return "%d/%m/%Y"
+        if fecha[2] == "-":
+            return "%d-%m-%Y"
+    return None
+
 class ValidadorBMS:
     """
     Clase principal de validación para el sistema BMS.
@@ -78,24 +245,7 @@ class ValidadorBMS:
         if not ip or not isinstance(ip, str):
             return ResultadoValidacion(False, "IP no puede estar vacía", "IP_EMPTY")
             
-        try:
-            # Usar ipaddress para validación robusta
-            ip_obj = ipaddress.IPv4Address(ip)
-            
-            # Verificar que no sea dirección especial
-            if ip_obj.is_multicast:
-                return ResultadoValidacion(False, "IP multicast no permitida", "IP_MULTICAST")
-            if ip_obj.is_loopback and ip != "127.0.0.1":
-                return ResultadoValidacion(False, "IP loopback no permitida", "IP_LOOPBACK")
-            if ip_obj.is_reserved:
-                return ResultadoValidacion(False, "IP reservada no permitida", "IP_RESERVED")
-                
-            return ResultadoValidacion(True, f"IP válida: {ip}")
-            
-        except ipaddress.AddressValueError:
-            return ResultadoValidacion(False, f"Formato de IP inválido: {ip}", "IP_FORMAT")
-        except Exception as e:
-            return ResultadoValidacion(False, f"Error validando IP: {str(e)}", "IP_ERROR")
+        return ResultadoValidacion(*_validar_ip_address(ip))
             
     @staticmethod
     def validar_puerto(puerto: Union[int, str]) -> ResultadoValidacion:
@@ -108,29 +258,27 @@ class ValidadorBMS:
         Returns:
             ResultadoValidacion con el resultado
         """
-        try:
-            puerto_int = int(puerto)
-            
-            if not (LimitesRed.PUERTO_MINIMO <= puerto_int <= LimitesRed.PUERTO_MAXIMO):
-                return ResultadoValidacion(
-                    False, 
-                    f"Puerto fuera de rango ({LimitesRed.PUERTO_MINIMO}-{LimitesRed.PUERTO_MAXIMO}): {puerto_int}",
-                    "PUERTO_RANGO"
-                )
-                
-            # Verificar puertos bien conocidos (opcional warning)
-            if puerto_int < 1024:
-                return ResultadoValidacion(
-                    True, 
-                    f"Puerto válido (privilegiado): {puerto_int}",
-                    "PUERTO_PRIVILEGIADO"
-                )
-                
-            return ResultadoValidacion(True, f"Puerto válido: {puerto_int}")
-            
-        except (ValueError, TypeError):
+        puerto_int = _convertir_entero(puerto)
+        if puerto_int is None:
             return ResultadoValidacion(False, f"Puerto debe ser numérico: {puerto}", "PUERTO_FORMAT")
             
+        if not (_PUERTO_MINIMO <= puerto_int <= _PUERTO_MAXIMO):
+            return ResultadoValidacion(
+                False, 
+                f"Puerto fuera de rango ({_PUERTO_MINIMO}-{_PUERTO_MAXIMO}): {puerto_int}",
+                "PUERTO_RANGO"
+            )
+            
+        # Verificar puertos bien conocidos (opcional warning)
+        if puerto_int < 1024:
+            return ResultadoValidacion(
+                True, 
+                f"Puerto válido (privilegiado): {puerto_int}",
+                "PUERTO_PRIVILEGIADO"
+            )
+            
+        return ResultadoValidacion(True, f"Puerto válido: {puerto_int}")
+            
     @staticmethod
     def validar_email(email: str) -> ResultadoValidacion:
         """
@@ -145,13 +293,7 @@ class ValidadorBMS:
         if not email or not isinstance(email, str):
             return ResultadoValidacion(False, "Email no puede estar vacío", "EMAIL_EMPTY")
             
-        if len(email) > 254:  # RFC 5321
-            return ResultadoValidacion(False, "Email demasiado largo", "EMAIL_LENGTH")
-            
-        if not re.match(PatronesValidacion.EMAIL, email):
-            return ResultadoValidacion(False, f"Formato de email inválido: {email}", "EMAIL_FORMAT")
-            
-        return ResultadoValidacion(True, f"Email válido: {email}")
+        return ResultadoValidacion(*_validar_email(email))
         
     @staticmethod
     def validar_mac_address(mac: str) -> ResultadoValidacion:
@@ -167,13 +309,7 @@ class ValidadorBMS:
         if not mac or not isinstance(mac, str):
             return ResultadoValidacion(False, "MAC no puede estar vacía", "MAC_EMPTY")
             
-        # Normalizar separadores
-        mac_normalizada = mac.replace("-", ":").upper()
-        
-        if not re.match(PatronesValidacion.MAC_ADDRESS, mac_normalizada):
-            return ResultadoValidacion(False, f"Formato de MAC inválido: {mac}", "MAC_FORMAT")
-            
-        return ResultadoValidacion(True, f"MAC válida: {mac_normalizada}")
+        return ResultadoValidacion(*_validar_mac_address(mac))
         
     @staticmethod
     def validar_numero_serie(numero_serie: str) -> ResultadoValidacion:
@@ -198,7 +334,7 @@ class ValidadorBMS:
             return ResultadoValidacion(False, "Número de serie muy largo (máximo 50 caracteres)", "SERIAL_LONG")
             
         # Permitir letras, números, guiones y espacios
-        if not re.match(r"^[A-Z0-9\-\s]+$", numero_serie):
+        if not _PATRON_NUMERO_SERIE.match(numero_serie):
             return ResultadoValidacion(False, "Número de serie contiene caracteres inválidos", "SERIAL_CHARS")
             
         return ResultadoValidacion(True, f"Número de serie válido: {numero_serie}")
@@ -220,20 +356,11 @@ class ValidadorBMS:
         except (ValueError, TypeError):
             return ResultadoValidacion(False, f"Valor debe ser numérico: {valor}", "SENSOR_VALUE_FORMAT")
             
-        # Definir rangos por tipo de sensor
-        rangos = {
-            "temperatura": (RangosSensores.TEMPERATURA_MIN, RangosSensores.TEMPERATURA_MAX),
-            "humedad": (RangosSensores.HUMEDAD_MIN, RangosSensores.HUMEDAD_MAX),
-            "presion": (RangosSensores.PRESION_MIN, RangosSensores.PRESION_MAX),
-            "luminosidad": (RangosSensores.LUMINOSIDAD_MIN, RangosSensores.LUMINOSIDAD_MAX),
-            "voltaje": (RangosSensores.VOLTAJE_MIN, RangosSensores.VOLTAJE_MAX),
-            "corriente": (RangosSensores.CORRIENTE_MIN, RangosSensores.CORRIENTE_MAX)
-        }
-        
-        if tipo_sensor.lower() not in rangos:
+        rango = RANGOS_POR_TIPO_SENSOR.get(tipo_sensor.lower())
+        if rango is None:
             return ResultadoValidacion(True, f"Tipo de sensor desconocido, no se valida rango: {tipo_sensor}")
             
-        min_val, max_val = rangos[tipo_sensor.lower()]
+        min_val, max_val = rango
         
         if not (min_val <= valor_float <= max_val):
             return ResultadoValidacion(
@@ -242,8 +369,38 @@ class ValidadorBMS:
                 "SENSOR_OUT_OF_RANGE"
             )
             
-        return ResultadoValidacion(True, f"Valor válido para {tipo_sensor}: {valor_float}")
+        return ResultadoValidacion(True, "Valor válido para %s: %s", argumentos=(tipo_sensor, valor_float))
         
+    @staticmethod
+    def validar_rango_sensor_lote(valores: Sequence[Union[int, float]], tipo_sensor: str) -> List[bool]:
+        """
+        Validar un lote de lecturas de un mismo tipo de sensor.
+        
+        Equivale a validar_rango_sensor(...).es_valido para cada valor, pero
+        resuelve el rango una sola vez y no construye mensajes por lectura.
+        
+        Args:
+            valores: Lecturas a validar
+            tipo_sensor: Tipo de sensor común a todas las lecturas
+            
+        Returns:
+            Lista de booleanos, uno por lectura
+        """
+        # Convertir primero, como validar_rango_sensor: una lectura no numérica
+        # es inválida aunque no se conozca el rango del tipo
+        try:
+            valores_float = list(map(float, valores))
+        except (ValueError, TypeError):
+            # Lote con lecturas no numéricas: resolver una a una
+            return [ValidadorBMS.validar_rango_sensor(valor, tipo_sensor).es_valido for valor in valores]
+            
+        rango = RANGOS_POR_TIPO_SENSOR.get(tipo_sensor.lower())
+        if rango is None:
+            return [True] * len(valores_float)
+            
+        min_val, max_val = rango
+        return [min_val <= valor <= max_val for valor in valores_float]
+            
     @staticmethod
     def validar_timeout(timeout: Union[int, float]) -> ResultadoValidacion:
         """
@@ -260,14 +417,14 @@ class ValidadorBMS:
         except (ValueError, TypeError):
             return ResultadoValidacion(False, f"Timeout debe ser numérico: {timeout}", "TIMEOUT_FORMAT")
             
-        if not (LimitesRed.TIMEOUT_MINIMO <= timeout_float <= LimitesRed.TIMEOUT_MAXIMO):
+        if not (_TIMEOUT_MINIMO <= timeout_float <= _TIMEOUT_MAXIMO):
             return ResultadoValidacion(
                 False,
-                f"Timeout fuera de rango ({LimitesRed.TIMEOUT_MINIMO}-{LimitesRed.TIMEOUT_MAXIMO}): {timeout_float}",
+                f"Timeout fuera de rango ({_TIMEOUT_MINIMO}-{_TIMEOUT_MAXIMO}): {timeout_float}",
                 "TIMEOUT_RANGE"
             )
             
-        return ResultadoValidacion(True, f"Timeout válido: {timeout_float}s")
+        return ResultadoValidacion(True, "Timeout válido: %ss", argumentos=(timeout_float,))
         
     @staticmethod
     def validar_intervalo_polling(intervalo: Union[int, float]) -> ResultadoValidacion:
@@ -285,14 +442,14 @@ class ValidadorBMS:
         except (ValueError, TypeError):
             return ResultadoValidacion(False, f"Intervalo debe ser numérico: {intervalo}", "INTERVAL_FORMAT")
             
-        if not (LimitesRed.INTERVALO_POLLING_MINIMO <= intervalo_float <= LimitesRed.INTERVALO_POLLING_MAXIMO):
+        if not (_INTERVALO_POLLING_MINIMO <= intervalo_float <= _INTERVALO_POLLING_MAXIMO):
             return ResultadoValidacion(
                 False,
-                f"Intervalo fuera de rango ({LimitesRed.INTERVALO_POLLING_MINIMO}-{LimitesRed.INTERVALO_POLLING_MAXIMO}): {intervalo_float}",
+                f"Intervalo fuera de rango ({_INTERVALO_POLLING_MINIMO}-{_INTERVALO_POLLING_MAXIMO}): {intervalo_float}",
                 "INTERVAL_RANGE"
             )
             
-        return ResultadoValidacion(True, f"Intervalo válido: {intervalo_float}s")
+        return ResultadoValidacion(True, "Intervalo válido: %ss", argumentos=(intervalo_float,))
         
     @staticmethod
     def validar_nombre_dispositivo(nombre: str) -> ResultadoValidacion:
@@ -317,7 +474,7 @@ class ValidadorBMS:
             return ResultadoValidacion(False, "Nombre muy largo (máximo 100 caracteres)", "NAME_LONG")
             
         # Permitir letras, números, espacios, guiones y guiones bajos
-        if not re.match(r"^[A-Za-z0-9\s\-_]+$", nombre):
+        if not _PATRON_NOMBRE_DISPOSITIVO.match(nombre):
             return ResultadoValidacion(False, "Nombre contiene caracteres inválidos", "NAME_CHARS")
             
         return ResultadoValidacion(True, f"Nombre válido: {nombre}")
@@ -337,22 +494,24 @@ class ValidadorBMS:
             return ResultadoValidacion(False, "Fecha no puede ser None", "DATE_NONE")
             
         if isinstance(fecha, (datetime, date)):
-            return ResultadoValidacion(True, f"Fecha válida: {fecha}")
+            return ResultadoValidacion(True, "Fecha válida: %s", argumentos=(fecha,))
             
         if isinstance(fecha, str):
+            # Probar primero el formato deducido para no lanzar una excepción
+            # por cada formato descartado
+            formato = _formato_fecha_probable(fecha)
+            if formato is not None:
+                try:
+                    fecha_parseada = datetime.strptime(fecha, formato)
+                    return ResultadoValidacion(True, "Fecha válida: %s", argumentos=(fecha_parseada,))
+                except ValueError:
+                    pass
+                    
             # Intentar parsear diferentes formatos
-            formatos = [
-                "%Y-%m-%d %H:%M:%S",
-                "%Y-%m-%d",
-                "%d/%m/%Y",
-                "%d-%m-%Y",
-                "%Y/%m/%d"
-            ]
-            
-            for formato in formatos:
+            for formato in _FORMATOS_FECHA:
                 try:
                     fecha_parseada = datetime.strptime(fecha, formato)
-                    return ResultadoValidacion(True, f"Fecha válida: {fecha_parseada}")
+                    return ResultadoValidacion(True, "Fecha válida: %s", argumentos=(fecha_parseada,))
                 except ValueError:
                     continue
                     
@@ -374,39 +533,17 @@ class ValidadorBMS:
         resultados = []
         
         # Validar campos requeridos
-        campos_requeridos = ["nombre", "tipo", "ip"]
-        for campo in campos_requeridos:
-            if campo not in config or not config[campo]:
+        for campo in _CAMPOS_REQUERIDOS_DISPOSITIVO:
+            if not config.get(campo):
                 resultados.append(ResultadoValidacion(False, f"Campo requerido faltante: {campo}", f"{campo.upper()}_REQUIRED"))
                 
-        # Validar IP si existe
-        if "ip" in config:
-            resultados.append(ValidadorBMS.validar_ip_address(config["ip"]))
-            
-        # Validar puerto si existe
-        if "puerto" in config:
-            resultados.append(ValidadorBMS.validar_puerto(config["puerto"]))
-            
-        # Validar nombre si existe
-        if "nombre" in config:
-            resultados.append(ValidadorBMS.validar_nombre_dispositivo(config["nombre"]))
-            
-        # Validar tipo de dispositivo
-        if "tipo" in config:
-            tipos_validos = list(MAPEO_TIPOS_DISPOSITIVO.values()) + list(MAPEO_TIPOS_DISPOSITIVO.keys())
-            if config["tipo"] not in tipos_validos:
-                resultados.append(ResultadoValidacion(False, f"Tipo de dispositivo inválido: {config['tipo']}", "TYPE_INVALID"))
-            else:
-                resultados.append(ResultadoValidacion(True, f"Tipo de dispositivo válido: {config['tipo']}"))
+        # Validar cada campo presente (aunque su valor sea None) con una sola
+        # consulta al diccionario
+        for campo, validador in _VALIDADORES_CONFIG_DISPOSITIVO:
+            valor = config.get(campo, _CAMPO_AUSENTE)
+            if valor is not _CAMPO_AUSENTE:
+                resultados.append(validador(valor))
                 
-        # Validar timeout si existe
-        if "timeout" in config:
-            resultados.append(ValidadorBMS.validar_timeout(config["timeout"]))
-            
-        # Validar intervalo de polling si existe
-        if "intervalo_polling" in config:
-            resultados.append(ValidadorBMS.validar_intervalo_polling(config["intervalo_polling"]))
-            
         return resultados
         
     @staticmethod
@@ -424,79 +561,119 @@ class ValidadorBMS:
         resultados = {}
         
         for campo, tipo_validacion in validaciones.items():
-            valor = datos.get(campo)
-            
-            if tipo_validacion == TipoValidacion.IP_ADDRESS:
-                resultados[campo] = ValidadorBMS.validar_ip_address(valor)
-            elif tipo_validacion == TipoValidacion.PUERTO:
-                resultados[campo] = ValidadorBMS.validar_puerto(valor)
-            elif tipo_validacion == TipoValidacion.EMAIL:
-                resultados[campo] = ValidadorBMS.validar_email(valor)
-            elif tipo_validacion == TipoValidacion.MAC_ADDRESS:
-                resultados[campo] = ValidadorBMS.validar_mac_address(valor)
-            elif tipo_validacion == TipoValidacion.NUMERO_SERIE:
-                resultados[campo] = ValidadorBMS.validar_numero_serie(valor)
-            elif tipo_validacion == TipoValidacion.FECHA:
-                resultados[campo] = ValidadorBMS.validar_fecha(valor)
+            validador = _VALIDADORES_POR_TIPO.get(tipo_validacion)
+            
+            if validador is not None:
+                resultados[campo] = validador(datos.get(campo))
             else:
                 resultados[campo] = ResultadoValidacion(False, f"Tipo de validación no soportado: {tipo_validacion}", "VALIDATION_TYPE")
                 
         return resultados
 
+# Configuración de dispositivo: campos obligatorios y validador de cada campo
+# opcional, en el orden en que se reportan los resultados
+_CAMPOS_REQUERIDOS_DISPOSITIVO = ("nombre", "tipo", "ip")
+_CAMPO_AUSENTE = object()
+_VALIDADORES_CONFIG_DISPOSITIVO = (
+    ("ip", ValidadorBMS.validar_ip_address),
+    ("puerto", ValidadorBMS.validar_puerto),
+    ("nombre", ValidadorBMS.validar_nombre_dispositivo),
+    ("tipo", _validar_tipo_dispositivo),
+    ("timeout", ValidadorBMS.validar_timeout),
+    ("intervalo_polling", ValidadorBMS.validar_intervalo_polling)
+)
+
+# Validador aplicado por validar_multiples_campos según el tipo de validación
+_VALIDADORES_POR_TIPO = {
+    TipoValidacion.IP_ADDRESS: ValidadorBMS.validar_ip_address,
+    TipoValidacion.PUERTO: ValidadorBMS.validar_puerto,
+    TipoValidacion.EMAIL: ValidadorBMS.validar_email,
+    TipoValidacion.MAC_ADDRESS: ValidadorBMS.validar_mac_address,
+    TipoValidacion.NUMERO_SERIE: ValidadorBMS.validar_numero_serie,
+    TipoValidacion.FECHA: ValidadorBMS.validar_fecha
+}
+
 # Funciones de conveniencia
 def es_ip_valida(ip: str) -> bool:
     """Verificar si una IP es válida (función de conveniencia)."""
-    return ValidadorBMS.validar_ip_address(ip).es_valido
+    # Consultar directamente la validación memorizada, sin construir resultado
+    return isinstance(ip, str) and bool(ip) and _validar_ip_address(ip)[0]
 
 def es_puerto_valido(puerto: Union[int, str]) -> bool:
     """Verificar si un puerto es válido (función de conveniencia)."""
-    return ValidadorBMS.validar_puerto(puerto).es_valido
+    puerto_int = _convertir_entero(puerto)
+    return puerto_int is not None and _PUERTO_MINIMO <= puerto_int <= _PUERTO_MAXIMO
 
 def es_email_valido(email: str) -> bool:
     """Verificar si un email es válido (función de conveniencia)."""
-    return ValidadorBMS.validar_email(email).es_valido
+    return isinstance(email, str) and bool(email) and _validar_email(email)[0]
 
-def validar_configuracion_modbus(config: Dict[str, Any]) -> List[str]:
+def _iterar_errores_modbus(config: Dict[str, Any]) -> Iterator[str]:
     """
-    Validar configuración específica de Modbus.
+    Generar los errores de una configuración Modbus a medida que se detectan.
     
     Args:
         config: Configuración de Modbus
         
-    Returns:
-        Lista de errores encontrados
+    Yields:
+        Mensaje de cada error encontrado
     """
-    errores = []
-    
     # Validar IP
     if "ip" in config:
         resultado = ValidadorBMS.validar_ip_address(config["ip"])
         if not resultado.es_valido:
-            errores.append(f"IP Modbus: {resultado.mensaje}")
+            yield f"IP Modbus: {resultado.mensaje}"
             
     # Validar puerto
     if "puerto" in config:
         resultado = ValidadorBMS.validar_puerto(config["puerto"])
         if not resultado.es_valido:
-            errores.append(f"Puerto Modbus: {resultado.mensaje}")
+            yield f"Puerto Modbus: {resultado.mensaje}"
             
     # Validar timeout
     if "timeout" in config:
         resultado = ValidadorBMS.validar_timeout(config["timeout"])
         if not resultado.es_valido:
-            errores.append(f"Timeout Modbus: {resultado.mensaje}")
+            yield f"Timeout Modbus: {resultado.mensaje}"
             
     # Validar ID esclavo
     if "id_esclavo" in config:
         id_esclavo = config["id_esclavo"]
-        try:
-            id_int = int(id_esclavo)
-            if not (1 <= id_int <= 247):
-                errores.append(f"ID esclavo Modbus fuera de rango (1-247): {id_int}")
-        except (ValueError, TypeError):
-            errores.append(f"ID esclavo Modbus debe ser numérico: {id_esclavo}")
+        id_int = _convertir_entero(id_esclavo)
+        if id_int is None:
+            yield f"ID esclavo Modbus debe ser numérico: {id_esclavo}"
+        elif not (1 <= id_int <= 247):
+            yield f"ID esclavo Modbus fuera de rango (1-247): {id_int}"
             
-    return errores
+def validar_configuracion_modbus(config: Dict[str, Any]) -> List[str]:
+    """
+    Validar configuración específica de Modbus.
+    
+    Args:
+        config: Configuración de Modbus
+        
+    Returns:
+        Lista de errores encontrados
+    """
+    return list(_iterar_errores_modbus(config))
+    
+def primer_error_modbus(config: Dict[str, Any]) -> Optional[str]:
+    """
+    Obtener solo el primer error de una configuración Modbus.
+    
+    Deja de validar en cuanto encuentra un error.
+    
+    Args:
+        config: Configuración de Modbus
+        
+    Returns:
+        Mensaje del primer error o None si la configuración es válida
+    """
+    return next(_iterar_errores_modbus(config), None)
+    
+def es_configuracion_modbus_valida(config: Dict[str, Any]) -> bool:
+    """Verificar si una configuración Modbus es válida (función de conveniencia)."""
+    return primer_error_modbus(config) is None
 
 if __name__ == "__main__":
     # Prueba del validador